@@ -0,0 +1,43 @@
+"""
+Benchmarks for the game.
+Each benchmark is a module that can be run on its own, e.g.: python -m benchmarks.masks
+The game runs without a window or sound device (SDL dummy drivers).
+"""
+
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+
+def start_level(level: int = 1):
+    """
+    Start the game and load a level without running the main loop.
+    :param level: level number
+    :return: game
+    """
+    from game import game
+    from game.timer import GameTimer
+
+    game.game_timer = GameTimer(game)
+    game.playing = True
+    game.delta_time = 1
+    game.level = level
+    for _ in game._Game__load_level(level):
+        pass  # run all loading steps at once
+    return game
+
+
+def measure(function, repeat: int) -> float:
+    """
+    Measure average time of a function call.
+    :param function: function without arguments
+    :param repeat: number of calls
+    :return: average time in microseconds
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
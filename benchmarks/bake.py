@@ -0,0 +1,41 @@
+"""
+Time to make all animation clips from the sprite sheets vs. loading them from the baked frames.
+Bake the frames first with: python -m game.bake
+Run with: python -m benchmarks.bake
+"""
+
+from . import measure
+
+import pygame as pg
+
+REPEAT = 5
+
+
+def main() -> None:
+    pg.display.init()
+    pg.display.set_mode((1, 1))
+
+    from game.assets import asset_cache
+    from game.bake import CLIPS
+    from game.spritesheet import SpriteSheet, BakedFrames
+
+    def live():
+        asset_cache.clear()  # decode the sprite sheets again
+        for filename, is_sprite, name, count, scale in CLIPS:
+            SpriteSheet(filename, is_sprite).make_frames(name, count, scale)
+
+    def baked():
+        frames = BakedFrames()  # map & validate the cache again
+        for filename, is_sprite, name, count, scale in CLIPS:
+            if frames.get_frames(filename, name, count, scale) is None:
+                raise SystemExit('Baked frames are missing or stale, run: python -m game.bake')
+
+    live_time = measure(live, REPEAT) / 1000
+    baked_time = measure(baked, REPEAT) / 1000
+    print(f'clips: {len(CLIPS)}')
+    print(f'sprite sheets: {live_time:8.1f} ms')
+    print(f'baked frames:  {baked_time:8.1f} ms ({live_time / baked_time:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
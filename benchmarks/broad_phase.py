@@ -0,0 +1,128 @@
+"""
+Broad phase scaling: hits of moving sprites (bullets -> zombies & saws, player -> zombies & items) found by
+testing every pair exactly (spritecollide() with collide_mask), by one Rect.collidelistall() per hitting sprite &
+group, and by the incremental sweep & prune. Every frame all sprites move a few pixels.
+Sprites are spread over a map which grows with their number (same density).
+Run with: python -m benchmarks.broad_phase
+"""
+
+from . import measure
+
+import random
+
+COUNTS = (10, 100, 1000, 5000)
+PAIRWISE_LIMIT = 1000  # testing every pair of more sprites takes too long
+FRAMES = 10
+AREA_PER_SPRITE = 150 * 150
+KINDS = ((0.2, (16, 8)), (0.4, (60, 90)), (0.35, (20, 20)), (0.05, (64, 64)))  # bullets, zombies, items, saws
+
+
+def make_sprites(count: int) -> tuple:
+    """
+    Make moving sprites with full masks.
+    :param count: number of sprites
+    :return: player & groups of bullets, zombies, items & saws
+    """
+    import pygame as pg
+    from game.config import PLAYER_LAYER, BULLET_LAYER, ZOMBIE_LAYER, ITEM_LAYER, SAW_LAYER
+
+    size = int((count * AREA_PER_SPRITE) ** 0.5)
+
+    def make(layer: int, sprite_size: tuple, group=()):
+        sprite = pg.sprite.Sprite(group)
+        sprite.rect = pg.Rect((random.randrange(size), random.randrange(size)), sprite_size)
+        sprite.mask = pg.Mask(sprite_size, fill=True)
+        sprite.collision_layer = layer
+        return sprite
+
+    player = make(PLAYER_LAYER, (60, 90), pg.sprite.Group())
+    groups = []
+    for (share, sprite_size), layer in zip(KINDS, (BULLET_LAYER, ZOMBIE_LAYER, ITEM_LAYER, SAW_LAYER)):
+        group = pg.sprite.Group()
+        for _ in range(max(1, int(count * share))):
+            make(layer, sprite_size, group)
+        groups.append(group)
+    return player, groups
+
+
+def pairwise(player, bullets, zombies, items, saws) -> set:
+    """
+    Test every pair exactly.
+    :return: hit pairs
+    """
+    import pygame as pg
+
+    pairs = set()
+    for bullet in bullets:
+        pairs.update((bullet, zombie) for zombie in pg.sprite.spritecollide(bullet, zombies, False,
+                                                                           pg.sprite.collide_mask))
+        pairs.update((bullet, saw) for saw in pg.sprite.spritecollide(bullet, saws, False, pg.sprite.collide_mask))
+    for group in (zombies, items):
+        pairs.update((player, other) for other in pg.sprite.spritecollide(player, group, False,
+                                                                         pg.sprite.collide_mask))
+    return pairs
+
+
+def rect_lists(player, bullets, zombies, items, saws) -> set:
+    """
+    One Rect.collidelistall() per hitting sprite & group, then the exact test.
+    :return: hit pairs
+    """
+    from game.collision import get_hits, get_mask_rect
+
+    zombie_list, saw_list = zombies.sprites(), saws.sprites()
+    zombie_rects = [get_mask_rect(zombie) for zombie in zombie_list]
+    saw_rects = [get_mask_rect(saw) for saw in saw_list]
+    pairs = set()
+    for bullet in bullets:
+        pairs.update((bullet, zombie) for zombie in get_hits(bullet, zombie_list, zombie_rects))
+        pairs.update((bullet, saw) for saw in get_hits(bullet, saw_list, saw_rects))
+    for group in (zombies, items):
+        sprites = group.sprites()
+        pairs.update((player, other) for other in get_hits(player, sprites, [get_mask_rect(s) for s in sprites]))
+    return pairs
+
+
+def sweep_and_prune(broad_phase, player, bullets, zombies, items, saws) -> set:
+    """
+    Incremental sweep & prune, then the exact test.
+    :return: hit pairs
+    """
+    import pygame as pg
+
+    broad_phase.update(bullets.sprites() + zombies.sprites() + items.sprites() + saws.sprites() + [player])
+    return {pair for pair in broad_phase.get_pairs() if pg.sprite.collide_mask(*pair)}
+
+
+def main() -> None:
+    import pygame as pg
+    from game.collision import SweepAndPrune
+
+    random.seed(1)
+    pg.init()
+
+    print(f'{"sprites":>8}{"pairs":>8}{"every pair (ms)":>17}{"rect lists (ms)":>17}{"sweep & prune (ms)":>20}')
+    for count in COUNTS:
+        player, groups = make_sprites(count)
+        sprites = [player] + [sprite for group in groups for sprite in group]
+        broad_phase = SweepAndPrune()
+
+        def frame(find_pairs, *args):
+            for sprite in sprites:
+                sprite.rect.move_ip(random.randint(-2, 2), random.randint(-2, 2))
+            return find_pairs(*args, player, *groups)
+
+        pairs = frame(sweep_and_prune, broad_phase)
+        assert pairs == rect_lists(player, *groups)
+        if count <= PAIRWISE_LIMIT:
+            assert pairs == pairwise(player, *groups)
+            pairwise_time = f'{measure(lambda: frame(pairwise), FRAMES) / 1000:>17.2f}'
+        else:
+            pairwise_time = f'{"-":>17}'
+        lists_time = measure(lambda: frame(rect_lists), FRAMES) / 1000
+        sap_time = measure(lambda: frame(sweep_and_prune, broad_phase), FRAMES) / 1000
+        print(f'{len(sprites):>8}{len(pairs):>8}{pairwise_time}{lists_time:>17.2f}{sap_time:>20.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Collider tests: every pair type of the collider library, and the collision tests of the game before & after
+saws became circles & laser beams boxes (per-pixel masks vs. analytic shapes).
+Sprites of level 1 are tested at random positions near each other (about half of the tests hit).
+Run with: python -m benchmarks.colliders
+"""
+
+from . import start_level, measure
+
+import random
+
+TESTS = 2000
+REPEAT = 10
+
+
+def near(rect, distance: int) -> tuple:
+    """
+    Get a random position near a rect's center.
+    :param rect: rect
+    :param distance: maximum distance on each axis
+    :return: position
+    """
+    return rect.centerx + random.randint(-distance, distance), rect.centery + random.randint(-distance, distance)
+
+
+def run(name: str, test, cases: list) -> None:
+    """
+    Print the time of a test.
+    :param name: pair type
+    :param test: test of a case (returns if it hits)
+    :param cases: cases
+    """
+    hits = sum(bool(test(*case)) for case in cases)
+    time = measure(lambda: [test(*case) for case in cases], REPEAT) / len(cases)
+    print(f'{name:<40}{time:>10.3f}{hits / len(cases):>8.0%}')
+
+
+def main() -> None:
+    import pygame as pg
+    from game import vec
+    from game.sprites import Bullet
+    from game.config import SAW_HIT_RATIO
+    from game.collision import get_rect_circle, collide_pair, collide_beam
+    from game.colliders import Circle, Capsule, AABB, circle_circle, circle_box, box_box, capsule_circle, \
+        capsule_box, mask_box
+
+    game = start_level(1)
+    random.seed(1)
+    player = game.player
+    bullet = Bullet(game, vec(0, 0), vec(1, 0))
+    saw = game.saws.sprites()[0]
+    laser = game.lasers.sprites()[0]
+
+    def place(sprite, position: tuple):
+        rect = sprite.rect.copy()
+        rect.center = position
+        placed = pg.sprite.Sprite()
+        placed.image, placed.rect, placed.mask = sprite.image, rect, sprite.mask
+        return placed
+
+    # saws don't have masks anymore, the one of the current rotation frame is made once
+    masked_saw = pg.sprite.Sprite()
+    masked_saw.rect, masked_saw.radius, masked_saw.mask = saw.rect, saw.radius, pg.mask.from_surface(saw.image)
+
+    box = laser.get_collider()
+    player_near_saw = [(place(player, near(saw.rect, 90)), saw) for _ in range(TESTS)]
+    bullet_near_saw = [(place(bullet, near(saw.rect, 50)), saw) for _ in range(TESTS)]
+    bullet_near_masked_saw = [(bullet, masked_saw) for bullet, _ in bullet_near_saw]
+    player_near_laser = [(place(player, near(box, max(box.size) // 2 + 40)), laser) for _ in range(TESTS)]
+    bullet_near_laser = [(place(bullet, near(box, max(box.size) // 2 + 10)), laser) for _ in range(TESTS)]
+
+    print(f'{"pair":<40}{"us/test":>10}{"hits":>8}')
+    print('game tests - before (masks)')
+    run('player-saw (collide_circle_ratio)', lambda a, b: pg.sprite.collide_circle_ratio(0.9)(a, b), player_near_saw)
+    run('bullet-saw (collide_mask)', pg.sprite.collide_mask, bullet_near_masked_saw)
+    run('player-laser (collide_mask)', pg.sprite.collide_mask, player_near_laser)
+    run('bullet-laser (collide_mask)', pg.sprite.collide_mask, bullet_near_laser)
+    print('game tests - after (colliders)')
+    run('player-saw (circle-circle)', lambda a, b: circle_circle(get_rect_circle(a), b.get_collider(), SAW_HIT_RATIO),
+        player_near_saw)
+    run('bullet-saw (circle-box)', collide_pair, bullet_near_saw)
+    run('player-laser (mask-box)', collide_beam, player_near_laser)
+    run('bullet-laser (mask-box)', collide_beam, bullet_near_laser)
+
+    print('collider library')
+
+    def circle():
+        return Circle(random.uniform(0, 200), random.uniform(0, 200), random.uniform(10, 40))
+
+    def aabb():
+        return AABB(random.randrange(200), random.randrange(200), random.randint(10, 80), random.randint(10, 80))
+
+    def capsule():
+        x, y = random.uniform(0, 200), random.uniform(0, 200)
+        return Capsule(x, y, x + random.uniform(-80, 80), y + random.uniform(-80, 80), random.uniform(5, 20))
+
+    mask = pg.mask.from_surface(player.image)
+    run('circle-circle', circle_circle, [(circle(), circle()) for _ in range(TESTS)])
+    run('circle-box', circle_box, [(circle(), aabb()) for _ in range(TESTS)])
+    run('box-box', box_box, [(aabb(), aabb()) for _ in range(TESTS)])
+    run('capsule-circle', capsule_circle, [(capsule(), circle()) for _ in range(TESTS)])
+    run('capsule-box', capsule_box, [(capsule(), aabb()) for _ in range(TESTS)])
+    run('mask-box', mask_box, [(mask, (random.randrange(150), random.randrange(150)), aabb()) for _ in range(TESTS)])
+
+
+if __name__ == '__main__':
+    main()
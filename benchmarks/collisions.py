@@ -0,0 +1,84 @@
+"""
+Frame cost of finding the hits of the player's bullets: the checks every bullet ran in its update
+(groupcollide() of all zombies & bullets per bullet, then the hazards) vs. the collision phase of the game.
+Sprites are placed where nothing is hit, so the same sprites are tested every frame.
+Run with: python -m benchmarks.collisions
+"""
+
+from . import start_level, measure
+
+import random
+
+REPEAT = 5
+CASES = ((5, 5), (20, 20), (50, 50))  # bullets, zombies
+
+
+def find_free_spot(game, size: tuple, taken: list):
+    """
+    Find a random spot where a rect of the size doesn't touch any obstacle, hazard or other placed sprite.
+    :param game: game
+    :param size: rect size
+    :param taken: rects of the sprites placed so far
+    :return: rect
+    """
+    import pygame as pg
+
+    hazards = [sprite.rect.inflate(20, 20) for group in (game.saws, game.spikes, game.lasers, game.laser_machines,
+                                                         game.laser_receivers, game.items) for sprite in group]
+    while True:
+        rect = pg.Rect((random.randrange(100, 1800), random.randrange(100, 1500)), size)
+        if not game.obstacle_grid.query(rect.inflate(20, 20)) and rect.inflate(20, 20).collidelist(hazards + taken) < 0:
+            taken.append(rect)
+            return rect
+
+
+def old_bullet_checks(game) -> None:
+    """
+    Checks of every bullet's update before the collision phase (only finding the hits).
+    :param game: game
+    """
+    import pygame as pg
+    from game.config import BULLET_COLLISION_LAYERS
+
+    for bullet in game.bullets:
+        pg.sprite.groupcollide(game.zombies, game.bullets, False, False, pg.sprite.collide_mask)
+        game.obstacle_grid.collide(bullet, BULLET_COLLISION_LAYERS)
+        pg.sprite.spritecollide(bullet, game.saws, False, pg.sprite.collide_mask)
+        pg.sprite.spritecollideany(bullet, game.spikes)
+        pg.sprite.spritecollide(bullet, game.lasers, False, pg.sprite.collide_mask)
+        pg.sprite.spritecollide(bullet, game.laser_machines, False, pg.sprite.collide_mask)
+
+
+def main() -> None:
+    from game import vec
+    from game.sprites import Zombie, Bullet
+
+    game = start_level(1)
+    random.seed(1)
+    collisions = game._Game__collisions
+
+    print(f'{"bullets":>8}{"zombies":>9}{"per bullet update (ms)":>24}{"collision phase (ms)":>22}')
+    for bullet_count, zombie_count in CASES:
+        game.level = 1
+        for _ in game._Game__load_level(1):
+            pass
+        game.player.kill()  # only the bullets are measured
+
+        for zombie in game.zombies.sprites():
+            zombie.kill()
+        taken = []
+        for _ in range(zombie_count):
+            rect = find_free_spot(game, (80, 110), taken)
+            Zombie(game, *rect.center)
+        for _ in range(bullet_count):
+            rect = find_free_spot(game, (40, 40), taken)
+            Bullet(game, vec(rect.center), vec(1, 0))
+
+        old_time = measure(lambda: old_bullet_checks(game), REPEAT)
+        new_time = measure(collisions.run, REPEAT * 10)
+        assert len(game.bullets) == bullet_count and len(game.zombies) == zombie_count
+        print(f'{bullet_count:>8}{zombie_count:>9}{old_time / 1000:>24.2f}{new_time / 1000:>22.3f}')
+
+
+if __name__ == '__main__':
+    main()
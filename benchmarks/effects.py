@@ -0,0 +1,59 @@
+"""
+Spawn cost of bullets, muzzle flashes & explosions with shared frame pools.
+Also simulates a minute of sustained fire (one shot every BULLET_RATE ms at 60 FPS).
+Run with: python -m benchmarks.effects
+"""
+
+from . import start_level, measure
+
+import time
+from pygame.math import Vector2 as vec
+from pygame.transform import scale
+
+REPEAT = 500
+
+
+def main() -> None:
+    game = start_level(1)
+
+    from game.config import FPS, BULLET_RATE
+    from game.sprites import Bullet, MuzzleFlash, Explosion
+
+    pos = game.player.get_pos() + (0, -30)
+    sheet = game.player_sprite_sheet
+
+    def shot():
+        Bullet(game, pos, vec(-1, 0))
+        MuzzleFlash(game, pos)
+
+    def explosion():
+        Explosion(game, pos)
+
+    def legacy_shot_frames():
+        # what every shot used to do: parse & scale 5 bullet and 5 muzzle frames
+        for name, size in (('bullet', (1 / 1.5, 1 / 1.5)), ('muzzle', (2, 1.2))):
+            for i in range(5):
+                img = sheet.parse_sprite('{}_{}.png'.format(name, i))
+                scale(img, (int(img.get_width() * size[0]), int(img.get_height() * size[1])))
+
+    print(f'shot (bullet + muzzle flash): {measure(shot, REPEAT):8.1f} us')
+    print(f'explosion:                    {measure(explosion, REPEAT):8.1f} us')
+    print(f'legacy per-shot frame work:   {measure(legacy_shot_frames, REPEAT):8.1f} us')
+    for sprite in game.all_sprites:
+        if isinstance(sprite, (Bullet, MuzzleFlash, Explosion)):
+            sprite.kill()
+
+    # a minute of sustained fire
+    frames = FPS * 60
+    shot_every = max(1, BULLET_RATE * FPS // 1000)
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % shot_every == 0:
+            shot()
+        game.bullets.update()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f'sustained fire ({frames // shot_every} shots, {frames} frames): {elapsed:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
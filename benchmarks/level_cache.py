@@ -0,0 +1,30 @@
+"""
+Time to start a level again (retry or replay) with the prepared level kept in the level cache vs. prepared again.
+Run with: python -m benchmarks.level_cache
+"""
+
+from . import start_level, measure
+
+REPEAT = 10
+
+
+def main() -> None:
+    game = start_level(1)
+
+    def load_level() -> None:
+        for _ in game._Game__load_level(1):
+            pass
+
+    def load_level_uncached() -> None:
+        game.levels.clear()
+        load_level()
+
+    cached = measure(load_level, REPEAT) / 1000
+    uncached = measure(load_level_uncached, REPEAT) / 1000
+    print(f'level 1 start, prepared again: {uncached:6.2f} ms')
+    print(f'level 1 start, level cache:    {cached:6.2f} ms')
+    print(f'level cache: {game.levels.get_stats()}')
+
+
+if __name__ == '__main__':
+    main()
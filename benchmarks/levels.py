@@ -0,0 +1,46 @@
+"""
+Time to load a level map from the .tmx file (parse, load the tileset, render the tiles & read the objects)
+vs. from the compiled level file.
+Compile the levels first with: python -m game.compile
+Run with: python -m benchmarks.levels
+"""
+
+from . import measure
+
+import pygame as pg
+
+REPEAT = 10
+
+
+def main() -> None:
+    pg.display.init()
+    pg.display.set_mode((1920, 1080))
+
+    from game.compile import MAPS
+    from game.assets import asset_cache
+    from game.tilemap import TiledMap, load_tmx, render_map, tileset_registry
+    from game.levelfile import get_spawn_objects
+
+    def from_tmx(filename: str):
+        asset_cache.clear()  # load the tileset again (as every level start did)
+        tileset_registry.clear()
+        tiled_map = load_tmx(filename)
+        render_map(tiled_map)
+        get_spawn_objects(tiled_map)
+
+    def compiled(filename: str):
+        tiled_map = TiledMap(filename)
+        if not tiled_map.is_compiled():
+            raise SystemExit('Compiled levels are missing or stale, run: python -m game.compile')
+        tiled_map.make_map()
+
+    print(f'{"":<12}{".tmx (ms)":>12}{"compiled (ms)":>16}')
+    for filename in MAPS:
+        tmx_time = measure(lambda: from_tmx(filename), REPEAT) / 1000
+        compiled_time = measure(lambda: compiled(filename), REPEAT) / 1000
+        print(f'{filename.split("/")[-1]:<12}{tmx_time:>12.1f}{compiled_time:>16.2f}'
+              f'  ({tmx_time / compiled_time:.0f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
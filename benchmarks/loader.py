@@ -0,0 +1,50 @@
+"""
+Startup asset loading: wall time with one worker thread vs. the thread pool, and the slowest assets.
+Run with: python -m benchmarks.loader
+"""
+
+import time
+import pygame as pg
+
+SLOWEST = 10
+
+
+class LoadingScreen:
+    """
+    Display & window for the loading screen (instead of the whole game).
+    """
+
+    def __init__(self):
+        self.display = pg.Surface((1920, 1080))
+        self.window = pg.display.set_mode((1920, 1080))
+
+
+def main() -> None:
+    pg.mixer.pre_init(44100, -16, 2, 512)
+    pg.init()
+    screen = LoadingScreen()
+
+    from game.config import LOADER_THREADS
+    from game.assets import asset_cache
+    from game.loader import AssetLoader
+
+    loader = None
+    for threads in (1, LOADER_THREADS):
+        asset_cache.clear()
+        loader = AssetLoader(screen, threads)
+        loader.add_startup_assets()
+        start = time.perf_counter()
+        loader.load()
+        elapsed = (time.perf_counter() - start) * 1000
+        timings = loader.get_timings()
+        print(f'{threads} thread(s): {len(timings)} assets in {elapsed:.0f} ms '
+              f'(sum of decode times {sum(timing[2] for timing in timings):.0f} ms, '
+              f'slowest asset {timings[0][2] + timings[0][3]:.0f} ms)')
+
+    print(f'\n{SLOWEST} slowest assets (decode, convert):')
+    for kind, path, decode_time, finish_time in loader.get_timings()[:SLOWEST]:
+        print(f'{kind:<6}{decode_time:>9.1f} ms{finish_time:>9.1f} ms  {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Update time per entity with precomputed masks vs. rebuilding the mask on every update.
+Run with: python -m benchmarks.masks
+"""
+
+from . import start_level, measure
+
+import pygame as pg
+
+REPEAT = 2000
+
+
+def main() -> None:
+    game = start_level(1)
+
+    entities = (('player', [game.player]),
+                ('zombie', list(game.zombies)),
+                ('saw', list(game.saws)))
+
+    print(f'{"entity":<8}{"count":>6}{"update (us)":>14}{"mask rebuild (us)":>20}{"saved":>8}')
+    for name, sprites in entities:
+        def update():
+            for sprite in sprites:
+                sprite.update()
+
+        def rebuild_masks():
+            for sprite in sprites:
+                pg.mask.from_surface(sprite.image)
+
+        update_time = measure(update, REPEAT) / len(sprites)
+        mask_time = measure(rebuild_masks, REPEAT) / len(sprites)
+        saved = mask_time / (update_time + mask_time) * 100
+        print(f'{name:<8}{len(sprites):>6}{update_time:>14.2f}{mask_time:>20.2f}{saved:>7.1f}%')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Obstacles of the levels as placed in Tiled vs. merged by the level compiler (greedy meshing): number of obstacles,
+the time of merging them & of the obstacle queries (player sized rects in the obstacle grid) with each set.
+Merged obstacles of each type cover the same pixels as the placed ones & don't overlap (checked on the solid map).
+Synthetic tile maps (random solid 64x64 tiles, each tile an obstacle) show the gain on tile-based collision.
+Run with: python -m benchmarks.meshing
+"""
+
+from . import start_level, measure
+
+from types import SimpleNamespace
+import random
+
+QUERIES = 200  # player sized rects at random positions
+REPEAT = 20
+TILE_SIZE = 64
+TILE_MAPS = ((26, 0.3), (26, 0.6), (64, 0.3), (64, 0.6))  # tiles on a side, share of solid tiles
+
+
+def make_obstacles(spawn_objects) -> list:
+    """
+    Make the obstacle sprites of spawn objects.
+    :param spawn_objects: spawn objects
+    :return: obstacle sprites
+    """
+    import pygame as pg
+    from game.sprites import Obstacle
+
+    holder = SimpleNamespace(obstacles=pg.sprite.Group())
+    for tile_object in spawn_objects:
+        if tile_object.name == 'obstacle':
+            Obstacle(holder, tile_object.x, tile_object.y, tile_object.width, tile_object.height, tile_object.type)
+    return holder.obstacles.sprites()
+
+
+def check(placed: list, merged: list, size: tuple) -> None:
+    """
+    Check that the merged obstacles of each collision layer cover the pixels of the placed ones, once.
+    :param placed: placed obstacles
+    :param merged: merged obstacles
+    :param size: map size
+    """
+    from game.solidmap import SolidMap
+
+    # obstacles can stick out of the map (screen limits), the solid maps are big enough for all of them
+    width = max(size[0], *(obstacle.rect.right for obstacle in placed))
+    height = max(size[1], *(obstacle.rect.bottom for obstacle in placed))
+    for layer in {obstacle.collision_layer for obstacle in placed} - {0}:
+        placed_map = SolidMap.from_sprites(placed, (width, height), layer)
+        merged_map = SolidMap.from_sprites(merged, (width, height), layer)
+        rects = [(x, y, 1, 1) for x in range(0, width, 4) for y in range(0, height, 4)]
+        assert (placed_map.collide_rects(rects) == merged_map.collide_rects(rects)).all()
+        assert placed_map.get_solid_count() == merged_map.get_solid_count() == \
+            sum(obstacle.rect.w * obstacle.rect.h for obstacle in merged if obstacle.collision_layer == layer)
+
+
+def compare(name: str, placed: list, merged: list, merge_time: float, size: tuple) -> None:
+    """
+    Print the number of obstacles & the time of the queries with each set.
+    :param name: map name
+    :param placed: placed obstacles
+    :param merged: merged obstacles
+    :param merge_time: time of merging (us)
+    :param size: map size
+    """
+    import pygame as pg
+    from game.collision import SpatialHash
+
+    check(placed, merged, size)
+    width, height = size
+    queries = [pg.Rect(random.randrange(width), random.randrange(height), 60, 90) for _ in range(QUERIES)]
+    placed_grid, merged_grid = SpatialHash(placed), SpatialHash(merged)
+    for query in queries:
+        assert bool(placed_grid.query(query)) == bool(merged_grid.query(query))
+
+    placed_time = measure(lambda: [placed_grid.query(query) for query in queries], REPEAT)
+    merged_time = measure(lambda: [merged_grid.query(query) for query in queries], REPEAT)
+    placed_hits = sum(len(placed_grid.query(query)) for query in queries)
+    merged_hits = sum(len(merged_grid.query(query)) for query in queries)
+    print(f'{name:<14}{len(placed):>8}{len(merged):>8}{merge_time / 1000:>12.1f}{placed_time / QUERIES:>13.2f}'
+          f'{merged_time / QUERIES:>13.2f}{placed_hits / QUERIES:>9.2f}{merged_hits / QUERIES:>9.2f}')
+
+
+def main() -> None:
+    from game.levelfile import SpawnObject
+    from game.meshing import merge_obstacles
+
+    game = start_level(1)
+    random.seed(1)
+
+    print(f'{"map":<14}{"placed":>8}{"merged":>8}{"merge (ms)":>12}{"placed (us)":>13}{"merged (us)":>13}'
+          f'{"hits":>9}{"hits":>9}')
+    for level in (1, 2, 3):
+        game.level = level
+        for _ in game._Game__load_level(level):
+            pass
+        tiled_map = game._Game__map
+        objects = tiled_map.objects
+        merged = merge_obstacles(objects)
+        compare(f'level {level}', make_obstacles(objects), make_obstacles(merged),
+                measure(lambda: merge_obstacles(objects), 5), (tiled_map.width, tiled_map.height))
+
+    for tiles, share in TILE_MAPS:
+        objects = [SpawnObject('obstacle', 'ground', column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE, 0, {})
+                   for row in range(tiles) for column in range(tiles) if random.random() < share]
+        merged = merge_obstacles(objects)
+        compare(f'tiles {tiles}x{tiles}', make_obstacles(objects), make_obstacles(merged),
+                measure(lambda: merge_obstacles(objects), 1), (tiles * TILE_SIZE, tiles * TILE_SIZE))
+
+
+if __name__ == '__main__':
+    main()
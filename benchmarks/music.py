@@ -0,0 +1,49 @@
+"""
+Resident memory of the menu & game over music decoded as pg.mixer.Sound vs. streamed by the music service.
+Run with: python -m benchmarks.music
+"""
+
+import pygame as pg
+
+
+def get_rss() -> int:
+    """
+    Get resident memory of the process (Linux).
+    :return: bytes
+    """
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * 4096
+
+
+def main() -> None:
+    pg.mixer.pre_init(44100, -16, 2, 512)
+    pg.mixer.init()
+
+    from game.sounds import MENU_MUSIC, GAME_OVER_MUSIC, decode_sound
+    from game.music import MusicService
+    from game.assets import AssetCache
+
+    tracks = (MENU_MUSIC, GAME_OVER_MUSIC)
+
+    # streamed: only the file and a small decode buffer
+    start = get_rss()
+    service = MusicService()
+    for path in tracks:
+        service.get_track(path).play(-1)
+        pg.time.wait(100)
+    streamed = get_rss() - start
+    pg.mixer.music.stop()
+
+    # decoded: the whole track as PCM
+    start = get_rss()
+    sounds = [decode_sound(path) for path in tracks]
+    decoded = get_rss() - start
+    pcm = sum(AssetCache.size_of(sound) for sound in sounds)
+
+    print(f'decoded as Sound: {decoded / 2 ** 20:6.1f} MiB resident ({pcm / 2 ** 20:.1f} MiB of PCM)')
+    print(f'streamed:         {streamed / 2 ** 20:6.1f} MiB resident')
+    print(f'saved:            {(decoded - streamed) / 2 ** 20:6.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
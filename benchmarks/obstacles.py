@@ -0,0 +1,92 @@
+"""
+Obstacle collision queries: spritecollide() over the whole obstacle group vs. the obstacle grid (SpatialHash),
+and ground queries (player & bullets) filtered by the obstacle type vs. by the collision layer in the grid.
+Synthetic maps have the same obstacle density as the levels, so bigger maps only have more obstacles far away.
+Run with: python -m benchmarks.obstacles
+"""
+
+from . import start_level, measure
+
+from types import SimpleNamespace
+import random
+
+QUERIES = 200  # player sized rects at random positions
+REPEAT = 20
+AREA_PER_OBSTACLE = 1920 * 1664 // 100  # about the density of the levels (100 obstacles in a 1920x1664 map)
+TYPES = ('ground',) * 7 + ('zombie_limit', 'saw_limit_left', 'saw_limit_right')  # about the mix of the levels
+
+
+def make_map(count: int) -> list:
+    """
+    Make a synthetic map.
+    :param count: number of obstacles
+    :return: obstacle sprites
+    """
+    import pygame as pg
+    from game.sprites import Obstacle
+
+    width = height = int((count * AREA_PER_OBSTACLE) ** 0.5)
+    holder = SimpleNamespace(obstacles=pg.sprite.Group())
+    for _ in range(count):
+        Obstacle(holder, random.randrange(width), random.randrange(height), random.choice((64, 128, 320)),
+                 random.choice((32, 64)), random.choice(TYPES))
+    return holder.obstacles.sprites()
+
+
+def compare(name: str, obstacles: list) -> None:
+    """
+    Print the time of the queries with & without the grid.
+    :param name: map name
+    :param obstacles: obstacle sprites
+    """
+    import pygame as pg
+    from game.collision import SpatialHash
+    from game.config import GROUND_LAYER
+
+    group = pg.sprite.Group(obstacles)
+    grid = SpatialHash(obstacles)
+    right = max(obstacle.rect.right for obstacle in obstacles)
+    bottom = max(obstacle.rect.bottom for obstacle in obstacles)
+    queries = []
+    for _ in range(QUERIES):
+        query = pg.sprite.Sprite()
+        query.rect = pg.Rect(random.randrange(right), random.randrange(bottom), 60, 90)
+        queries.append(query)
+
+    for query in queries:
+        assert pg.sprite.spritecollide(query, group, False) == grid.collide(query)
+
+    group_time = measure(lambda: [pg.sprite.spritecollide(query, group, False) for query in queries], REPEAT)
+    grid_time = measure(lambda: [grid.collide(query) for query in queries], REPEAT)
+    build_time = measure(lambda: SpatialHash(obstacles), REPEAT)
+
+    def ground_by_type():
+        return [[obstacle for obstacle in grid.collide(query) if obstacle.get_type() == 'ground'] for query in queries]
+
+    def ground_by_layer():
+        return [grid.collide(query, GROUND_LAYER) for query in queries]
+
+    assert ground_by_type() == ground_by_layer()
+    type_time = measure(ground_by_type, REPEAT)
+    layer_time = measure(ground_by_layer, REPEAT)
+    print(f'{name:<12}{len(obstacles):>10}{group_time / QUERIES:>12.2f}{grid_time / QUERIES:>11.2f}'
+          f'{build_time / 1000:>12.2f}{type_time / QUERIES:>19.2f}{layer_time / QUERIES:>20.2f}')
+
+
+def main() -> None:
+    game = start_level(1)
+    random.seed(1)
+
+    print(f'{"map":<12}{"obstacles":>10}{"group (us)":>12}{"grid (us)":>11}{"build (ms)":>12}'
+          f'{"ground/type (us)":>19}{"ground/layer (us)":>20}')
+    for level in (1, 2, 3):
+        game.level = level
+        for _ in game._Game__load_level(level):
+            pass
+        compare(f'level {level}', game.obstacles.sprites())
+    for count in (1000, 5000, 20000):
+        compare('synthetic', make_map(count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Time & number of opened files to load every image, sound & map from loose files vs. the asset pack.
+Build the pack first with: python -m game.pack
+Run with: python -m benchmarks.pack
+"""
+
+from . import measure
+
+from os import walk
+from os.path import join
+import builtins
+import pygame as pg
+
+REPEAT = 3
+
+
+def main() -> None:
+    pg.mixer.pre_init(44100, -16, 2, 512)
+    pg.init()
+    pg.display.set_mode((1, 1))
+
+    from game.config import ASSETS_DIR, MAP1, MAP2, MAP3
+    from game import pack
+    from game.sounds import load_sound
+    from game.assets import asset_cache, load_image
+    from game.tilemap import load_tmx
+
+    asset_pack = pack.asset_pack
+    if asset_pack.open(MAP1) is None:
+        raise SystemExit('Asset pack is missing, run: python -m game.pack')
+
+    files = [join(directory, name) for directory, _, names in walk(ASSETS_DIR) for name in names]
+    images = [path for path in files if path.endswith('.png')]
+    sounds = [path for path in files if path.endswith('.ogg')]
+
+    opened = [0]
+    real_open = builtins.open
+
+    def counting_open(*args, **kwargs):
+        opened[0] += 1
+        return real_open(*args, **kwargs)
+
+    def load_all():
+        asset_cache.clear()
+        for path in images:
+            load_image(path)
+        for path in sounds:
+            load_sound(path)
+        for path in (MAP1, MAP2, MAP3):
+            load_tmx(path)
+
+    builtins.open = counting_open
+    try:
+        results = []
+        for name, asset_pack in (('loose files', pack.AssetPack('')), ('asset pack', asset_pack)):
+            pack.asset_pack = asset_pack  # open_asset() uses the module's pack
+            opened[0] = 0
+            load_time = measure(load_all, REPEAT) / 1000
+            results.append((name, load_time, opened[0] // REPEAT))
+    finally:
+        builtins.open = real_open
+
+    print(f'images: {len(images)}, sounds: {len(sounds)}, maps: 3')
+    print(f'{"":<14}{"load (ms)":>12}{"files opened":>15}')
+    for name, load_time, count in results:
+        print(f'{name:<14}{load_time:>12.1f}{count:>15}')
+
+
+if __name__ == '__main__':
+    main()
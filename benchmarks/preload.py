@@ -0,0 +1,70 @@
+"""
+Time to start level 2 when it was prepared in the background during level 1 vs. when it starts being prepared
+when the level starts (compiled levels: mapping the level, copying the map image, drawing the solid map
+& scaling the sprite images). Without preloading, the loading steps wait for the preparation (the transition
+is drawn meanwhile), so no step is longer either way.
+Each case runs in a new process, so nothing is cached from the other one.
+Run with: python -m benchmarks.preload
+"""
+
+from . import start_level
+
+import subprocess
+import sys
+import time
+
+REPEAT = 5
+
+
+def load_level_2(preload: bool) -> None:
+    """
+    Play level 1 & load level 2 (prints level load time, time waiting for the preparation & the longest step in ms).
+    :param preload: True to let level 2 be prepared in the background
+    """
+    game = start_level(1)
+
+    from game.config import MAP2
+
+    preloader = game.levels._LevelManager__preloader
+    if preload:
+        while not preloader.is_ready(MAP2):
+            time.sleep(0.01)
+    else:
+        preloader.get(MAP2)  # drop the level prepared after level 1
+
+    game.level = 2
+    wait_time = longest = 0
+    start = time.perf_counter()
+    job = game._Game__load_level(2)
+    while True:
+        step_start = time.perf_counter()
+        progress = next(job, 1)
+        step_time = time.perf_counter() - step_start
+        if progress is None:
+            time.sleep(0.001)  # the rest of the frame
+            wait_time += time.perf_counter() - step_start
+        else:
+            longest = max(longest, step_time)
+        if progress == 1:
+            break
+    print((time.perf_counter() - start) * 1000, wait_time * 1000, longest * 1000)
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        load_level_2(sys.argv[1] == 'preload')
+        return
+
+    print(f'{"level 2":<16}{"level start (ms)":>18}{"waiting (ms)":>14}{"longest step (ms)":>20}')
+    for name, mode in (('preloaded', 'preload'), ('not preloaded', 'no-preload')):
+        times = []
+        for _ in range(REPEAT):
+            output = subprocess.run([sys.executable, '-m', 'benchmarks.preload', mode], capture_output=True, text=True,
+                                    check=True).stdout
+            times.append([float(value) for value in output.split()[-3:]])
+        level_time, wait_time, longest = (sum(values) / REPEAT for values in zip(*times))
+        print(f'{name:<16}{level_time:>18.2f}{wait_time:>14.2f}{longest:>20.2f}')
+
+
+if __name__ == '__main__':
+    main()
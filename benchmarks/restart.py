@@ -0,0 +1,40 @@
+"""
+Latency of restarting level 1 ("New Game") from the level's pristine snapshot vs. loading it again
+(prepared level from the level cache, every sprite made again).
+Run with: python -m benchmarks.restart
+"""
+
+from . import start_level
+
+import time
+
+REPEAT = 10
+FRAMES = 120  # frames played before every restart
+
+
+def main() -> None:
+    game = start_level(1)
+
+    def restart(use_snapshot: bool) -> float:
+        game.delta_time = 1
+        for _ in range(FRAMES):
+            game._Game__update()
+
+        if not use_snapshot:
+            game.levels.clear_snapshots()  # the prepared level is kept, so only the sprites are made again
+
+        start = time.perf_counter()
+        game.level = 1
+        for _ in game._Game__load_level(1):
+            pass
+        return (time.perf_counter() - start) * 1000
+
+    snapshot_times = [restart(True) for _ in range(REPEAT)]
+    reload_times = [restart(False) for _ in range(REPEAT)]
+    print(f'sprites in level 1: {game.levels.get_stats()["snapshots"][1]}')
+    print(f'restart, sprites made again: {sum(reload_times) / REPEAT:6.2f} ms (max {max(reload_times):.2f} ms)')
+    print(f'restart from snapshot:       {sum(snapshot_times) / REPEAT:6.2f} ms (max {max(snapshot_times):.2f} ms)')
+
+
+if __name__ == '__main__':
+    main()
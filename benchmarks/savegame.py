@@ -0,0 +1,55 @@
+"""
+Save game timings: packing the state (game loop), save_game() (packing & handing the file to the writer thread),
+writing the file (writer thread) & loading the save (unpacking, starting the level again & setting the state).
+Run with: python -m benchmarks.savegame
+"""
+
+from . import start_level, measure
+
+import os
+import tempfile
+import time
+
+REPEAT = 200
+
+
+def main() -> None:
+    game = start_level(1)
+
+    from game.savegame import pack_game, unpack_game, write_game
+
+    for _ in range(120):
+        game._Game__update()  # play a bit (zombies & saws move)
+
+    snapshot = game._Game__snapshot
+    writer = game._Game__save_writer
+
+    def pack():
+        return pack_game(game.level, game.game_timer.get_seconds(), snapshot.get_sprites(), game.items)
+
+    data = pack()
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'benchmark.sav')
+        pack_time = measure(pack, REPEAT)
+        save_time = measure(lambda: game.save_game(filename), REPEAT)
+        writer.wait()
+        write_time = measure(lambda: write_game(filename, data), REPEAT // 10)
+
+    def load():
+        for _ in game._Game__load_saved_game(unpack_game(data)):
+            pass
+
+    load()
+    start = time.perf_counter()
+    load()
+    load_time = (time.perf_counter() - start) * 1e6
+
+    print(f'save game: {len(data)} bytes ({len(snapshot.get_sprites())} sprites in the level)')
+    print(f'{"pack (game loop)":<28}{pack_time / 1000:>8.3f} ms')
+    print(f'{"save_game() (game loop)":<28}{save_time / 1000:>8.3f} ms')
+    print(f'{"write & fsync (thread)":<28}{write_time / 1000:>8.3f} ms')
+    print(f'{"load (level restart & state)":<28}{load_time / 1000:>8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Load time & memory of saws with the shared rotation cache vs. 360 rotated images per saw.
+Run with: python -m benchmarks.saws
+"""
+
+from . import start_level
+
+import time
+import pygame as pg
+
+
+def main() -> None:
+    game = start_level(1)
+
+    from game.config import BLACK, SAW_ROTATION_STEP
+    from game.images import SAW_IMAGE
+    from game.assets import asset_cache, load_image, AssetCache, RotationFrames
+
+    saws = list(game.saws)
+    sizes = [saw.rect.size for saw in saws]
+
+    # legacy: every saw made 360 rotated images at load
+    start = time.perf_counter()
+    legacy_bytes = 0
+    for size in sizes:
+        image = load_image(SAW_IMAGE, size).copy()
+        image.set_colorkey(BLACK)
+        images = [pg.transform.rotozoom(image, rot, 1) for rot in range(360)]
+        legacy_bytes += AssetCache.size_of(images)
+    legacy_time = (time.perf_counter() - start) * 1000
+
+    # shared rotation frames, all angles used by the rotation (made on first use)
+    start = time.perf_counter()
+    shared = {}
+    for size in sizes:
+        if size not in shared:
+            image = load_image(SAW_IMAGE, size).copy()
+            image.set_colorkey(BLACK)
+            frames = shared[size] = RotationFrames(image, SAW_ROTATION_STEP)
+            for i in range(len(frames)):
+                frames.get_frame(i)
+    shared_time = (time.perf_counter() - start) * 1000
+    shared_bytes = sum(AssetCache.size_of(frames) for frames in shared.values())
+
+    print(f'saws: {len(saws)}, distinct sizes: {len(shared)}')
+    print(f'{"":<10}{"load (ms)":>12}{"memory (KiB)":>15}{"per saw (KiB)":>16}')
+    for name, load, size in (('legacy', legacy_time, legacy_bytes), ('shared', shared_time, shared_bytes)):
+        print(f'{name:<10}{load:>12.1f}{size / 1024:>15.1f}{size / 1024 / len(saws):>16.1f}')
+    print(f'asset cache: {asset_cache.get_stats()}')
+
+
+if __name__ == '__main__':
+    main()
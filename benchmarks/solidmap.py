@@ -0,0 +1,98 @@
+"""
+Solid map queries vs. the obstacle grid (SpatialHash) on the ground of the levels: rects (bullets in walls),
+points, column scans (first ground below a position) & rays (first ground on a segment),
+each one as a batch (one call of the solid map vs. one grid query per item), and building the solid map.
+Rects are also tested one by one (collide_rect(), as the bullets are).
+Run with: python -m benchmarks.solidmap
+"""
+
+from . import start_level, measure
+
+import random
+
+BATCHES = (1, 10, 100, 1000)
+REPEAT = 20
+SCAN_DEPTH = 300  # px below the column scan start
+RAY_LENGTH = 150
+
+
+def grid_columns(grid, layers: int, xs: list, tops: list) -> list:
+    """
+    Column scans with the grid - top of the highest obstacle in each column.
+    :return: y of the first solid pixel in each column (-1 if there is none)
+    """
+    import pygame as pg
+
+    found = []
+    for x, top in zip(xs, tops):
+        obstacles = grid.query(pg.Rect(x, top, 1, SCAN_DEPTH), layers)
+        found.append(max(top, min(obstacle.rect.top for obstacle in obstacles)) if obstacles else -1)
+    return found
+
+
+def grid_rays(grid, layers: int, starts: list, ends: list) -> list:
+    """
+    Rays with the grid - obstacles in the bounds of the ray clip it.
+    :return: True for each ray which hits
+    """
+    import pygame as pg
+
+    hits = []
+    for (x1, y1), (x2, y2) in zip(starts, ends):
+        bounds = pg.Rect(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+        hits.append(any(obstacle.rect.clipline(x1, y1, x2, y2) for obstacle in grid.query(bounds, layers)))
+    return hits
+
+
+def main() -> None:
+    import pygame as pg
+    from game.config import SOLID_MAP_LAYERS
+    from game.solidmap import SolidMap
+
+    game = start_level(1)
+    random.seed(1)
+    layers = SOLID_MAP_LAYERS
+
+    print(f'{"level":>5}{"query":>9}{"batch":>7}{"grid (us)":>12}{"solid map (us)":>16}')
+    for level in (1, 2, 3):
+        game.level = level
+        for _ in game._Game__load_level(level):
+            pass
+        grid, solid_map = game.obstacle_grid, game.solid_map
+        width, height = solid_map.get_size()
+
+        for count in BATCHES:
+            rects = [pg.Rect(random.randrange(width), random.randrange(height), 14, 9) for _ in range(count)]
+            xs = [random.randrange(width) for _ in range(count)]
+            ys = [random.randrange(height) for _ in range(count)]
+            starts = list(zip(xs, ys))
+            ends = [(x + random.randint(-RAY_LENGTH, RAY_LENGTH), y + random.randint(-RAY_LENGTH, RAY_LENGTH))
+                    for x, y in starts]
+            bottoms = [y + SCAN_DEPTH for y in ys]
+
+            assert list(solid_map.collide_rects(rects)) == [bool(grid.query(rect, layers)) for rect in rects] == \
+                [solid_map.collide_rect(rect) for rect in rects]
+            assert list(solid_map.scan_columns(xs, ys, bottoms)) == grid_columns(grid, layers, xs, ys)
+            cases = (
+                ('rects', lambda: [grid.query(rect, layers) for rect in rects],
+                 lambda: solid_map.collide_rects(rects)),
+                ('rect', lambda: [grid.query(rect, layers) for rect in rects],
+                 lambda: [solid_map.collide_rect(rect) for rect in rects]),
+                ('points', lambda: [grid.query(pg.Rect(x, y, 1, 1), layers) for x, y in starts],
+                 lambda: solid_map.is_solid(xs, ys)),
+                ('columns', lambda: grid_columns(grid, layers, xs, ys),
+                 lambda: solid_map.scan_columns(xs, ys, bottoms)),
+                ('rays', lambda: grid_rays(grid, layers, starts, ends),
+                 lambda: solid_map.cast_rays(starts, ends)),
+            )
+            for name, with_grid, with_map in cases:
+                print(f'{level:>5}{name:>9}{count:>7}{measure(with_grid, REPEAT):>12.1f}'
+                      f'{measure(with_map, REPEAT):>16.1f}')
+
+        build_time = measure(lambda: SolidMap.from_sprites(game.obstacles, (width, height), layers), 5)
+        print(f'level {level}: {width}x{height} px, {solid_map.get_solid_count()} solid, '
+              f'build {build_time / 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Time to load all sound effects by decoding the .ogg files vs. from the decoded sound cache.
+Run with: python -m benchmarks.sounds
+"""
+
+import io
+import time
+import pygame as pg
+
+
+def main() -> None:
+    pg.mixer.pre_init(44100, -16, 2, 512)
+    pg.mixer.init()
+
+    from game import sounds
+    from game.assets import get_files
+    from game.pack import open_asset
+
+    paths = [path for path in get_files(sounds, '.ogg') if path not in sounds.STREAMED_MUSIC]
+    for path in paths:
+        sounds.decode_sound(path)  # fill the cache
+
+    start = time.perf_counter()
+    for path in paths:
+        with open_asset(path) as f:
+            pg.mixer.Sound(io.BytesIO(f.read()))
+    decode_time = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for path in paths:
+        sounds.decode_sound(path)
+    cached_time = (time.perf_counter() - start) * 1000
+
+    print(f'sound effects: {len(paths)}')
+    print(f'decode .ogg:  {decode_time:8.1f} ms')
+    print(f'sound cache:  {cached_time:8.1f} ms ({decode_time / cached_time:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
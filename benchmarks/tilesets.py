@@ -0,0 +1,48 @@
+"""
+Resident tile surfaces after visiting all levels: tiles made for every map vs. tiles shared by the tileset registry.
+Levels are loaded from the .tmx files (compiled levels don't load the tileset at all).
+Run with: python -m benchmarks.tilesets
+"""
+
+import time
+import pygame as pg
+
+
+def main() -> None:
+    pg.display.init()
+    pg.display.set_mode((1920, 1080))
+
+    from game.compile import MAPS
+    from game.tilemap import load_tmx, tileset_registry
+
+    # legacy: every map made its own tiles (and kept them while the map was alive)
+    start = time.perf_counter()
+    legacy_tiles = legacy_bytes = 0
+    tileset_size = 0
+    for filename in MAPS:
+        tileset_registry.clear()
+        tiled_map = load_tmx(filename)
+        stats = tileset_registry.get_stats()
+        legacy_tiles += stats['tiles']
+        legacy_bytes += stats['bytes']
+        tileset_size = sum(tileset.tilecount for tileset in tiled_map.tilesets)
+    legacy_time = (time.perf_counter() - start) * 1000
+
+    # registry: tiles are made once & shared by all maps
+    tileset_registry.clear()
+    start = time.perf_counter()
+    for filename in MAPS:
+        load_tmx(filename)
+    shared_time = (time.perf_counter() - start) * 1000
+    stats = tileset_registry.get_stats()
+
+    print(f'levels: {len(MAPS)}, tiles in the tileset: {tileset_size}, '
+          f'tiles asked for by the maps: {stats["requests"]}')
+    print(f'{"":<10}{"load (ms)":>12}{"tiles":>8}{"memory (KiB)":>15}')
+    for name, load, tiles, size in (('per map', legacy_time, legacy_tiles, legacy_bytes),
+                                    ('registry', shared_time, stats['tiles'], stats['bytes'])):
+        print(f'{name:<10}{load:>12.1f}{tiles:>8}{size / 1024:>15.1f}')
+
+
+if __name__ == '__main__':
+    main()
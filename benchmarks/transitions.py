@@ -0,0 +1,62 @@
+"""
+Level changes in loading steps spread over several frames (each frame runs steps for LEVEL_LOAD_BUDGET
+and draws the transition): number of frames, the longest frame & the longest step, when a level is loaded
+for the first time (prepared in the background) & when it starts again from its snapshot.
+Fails if a step takes longer than LEVEL_LOAD_BUDGET (a frame can't be shorter than its longest step).
+Run with: python -m benchmarks.transitions
+"""
+
+from . import start_level
+
+import time
+
+
+def time_steps(job, steps: list):
+    """
+    Time the steps of a loading job.
+    :param job: steps of loading the level
+    :param steps: list to add the time of each step to (ms)
+    :return: the same steps
+    """
+    while True:
+        start = time.perf_counter()
+        try:
+            progress = next(job)
+        except StopIteration:
+            steps.append((time.perf_counter() - start) * 1000)
+            return
+        steps.append((time.perf_counter() - start) * 1000)
+        yield progress
+
+
+def main() -> None:
+    game = start_level(1)
+
+    from game.config import LEVEL_LOAD_BUDGET
+
+    def load(level: int) -> tuple:
+        # loading steps over several frames (with the transition drawn)
+        game.level = level
+        steps = []
+        game._Game__start_level_job(time_steps(game._Game__load_level(level), steps))
+        frames = []
+        while game.loading:
+            start = time.perf_counter()
+            game._Game__load_level_step()
+            game._Game__draw()
+            frames.append((time.perf_counter() - start) * 1000)
+        return frames, steps
+
+    print(f'frame budget for loading: {LEVEL_LOAD_BUDGET * 1000:.0f} ms')
+    print(f'{"":<20}{"frames":>8}{"longest frame (ms)":>21}{"longest step (ms)":>20}')
+    longest = 0
+    for level, name in ((2, 'first load'), (3, 'first load'), (2, 'restart'), (3, 'restart')):
+        frames, steps = load(level)
+        print(f'level {level} {name:<12}{len(frames):>8}{max(frames):>21.1f}{max(steps):>20.2f}')
+        longest = max(longest, max(steps))
+
+    assert longest <= LEVEL_LOAD_BUDGET * 1000, f'a loading step took {longest:.1f} ms'
+
+
+if __name__ == '__main__':
+    main()
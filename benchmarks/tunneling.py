@@ -0,0 +1,88 @@
+"""
+Bullets passing through thin walls: a bullet moves BULLET_SPEED * delta_time pixels a frame, so a wall thinner
+than that (minus the bullet's width) can fall between two frames. Bullets are shot at walls of several widths from
+every starting offset & tested at the end of each frame (discrete) vs. swept along their path (sweep()).
+Moving targets (zombies, saws & laser machines for bullets, the player for laser bullets) are swept with their masks
+(sweep_sprites()) - the walls are also shot as sprites with a mask (the thin parts of the targets).
+Run with: python -m benchmarks.tunneling
+"""
+
+from . import measure
+
+from types import SimpleNamespace
+
+DELTA_TIMES = (1, 2, 3)  # 60, 30 & 20 frames a second (delta_time is clamped at 3 by the game)
+WALL_WIDTHS = (1, 4, 8, 16)
+BULLET_SIZE = (14, 9)
+REPEAT = 20
+
+
+def shoot(wall, step: int, offset: int) -> list:
+    """
+    Get the rects of a bullet at the end of each frame until it's past the wall.
+    :param wall: wall rect
+    :param step: pixels a frame
+    :param offset: starting distance from the wall
+    :return: rects
+    """
+    import pygame as pg
+
+    rect = pg.Rect((wall.left - BULLET_SIZE[0] - offset, wall.top), BULLET_SIZE)
+    rects = [rect]
+    while rect.left <= wall.right:
+        rect = rect.move(step, 0)
+        rects.append(rect)
+    return rects
+
+
+def make_sprite(rect):
+    """
+    Make a sprite with a full mask (a bullet or a target).
+    :param rect: rect
+    :return: sprite
+    """
+    import pygame as pg
+    from game.config import ZOMBIE_LAYER
+
+    mask = pg.mask.Mask(rect.size, fill=True)
+    return SimpleNamespace(rect=rect, mask=mask, collision_layer=ZOMBIE_LAYER)
+
+
+def main() -> None:
+    import pygame as pg
+    from game.collision import sweep, sweep_sprites
+    from game.config import BULLET_SPEED
+
+    print(f'{"delta_time":>10}{"wall (px)":>10}{"discrete missed":>17}{"swept missed":>14}{"sprite missed":>15}'
+          f'{"discrete (us)":>15}{"swept (us)":>12}{"sprite (us)":>13}')
+    for delta_time in DELTA_TIMES:
+        step = round(BULLET_SPEED * delta_time)
+        for width in WALL_WIDTHS:
+            wall = pg.Rect(200, 0, width, 64)
+            walls = [wall]
+            paths = [shoot(wall, step, offset) for offset in range(step)]
+
+            def discrete():
+                return sum(not any(rect.colliderect(wall) for rect in rects) for rects in paths)
+
+            def swept():
+                return sum(not any(sweep(last_rect, rect, walls) for last_rect, rect in zip(rects, rects[1:]))
+                           for rects in paths)
+
+            targets = [make_sprite(wall)]
+            bullet_paths = [[make_sprite(rect) for rect in rects] for rects in paths]
+
+            def swept_sprites():
+                return sum(not any(sweep_sprites(bullet, last_rect, targets) for last_rect, bullet in
+                                   zip(rects, bullets[1:])) for rects, bullets in zip(paths, bullet_paths))
+
+            frames = sum(len(rects) - 1 for rects in paths)
+            discrete_time = measure(discrete, REPEAT) / frames
+            swept_time = measure(swept, REPEAT) / frames
+            sprite_time = measure(swept_sprites, REPEAT) / frames
+            print(f'{delta_time:>10}{width:>10}{discrete():>11}/{len(paths):<5}{swept():>8}/{len(paths):<5}'
+                  f'{swept_sprites():>9}/{len(paths):<5}{discrete_time:>15.2f}{swept_time:>12.2f}{sprite_time:>13.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,20 +6,31 @@
 
 
 from os import environ
+import time
 
 environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 
 import pygame as pg
 from pygame.math import Vector2 as vec
 
-from .config import WIDTH, HEIGHT, FPS, TARGET_FPS, GAME_TITLE, MAP1, MAP2, MAP3, PAUSE_COLOR, TILE_COLOR, GREEN
+from .config import WIDTH, HEIGHT, FPS, TARGET_FPS, GAME_TITLE, PAUSE_COLOR, TILE_COLOR, GREEN, \
+    GAME_MUSIC_VOLUME, PREWARM_SOUNDS, LEVEL_LOAD_BUDGET, FONT, WHITE, SUBMENU_GREY, QUICK_SAVE_FILE, AUTO_SAVE_FILE, \
+    AUTO_SAVE_INTERVAL, WARN_SLOW_LOAD_STEPS
 from .images import PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET, EXPLOSION_SPRITE_SHEET
-from .sounds import BG_MUSIC
+from . import sounds
+from .sounds import BG_MUSIC, STREAMED_MUSIC, prewarm_sounds
+from .assets import get_files, load_font
+from .music import MusicService
 from .menu import MainMenu, SettingsMenu, HighScoresMenu, HowToPlayMenu, CreditsMenu, ConfirmationMenu, PauseMenu, \
     GameOverMenu
 from .spritesheet import SpriteSheet
-from .tilemap import TiledMap, Camera
+from .tilemap import Camera
 from .timer import GameTimer
+from .loader import AssetLoader
+from .levels import LevelManager, LevelSnapshot
+from .preloader import PreparedLevel
+from .collision import SpatialHash, CollisionPhase
+from .savegame import SaveGame, SaveWriter, pack_game, apply_game, read_game, get_latest_save
 from .sprites import Player, Zombie, Obstacle, Acid, Spikes, Saw, LaserMachine, LaserBeam, LaserReceiver, Door, \
     DoorSwitch, Lever, Item
 
@@ -56,6 +67,14 @@ class Game:
 
         pg.display.set_caption(GAME_TITLE)
 
+        # load assets in parallel (draws the loading screen)
+        asset_loader = AssetLoader(self)
+        asset_loader.add_startup_assets()
+        asset_loader.load()
+
+        # music (streamed)
+        self.music = MusicService()
+
         # timer, clock...
         self.timer = pg.USEREVENT + 1
         self.__clock = pg.time.Clock()
@@ -71,6 +90,20 @@ class Game:
         self.click = False
         self.time_up = False
         self.level_up = False
+        self.loading = False  # True while the level is loading (over several frames)
+
+        # level loading
+        self.levels = LevelManager()
+        self.__groups = {}  # sprite groups of the current level by name
+        self.__level_job = None  # steps of loading the level
+        self.__level_progress = 0
+        self.__transition_image = None  # last frame before loading (dimmed)
+        self.__snapshot = None  # pristine state of the current level (save games match the sprites by it)
+        self.__collisions = CollisionPhase(self)
+
+        # save games
+        self.__save_writer = SaveWriter()
+        self.__last_auto_save = 0
 
         # ===== Menus =====
         self.main_menu = MainMenu(self)
@@ -83,22 +116,22 @@ class Game:
         self.__game_over_menu = GameOverMenu(self)
         self.current_menu = self.main_menu
 
+        # load sound effects in the background (menus load them when they are played)
+        if PREWARM_SOUNDS:
+            prewarm_sounds([path for path in get_files(sounds, '.ogg') if path not in STREAMED_MUSIC])
+
         # load all game data
         self.__load_data()
 
         # levels
         self.level = 1
+        self.levels.preload(self.level)  # prepare level 1 while the main menu runs
 
     def __load_data(self) -> None:
         """
-        Load game data (maps, sprite sheets...).
+        Load game data (sprite sheets, music...).
         """
 
-        # maps
-        self.__level_1_map = MAP1
-        self.__level_2_map = MAP2
-        self.__level_3_map = MAP3
-
         # sprite sheets
         try:
             self.player_sprite_sheet = SpriteSheet(PLAYER_SPRITE_SHEET, True)
@@ -115,12 +148,8 @@ class Game:
         # default font
         self.default_font = pg.font.SysFont('Arial', 30)
 
-        # load background music & set volume (plays if turned on in settings)
-        try:
-            pg.mixer.music.load(BG_MUSIC)
-            pg.mixer.music.set_volume(0.5)
-        except Exception as e:
-            print(f"Warning: Could not load background music: {e}")
+        # background music (plays if turned on in settings)
+        self.game_music = self.music.get_track(BG_MUSIC, GAME_MUSIC_VOLUME)
 
     def run(self) -> None:
         """
@@ -133,23 +162,27 @@ class Game:
 
         self.playing = True
         if self.playing:
-            self.__level_1()
+            self.__start_level_job(self.__load_level(self.level))
             # play game music (if turned on in settings)
             if self.main_menu.game_music_on:
-                pg.mixer.music.play(-1)
+                self.game_music.play(-1)
 
         while self.playing:
             self.delta_time = min(self.__clock.tick(FPS) * 0.001 * TARGET_FPS, 3)
             self.__events()  # manage events
 
+            # level is loading (the game is updated again when it's loaded)
+            if self.loading:
+                self.__load_level_step()
+
             # not paused
             if not self.paused:
                 # unpause game music and sounds
-                pg.mixer.music.unpause()
+                self.music.unpause()
                 pg.mixer.unpause()
 
-                # if not game over
-                if not self.game_over:
+                # if not game over & level loaded
+                if not self.game_over and not self.loading:
                     self.__update()  # update
             # paused
             else:
@@ -180,12 +213,19 @@ class Game:
                     self.quit_game()
 
                 # pause
-                if self.playing and not self.game_over:
+                if self.playing and not self.game_over and not self.loading:
                     if event.key == pg.K_ESCAPE:
                         self.paused = not self.paused
 
+                # quick save & quick load
+                if self.playing and not self.game_over and not self.loading and not self.paused:
+                    if event.key == pg.K_F5:
+                        self.save_game(QUICK_SAVE_FILE)
+                    elif event.key == pg.K_F9:
+                        self.load_game()
+
                 # player movement (jump & slide)
-                if self.playing:
+                if self.playing and not self.loading:
                     # jump
                     if event.key == self.player.get_control_key('jump'):
                         self.player.jump()
@@ -195,7 +235,7 @@ class Game:
 
             # key up
             if event.type == pg.KEYUP:
-                if self.playing:
+                if self.playing and not self.loading:
                     # short jump
                     if event.key == self.player.get_control_key('jump'):
                         self.player.jump_cut()
@@ -211,6 +251,11 @@ class Game:
         """
         Draw everything.
         """
+        # level is loading
+        if self.loading:
+            self.__draw_level_transition()
+            return
+
         # fill the screen
         self.display.fill(TILE_COLOR)
 
@@ -219,10 +264,11 @@ class Game:
 
         # draw all sprites (& zombie health)
         for sprite in self.all_sprites:
-            if isinstance(sprite, Zombie):
-                sprite.draw_health()
+            sprite_rect = self.__camera.apply(sprite)
+            self.display.blit(sprite.image, sprite_rect)
 
-            self.display.blit(sprite.image, self.__camera.apply(sprite))
+            if isinstance(sprite, Zombie):
+                sprite.draw_health(self.display, sprite_rect.topleft)
 
         # drawing if not paused or game over
         if not self.paused and not self.game_over:
@@ -245,6 +291,9 @@ class Game:
         elif self.game_over:
             self.__game_over_menu.display_menu()
 
+        # start the next music track if the previous one faded out
+        self.music.update()
+
         # draw everything
         self.window.blit(self.display, (0, 0))
 
@@ -258,7 +307,15 @@ class Game:
         """
         self.__check_level()  # check if next level
         self.all_sprites.update()  # update all sprites
+        self.__collisions.run()  # hits of the bullets, laser bullets & the player
         self.__camera.update(self.player)  # update the camera to follow player
+        self.__check_auto_save()  # save the game every AUTO_SAVE_INTERVAL
+
+    def set_game_over(self) -> None:
+        """
+        End the game (player died or time is up) and show the game over menu.
+        """
+        self.__game_over_menu.show()
 
     def quit_game(self) -> None:
         """
@@ -270,108 +327,163 @@ class Game:
         exit()
 
     # ========== LEVEL FUNCTIONS ==========
-    def __level_1(self) -> None:
+    def __load_level(self, level: int):
         """
-        Load level 1.
+        Load a level from the level manifest in steps (the main loop runs the steps over several frames).
+        :param level: level number
+        :return: generator which yields loading progress (0 - 1) after each step (None while it waits for the level
+                 prepared in the background)
         """
+        info = self.levels.get_info(level)
+
+        # get player health & score from previous level
+        player_data = self.__get_player_data() if info['keep'] else None
+
         # set timer seconds
-        self.game_timer.set_timer(180)
+        self.game_timer.set_timer(info['seconds'])
 
         # set flags
         self.__set_flags()
 
-        # create groups
-        self.__make_groups()
-
-        # load the map & make a surface for it
-        self.__make_level_map(TiledMap(self.__level_1_map))
-
-        # spawn player
-        self.__spawn_player()
+        # remove the previous level's sprites
+        self.levels.teardown(tuple(self.__groups.values()))
 
-        # spawn other sprites
-        self.__spawn_sprites()
-
-        # spawn camera
-        self.__camera = Camera(self.__map.width, self.__map.height)
-
-        # play level start sound
-        self.__play_level_start_sound()
+        snapshot = self.levels.get_snapshot(level)
+        if snapshot is not None:
+            # level was played before - start it from its pristine state (reuses the map, groups & sprites)
+            yield from self.__restore_level(snapshot)
+        else:
+            # create groups
+            self.__make_groups()
+            yield 0.05
 
-    def __level_2(self) -> None:
-        """
-        Load level 2.
-        """
-        # set timer seconds
-        self.game_timer.set_timer(180)
+            # wait for the level prepared in the background (the rest of the frames is left to it)
+            self.levels.preload(level)
+            while self.levels.is_pending(level):
+                yield None
 
-        # get player health & score from previous level
-        health, score = self.__get_player_data()
+            # load the map & make a surface for it (prepared in the background or kept from the last time)
+            prepared = self.levels.prepare(level)
+            self.__make_level_map(prepared)
+            yield 0.2
 
-        # set flags
-        self.__set_flags()
+            # spawn player
+            self.__spawn_player()
+            yield 0.25
 
-        # create groups
-        self.__make_groups()
+            # spawn other sprites
+            for progress in self.__spawn_sprites():
+                yield 0.25 + progress * 0.7
 
-        # load the map & make a surface for it
-        self.__make_level_map(TiledMap(self.__level_2_map))
+            # index the obstacles for collision queries (they don't move, so the grid is kept with the snapshot)
+            self.obstacle_grid = SpatialHash(self.obstacles)
+            yield 0.95
 
-        # spawn player
-        self.__spawn_player()
+            # keep the pristine level for restarting it
+            self.__snapshot = LevelSnapshot(prepared, self.__groups, self.player, self.obstacle_grid)
+            self.levels.save_snapshot(level, self.__snapshot)
 
         # set (keep) player's health & score
-        self.__keep_player_data(health, score)
-
-        # spawn other sprites
-        self.__spawn_sprites()
+        if player_data is not None:
+            self.__keep_player_data(*player_data, info['keep'])
 
         # spawn camera
         self.__camera = Camera(self.__map.width, self.__map.height)
+        self.__camera.update(self.player)
 
         # play level start sound
         self.__play_level_start_sound()
 
-    def __level_3(self) -> None:
+        # prepare the next level while this one is played
+        self.levels.preload(level + 1)
+
+    def __restore_level(self, snapshot: LevelSnapshot):
         """
-        Load level 3.
+        Start a level again from its snapshot.
+        :param snapshot: pristine level
+        :return: generator which yields loading progress (0 - 1) after each step
         """
-        # Set timer seconds
-        self.game_timer.set_timer(180)
+        yield from snapshot.restore()
+        self.__snapshot = snapshot
+        for name, group in snapshot.groups.items():
+            setattr(self, name, group)
+        self.__groups = snapshot.groups
+        self.player = snapshot.player
+        self.obstacle_grid = snapshot.obstacle_grid
+        self.__make_level_map(snapshot.prepared)
 
-        # get player health & score from previous level
-        health, score = self.__get_player_data()
+    def __start_level_job(self, job) -> None:
+        """
+        Start loading a level (shown as a transition over the last frame).
+        :param job: steps of loading the level
+        """
+        self.__level_job = job
+        self.__level_progress = 0
+        self.loading = True
 
-        # set flags
-        self.__set_flags()
+        # last frame, dimmed (the transition is drawn over it)
+        self.__transition_image = self.display.copy()
+        self.__transition_image.blit(self.pause_dim_image, (0, 0))
 
-        # create groups
-        self.__make_groups()
+    def __load_level_step(self) -> None:
+        """
+        Run level loading steps until the frame's loading time is used up or the level is loaded.
+        """
+        start = time.perf_counter()
+        deadline = start + LEVEL_LOAD_BUDGET
+        for progress in self.__level_job:
+            start = self.__check_load_step(start)
+            if progress is None:
+                return  # waiting for the background preparation, try again in the next frame
+            self.__level_progress = progress
+            if start >= deadline:
+                return
+        self.__check_load_step(start)
 
-        # load the map & make a surface for it
-        self.__make_level_map(TiledMap(self.__level_3_map))
+        # level loaded
+        self.__level_job = None
+        self.__transition_image = None
+        self.loading = False
 
-        # spawn player
-        self.__spawn_player()
+    @staticmethod
+    def __check_load_step(start: float) -> float:
+        """
+        Warn about a level loading step which took longer than the frame's loading time (config.WARN_SLOW_LOAD_STEPS).
+        :param start: time when the step started
+        :return: time when the step ended
+        """
+        end = time.perf_counter()
+        if WARN_SLOW_LOAD_STEPS and end - start > LEVEL_LOAD_BUDGET:
+            print(f"Warning: level loading step took {(end - start) * 1000:.1f} ms "
+                  f"(budget {LEVEL_LOAD_BUDGET * 1000:.0f} ms)")
+        return end
 
-        # set (keep) player's health & score
-        self.__keep_player_data(health, score)
+    def __draw_level_transition(self) -> None:
+        """
+        Draw the level transition (level number & loading progress over the last frame).
+        """
+        self.display.blit(self.__transition_image, (0, 0))
 
-        # spawn other sprites
-        self.__spawn_sprites()
+        text = load_font(FONT, 80).render(f'Level {self.level}', True, WHITE)
+        self.display.blit(text, text.get_rect(midbottom=(WIDTH / 2, HEIGHT / 2 - 20)))
 
-        # spawn camera
-        self.__camera = Camera(self.__map.width, self.__map.height)
+        bar = pg.Rect(0, 0, WIDTH / 4, 10)
+        bar.midtop = (WIDTH / 2, HEIGHT / 2 + 20)
+        pg.draw.rect(self.display, SUBMENU_GREY, bar)
+        pg.draw.rect(self.display, WHITE, (bar.x, bar.y, bar.width * self.__level_progress, bar.height))
 
-        # play level start sound
-        self.__play_level_start_sound()
+        # start the next music track if the previous one faded out
+        self.music.update()
+
+        self.window.blit(self.display, (0, 0))
+        pg.display.update()
 
     def __spawn_player(self) -> None:
         """
         Spawn player.
         Spawned separately from other objects to keep health & score in next levels.
         """
-        for tile_object in self.__map.tmx_data.objects:
+        for tile_object in self.__map.objects:
             object_center = vec(tile_object.x + tile_object.width / 2, tile_object.y + tile_object.height / 2)
 
             if tile_object.name == 'player':
@@ -386,14 +498,17 @@ class Game:
         score = self.player.get_score()
         return health, score
 
-    def __keep_player_data(self, health: int, score: int) -> None:
+    def __keep_player_data(self, health: int, score: int, keep: tuple = ('health', 'score')) -> None:
         """
         Keep player's data from previous levels.
         :param health: player health
         :param score: player score
+        :param keep: what the player keeps (health/score)
         """
-        self.player.keep_health(health)
-        self.player.keep_score(score)
+        if 'health' in keep:
+            self.player.keep_health(health)
+        if 'score' in keep:
+            self.player.keep_score(score)
 
     def __set_flags(self) -> None:
         """
@@ -422,6 +537,7 @@ class Game:
         self.zombies = pg.sprite.Group()
         self.obstacles = pg.sprite.Group()
         self.bullets = pg.sprite.Group()
+        self.laser_bullets = pg.sprite.Group()
         self.laser_receivers = pg.sprite.Group()
         self.items = pg.sprite.Group()
         self.doors = pg.sprite.Group()
@@ -432,21 +548,35 @@ class Game:
         self.lasers = pg.sprite.Group()
         self.levers = pg.sprite.Group()
 
-    def __make_level_map(self, map_file: TiledMap) -> None:
+        # all groups by name (to remove the sprites when the level changes & to restart the level)
+        self.__groups = dict(all_sprites=self.all_sprites, zombies=self.zombies, obstacles=self.obstacles,
+                             bullets=self.bullets, laser_bullets=self.laser_bullets,
+                             laser_receivers=self.laser_receivers, items=self.items, doors=self.doors, acid=self.acid,
+                             spikes=self.spikes, saws=self.saws, laser_machines=self.laser_machines, lasers=self.lasers,
+                             levers=self.levers)
+
+    def __make_level_map(self, prepared: PreparedLevel) -> None:
         """
         Make a map.
-        Load a map and make a surface for it.
-        :param map_file: level map file
+        Set the loaded map, the surface made for it & its solid map (tells if there is anything solid at a place).
+        :param prepared: prepared level
         """
-        self.__map = map_file
-        self.__map_img = self.__map.make_map()
+        self.__map = prepared.map
+        self.__map_img = prepared.image
         self.__map_rect = self.__map_img.get_rect()
+        self.solid_map = prepared.solid_map
 
-    def __spawn_sprites(self) -> None:
+    def __spawn_sprites(self):
         """
         Spawn sprites from tmx map (zombies, tiles, objects...).
+        :return: generator which yields spawning progress (0 - 1) after each object
         """
-        for tile_object in self.__map.tmx_data.objects:
+        # obstacles - ground, screen limits and zombie boundaries (merged when the level was compiled)
+        for tile_object in self.__map.get_obstacles():
+            Obstacle(self, tile_object.x, tile_object.y, tile_object.width, tile_object.height, tile_object.type)
+
+        objects = self.__map.objects
+        for index, tile_object in enumerate(objects):
             x_pos = tile_object.x
             y_pos = tile_object.y
             width = tile_object.width
@@ -454,10 +584,6 @@ class Game:
             object_type = tile_object.type
             object_center = vec(x_pos + width / 2, y_pos + height / 2)
 
-            # obstacles - ground, screen limits and zombie boundaries
-            if tile_object.name == 'obstacle':
-                Obstacle(self, x_pos, y_pos, width, height, object_type)
-
             # zombies
             if tile_object.name == 'zombie':
                 Zombie(self, object_center.x, object_center.y)
@@ -488,6 +614,8 @@ class Game:
             if tile_object.name in ('health', 'coin', 'key'):
                 Item(self, object_center, tile_object.name)
 
+            yield (index + 1) / len(objects)
+
     def __check_level(self) -> None:
         """
         Check if next level and change.
@@ -495,10 +623,8 @@ class Game:
         # changing levels
         if self.level_up:
             self.level += 1
-            if self.level == 2:
-                self.__level_2()
-            elif self.level == 3:
-                self.__level_3()
+            if self.level <= len(self.levels):
+                self.__start_level_job(self.__load_level(self.level))
             else:
                 self.__game_over_menu.set_game_completed()
 
@@ -507,7 +633,54 @@ class Game:
         Play the level start sound.
         """
         if self.main_menu.level_start_sound_on:
-            self.__channel1.play(self.main_menu.level_start_sound, loops=0)
+            self.__channel1.play(self.main_menu.level_start_sound.get_sound(), loops=0)
+
+    # ========== SAVE GAMES ==========
+    def save_game(self, filename: str) -> None:
+        """
+        Save the game.
+        The state is packed now (a few hundred bytes), the file is written in the background.
+        :param filename: save file
+        """
+        data = pack_game(self.level, self.game_timer.get_seconds(), self.__snapshot.get_sprites(), self.items)
+        self.__save_writer.write(filename, data)
+        self.__last_auto_save = pg.time.get_ticks()
+
+    def load_game(self) -> None:
+        """
+        Load the latest save game (quick save or autosave), if there is one.
+        """
+        self.__save_writer.wait()  # the latest save may be still being written
+        filename = get_latest_save((QUICK_SAVE_FILE, AUTO_SAVE_FILE))
+        save = read_game(filename) if filename is not None else None
+        if save is not None and 1 <= save.level <= len(self.levels):
+            self.level = save.level
+            self.__start_level_job(self.__load_saved_game(save))
+
+    def __load_saved_game(self, save: SaveGame):
+        """
+        Load the level of the save game & set the saved state.
+        :param save: save game
+        :return: generator which yields loading progress (0 - 1) after each step (None while it waits,
+                 as __load_level())
+        """
+        yield from self.__load_level(save.level)
+
+        try:
+            apply_game(save, self, self.__snapshot.get_sprites())
+            self.game_timer.set_timer(save.seconds)
+        except ValueError as e:
+            print(f"Warning: Could not load the save game: {e}")
+        self.__camera.update(self.player)
+        self.__last_auto_save = pg.time.get_ticks()
+
+    def __check_auto_save(self) -> None:
+        """
+        Save the game to the autosave file every AUTO_SAVE_INTERVAL (if the player is alive).
+        """
+        now = pg.time.get_ticks()
+        if AUTO_SAVE_INTERVAL and now - self.__last_auto_save >= AUTO_SAVE_INTERVAL and self.player.get_health() > 0:
+            self.save_game(AUTO_SAVE_FILE)
 
     def __draw_fps(self) -> None:
         """
@@ -520,4 +693,14 @@ class Game:
         self.display.blit(fps_text, (x, y))
 
 
-game = Game()
+def __getattr__(name: str):
+    """
+    Make the game on first access (importing the package, e.g. for python -m game.bake, doesn't start the game).
+    :param name: attribute name
+    :return: game
+    """
+    if name == 'game':
+        global game
+        game = Game()
+        return game
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,326 @@
+from . import pg
+from .pack import open_asset
+import json
+
+# convert modes
+ALPHA = 'alpha'  # convert_alpha() - images with transparency
+OPAQUE = 'opaque'  # convert() - images without transparency (colorkey can be set later)
+
+
+class AssetCache:
+    """
+    Process-wide cache for images and other derived graphics data.
+    Every image is loaded, converted and scaled only once for each (path, size, convert mode).
+    All sprites share the same surface, so the surfaces must not be drawn on.
+    """
+
+    def __init__(self):
+        """
+        Initialize the asset cache.
+        """
+        self.__assets = {}
+
+        # statistics
+        self.__hits = 0
+        self.__misses = 0
+
+    def load_image(self, path: str, size: tuple = None, convert: str = ALPHA, shrink: float = None) -> pg.Surface:
+        """
+        Load an image (or get it from the cache if already loaded).
+        :param path: image file
+        :param size: size to scale the image to (width, height)
+        :param convert: convert mode (ALPHA/OPAQUE/None)
+        :param shrink: number to divide the image width & height by (used instead of size)
+        :return: shared pygame surface
+        """
+        key = AssetCache.get_image_key(path, size, convert, shrink)
+        return self.get(key, lambda: self.__load_image(path, size, convert, shrink))
+
+    @staticmethod
+    def get_image_key(path: str, size: tuple = None, convert: str = ALPHA, shrink: float = None) -> tuple:
+        """
+        Get the cache key of an image.
+        :param path: image file
+        :param size: size to scale the image to (width, height)
+        :param convert: convert mode (ALPHA/OPAQUE/None)
+        :param shrink: number to divide the image width & height by
+        :return: key
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        return 'image', path, size, convert, shrink
+
+    def __load_image(self, path: str, size: tuple, convert: str, shrink: float) -> pg.Surface:
+        """
+        Load, convert & scale the image.
+        If the converted image is already cached (e.g. loaded by the asset loader), it's only scaled.
+        :param path: image file
+        :param size: size to scale the image to
+        :param convert: convert mode
+        :param shrink: number to divide the image width & height by
+        :return: pygame surface
+        """
+        image = self.__assets.get(AssetCache.get_image_key(path, None, convert))
+        if image is None:
+            image = convert_image(decode_image(path), convert)
+        return scale_image(image, size, shrink)
+
+    def get(self, key, factory):
+        """
+        Get any cached asset (surface, list of surfaces, masks...).
+        If the asset is not in the cache, make it with the factory function and keep it.
+        :param key: hashable key which describes the asset
+        :param factory: function without arguments that makes the asset
+        :return: cached asset
+        """
+        try:
+            asset = self.__assets[key]
+        except KeyError:
+            self.__misses += 1
+            asset = self.__assets[key] = factory()
+        else:
+            self.__hits += 1
+        return asset
+
+    def has(self, key) -> bool:
+        """
+        Check if an asset is cached (without counting it as a hit or a miss).
+        :param key: asset key
+        :return: True if cached
+        """
+        return key in self.__assets
+
+    @staticmethod
+    def size_of(asset) -> int:
+        """
+        Approximate number of bytes an asset holds in memory.
+        :param asset: surface, mask or a collection of them
+        :return: number of bytes
+        """
+        if isinstance(asset, pg.Surface):
+            return asset.get_width() * asset.get_height() * asset.get_bytesize()
+        if isinstance(asset, pg.mask.Mask):
+            width, height = asset.get_size()
+            return width * height // 8
+        if isinstance(asset, pg.mixer.Sound):
+            frequency, size, channels = pg.mixer.get_init()
+            return int(asset.get_length() * frequency) * channels * abs(size) // 8
+        if isinstance(asset, dict):
+            return sum(AssetCache.size_of(value) for value in asset.values())
+        if isinstance(asset, (list, tuple)):
+            return sum(AssetCache.size_of(value) for value in asset)
+        if hasattr(asset, 'get_size_in_bytes'):
+            return asset.get_size_in_bytes()
+        return 0
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+        :return: hits, misses, number of cached assets & approximate bytes held
+        """
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'assets': len(self.__assets),
+            'bytes': sum(AssetCache.size_of(asset) for asset in self.__assets.values())
+        }
+
+    def clear(self) -> None:
+        """
+        Remove all assets and reset the statistics.
+        """
+        self.__assets.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+
+class RotationFrames:
+    """
+    Rotation frames of an image, rotated by a fixed angle step.
+    Frames are made lazily - only the angles that are actually used.
+    They have no masks - rotating sprites (saws) are hit as circles.
+    """
+
+    def __init__(self, image: pg.Surface, step: int):
+        """
+        Initialize rotation frames.
+        :param image: image to rotate
+        :param step: angle between two frames (degrees)
+        """
+        self.__image = image
+        self.__step = step
+        self.__frames = {}
+
+    def __len__(self) -> int:
+        """
+        Number of frames in a full rotation.
+        :return: number of frames
+        """
+        return 360 // self.__step
+
+    def get_frame(self, index: int) -> pg.Surface:
+        """
+        Get the rotated image.
+        :param index: frame index (angle is index * step)
+        :return: image
+        """
+        try:
+            return self.__frames[index]
+        except KeyError:
+            image = self.__frames[index] = pg.transform.rotozoom(self.__image, index * self.__step, 1)
+            return image
+
+    def make_all(self) -> None:
+        """
+        Make every frame (before the frames are shared, frames are made lazily only by one thread).
+        """
+        for index in range(len(self)):
+            self.get_frame(index)
+
+    def get_size_in_bytes(self) -> int:
+        """
+        Approximate number of bytes held by the frames made so far.
+        :return: number of bytes
+        """
+        return AssetCache.size_of(list(self.__frames.values()))
+
+
+# shared (process-wide) cache
+asset_cache = AssetCache()
+
+
+def decode_image(path: str) -> pg.Surface:
+    """
+    Decode an image file (doesn't need the display, so it can be done in any thread).
+    :param path: image file
+    :return: pygame surface (not converted)
+    """
+    with open_asset(path) as f:
+        return pg.image.load(f, path)
+
+
+def convert_image(image: pg.Surface, convert: str) -> pg.Surface:
+    """
+    Convert the image to the display pixel format (must be done in the main thread).
+    :param image: decoded image
+    :param convert: convert mode (ALPHA/OPAQUE/None)
+    :return: converted image
+    """
+    if convert == ALPHA:
+        return image.convert_alpha()
+    if convert == OPAQUE:
+        return image.convert()
+    return image
+
+
+def scale_image(image: pg.Surface, size: tuple = None, shrink: float = None) -> pg.Surface:
+    """
+    Scale an image (doesn't use the cache, so it can be done in any thread).
+    :param image: image
+    :param size: size to scale the image to (width, height)
+    :param shrink: number to divide the image width & height by (used instead of size)
+    :return: scaled image (the same image if it has the size)
+    """
+    if shrink is not None:
+        size = (int(image.get_width() // shrink), int(image.get_height() // shrink))
+    if size is not None and size != image.get_size():
+        image = pg.transform.scale(image, size)
+    return image
+
+
+def read_json(path: str):
+    """
+    Read & parse a .json file.
+    :param path: .json file
+    :return: parsed data
+    """
+    with open_asset(path) as f:
+        return json.load(f)
+
+
+def load_json(path: str):
+    """
+    Get parsed .json data through the shared asset cache (the data must not be changed).
+    :param path: .json file
+    :return: parsed data
+    """
+    return asset_cache.get(('json', path), lambda: read_json(path))
+
+
+def load_image(path: str, size: tuple = None, convert: str = ALPHA, shrink: float = None) -> pg.Surface:
+    """
+    Load an image through the shared asset cache.
+    :param path: image file
+    :param size: size to scale the image to (width, height)
+    :param convert: convert mode (ALPHA/OPAQUE/None)
+    :param shrink: number to divide the image width & height by (used instead of size)
+    :return: shared pygame surface
+    """
+    return asset_cache.load_image(path, size, convert, shrink)
+
+
+def get_files(module, extension: str) -> list:
+    """
+    Get all file paths (constants & lists of them) with the extension from the module.
+    :param module: module with path constants (images/sounds)
+    :param extension: file extension
+    :return: list of paths
+    """
+    files = []
+    for name, value in vars(module).items():
+        if not name.isupper():
+            continue
+        for path in value if isinstance(value, list) else [value]:
+            if isinstance(path, str) and path.endswith(extension) and path not in files:
+                files.append(path)
+    return files
+
+
+def load_font(path: str, size: int) -> pg.font.Font:
+    """
+    Get a font through the shared asset cache (the font file is opened only once for each size).
+    :param path: font file
+    :param size: font size
+    :return: shared pygame font
+    """
+    return asset_cache.get(('font', path, size), lambda: pg.font.Font(open_asset(path), size))
+
+
+def load_rotation_frames(path: str, size: tuple, step: int, colorkey: tuple = None) -> RotationFrames:
+    """
+    Get rotation frames of an image through the shared asset cache.
+    All sprites with the same image, size & angle step share the frames.
+    :param path: image file
+    :param size: size to scale the image to (width, height)
+    :param step: angle between two frames (degrees)
+    :param colorkey: colorkey of the image (optional)
+    :return: rotation frames
+    """
+    return asset_cache.get(get_rotation_key(path, size, step, colorkey),
+                           lambda: make_rotation_frames(load_image(path, size), step, colorkey))
+
+
+def get_rotation_key(path: str, size: tuple, step: int, colorkey: tuple = None) -> tuple:
+    """
+    Get the cache key of rotation frames.
+    :param path: image file
+    :param size: size of the image (width, height)
+    :param step: angle between two frames (degrees)
+    :param colorkey: colorkey of the image
+    :return: key
+    """
+    return 'rotation', path, (int(size[0]), int(size[1])), step, colorkey
+
+
+def make_rotation_frames(image: pg.Surface, step: int, colorkey: tuple = None) -> RotationFrames:
+    """
+    Make rotation frames of an image (doesn't use the cache).
+    :param image: scaled image (it's shared, so it isn't changed)
+    :param step: angle between two frames (degrees)
+    :param colorkey: colorkey of the image (optional)
+    :return: rotation frames
+    """
+    if colorkey is not None:
+        image = image.copy()
+        image.set_colorkey(colorkey)
+    return RotationFrames(image, step)
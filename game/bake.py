@@ -0,0 +1,81 @@
+"""
+Offline bake of the animation frames.
+Parses, scales & flips all animation clips from the sprite sheets once and writes them to a raw pixel cache
+(one data file + json index), so the game doesn't have to decode & transform the sprite sheets on every start.
+Run with: python -m game.bake
+"""
+
+from . import pg
+from .config import BAKE_DIR, BAKE_VERSION, BAKE_FORMAT
+from .images import PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET, ANIMATION_CLIPS
+from .spritesheet import SpriteSheet, INDEX_FILE, DATA_FILE, get_sprite_sheet_info, get_clip_key
+
+from os import makedirs, replace
+from os.path import join, basename
+import json
+import time
+
+SPRITE_SHEETS = (PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET)  # sprite sheets with player/zombie sprites (scaled)
+
+# animation clips used in the game: (sprite sheet, is sprite, name, number of frames, scale)
+CLIPS = tuple((filename, filename in SPRITE_SHEETS, name, count, scale)
+              for filename, clips in ANIMATION_CLIPS.items() for name, (count, scale) in clips.items())
+
+
+def bake(directory: str = BAKE_DIR) -> dict:
+    """
+    Bake all animation clips.
+    :param directory: bake directory
+    :return: number of clips, frames & bytes written
+    """
+    makedirs(directory, exist_ok=True)
+    index_file = join(directory, basename(INDEX_FILE))
+    data_file = join(directory, basename(DATA_FILE))
+
+    index = {'version': BAKE_VERSION, 'format': BAKE_FORMAT, 'sheets': {}, 'clips': {}}
+    sprite_sheets = {}
+    offset = frames = 0
+
+    # write to temporary files first, so a running game never maps a half written cache
+    with open(data_file + '.tmp', 'wb') as f:
+        for filename, is_sprite, name, count, scale in CLIPS:
+            if filename not in sprite_sheets:
+                sprite_sheets[filename] = SpriteSheet(filename, is_sprite)
+                index['sheets'][basename(filename)] = get_sprite_sheet_info(filename)
+
+            clip = {}
+            for side, images in zip(('right', 'left'), sprite_sheets[filename].make_frames(name, count, scale)):
+                clip[side] = []
+                for image in images:
+                    # colorkey -> alpha (only RGBA conversion keeps the colorkey transparent)
+                    data = pg.image.tobytes(image.convert_alpha(), BAKE_FORMAT)
+                    f.write(data)
+                    clip[side].append((offset, image.get_width(), image.get_height()))
+                    offset += len(data)
+                    frames += 1
+            index['clips'][get_clip_key(filename, name, count, scale)] = clip
+
+    with open(index_file + '.tmp', 'w') as f:
+        json.dump(index, f)
+    replace(data_file + '.tmp', data_file)
+    replace(index_file + '.tmp', index_file)
+
+    return {'clips': len(index['clips']), 'frames': frames, 'bytes': offset}
+
+
+def main() -> None:
+    """
+    Bake the frames (a hidden window is needed for converting the sprite sheets).
+    """
+    pg.display.init()
+    pg.display.set_mode((1, 1), pg.HIDDEN)
+
+    start = time.perf_counter()
+    stats = bake()
+    elapsed = (time.perf_counter() - start) * 1000
+    print('Baked {clips} clips ({frames} frames, {kib:.1f} KiB) in {ms:.0f} ms to {dir}'.format(
+        clips=stats['clips'], frames=stats['frames'], kib=stats['bytes'] / 1024, ms=elapsed, dir=BAKE_DIR))
+
+
+if __name__ == '__main__':
+    main()
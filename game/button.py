@@ -3,6 +3,7 @@ from .config import WIDTH, HEIGHT, FONT, WHITE, RED
 from .images import VOLUME_INDICATOR_IMAGE, VOLUME_DOWN_IMG, VOLUME_DOWN_HOVER_IMG, \
     VOLUME_UP_IMG, VOLUME_UP_HOVER_IMG, SWITCH_ON_HOVER_IMG, SWITCH_ON_IMG, SWITCH_OFF_HOVER_IMG, SWITCH_OFF_IMG, \
     MUTE_IMG, MUTE_HOVER_IMG, UN_MUTE_IMG, UN_MUTE_HOVER_IMG, ERROR_IMG
+from .assets import load_image, load_font
 
 
 class Button:
@@ -42,7 +43,7 @@ class TextButton(Button):
         # button text, text size & text font
         self.__text = text
         self.__size = size
-        self.__font = pg.font.Font(FONT, self.__size)
+        self.__font = load_font(FONT, self.__size)
 
         # shadow effect
         self.__shadow_x = self.x + 1
@@ -137,7 +138,7 @@ class VolumeIndicator:
         self.__center_x = (vol_down_btn.rect.centerx + vol_up_btn.rect.centerx) / 2
         self.__center_y = vol_up_btn.rect.centery  # can use any button (center y is the same)
 
-        self.__image = pg.image.load(VOLUME_INDICATOR_IMAGE).convert_alpha()
+        self.__image = load_image(VOLUME_INDICATOR_IMAGE)
         self.__rect = self.__image.get_rect(center=(self.__set_x_position(), self.__center_y))
 
     def __set_x_position(self) -> float:
@@ -212,20 +213,18 @@ class VolumeControl(Button):
         """
         Load & set images based on the button type.
         """
-        load_img = pg.image.load
-
         # down
         if self.__type == 'down':
-            self.__image_normal = load_img(VOLUME_DOWN_IMG).convert_alpha()
-            self.__image_hover = load_img(VOLUME_DOWN_HOVER_IMG).convert_alpha()
+            self.__image_normal = load_image(VOLUME_DOWN_IMG)
+            self.__image_hover = load_image(VOLUME_DOWN_HOVER_IMG)
         # up
         elif self.__type == 'up':
-            self.__image_normal = load_img(VOLUME_UP_IMG).convert_alpha()
-            self.__image_hover = load_img(VOLUME_UP_HOVER_IMG).convert_alpha()
+            self.__image_normal = load_image(VOLUME_UP_IMG)
+            self.__image_hover = load_image(VOLUME_UP_HOVER_IMG)
         # otherwise (error)
         else:
-            self.__image_normal = load_img(ERROR_IMG).convert_alpha()
-            self.__image_hover = load_img(ERROR_IMG).convert_alpha()
+            self.__image_normal = load_image(ERROR_IMG)
+            self.__image_hover = load_image(ERROR_IMG)
 
         self.__image = self.__image_normal
         self.rect = self.__image.get_rect()
@@ -358,15 +357,13 @@ class OnOffSwitch(Button):
         """
         Load switch images.
         """
-        load_img = pg.image.load
-
         # on
-        self.__on_img = load_img(SWITCH_ON_IMG).convert_alpha()
-        self.__on_hover_img = load_img(SWITCH_ON_HOVER_IMG).convert_alpha()
+        self.__on_img = load_image(SWITCH_ON_IMG)
+        self.__on_hover_img = load_image(SWITCH_ON_HOVER_IMG)
 
         # off
-        self.__off_img = load_img(SWITCH_OFF_IMG).convert_alpha()
-        self.__off_hover_img = load_img(SWITCH_OFF_HOVER_IMG).convert_alpha()
+        self.__off_img = load_image(SWITCH_OFF_IMG)
+        self.__off_hover_img = load_image(SWITCH_OFF_HOVER_IMG)
 
     def __get_image(self) -> pg.Surface:
         """
@@ -428,15 +425,13 @@ class MuteToggle(Button):
         """
         Load mute toggle images.
         """
-        load_img = pg.image.load
-
         # mute images
-        self.__mute_normal = load_img(MUTE_IMG).convert_alpha()
-        self.__mute_hover = load_img(MUTE_HOVER_IMG).convert_alpha()
+        self.__mute_normal = load_image(MUTE_IMG)
+        self.__mute_hover = load_image(MUTE_HOVER_IMG)
 
         # un-mute images
-        self.__un_mute_normal = load_img(UN_MUTE_IMG).convert_alpha()
-        self.__un_mute_hover = load_img(UN_MUTE_HOVER_IMG).convert_alpha()
+        self.__un_mute_normal = load_image(UN_MUTE_IMG)
+        self.__un_mute_hover = load_image(UN_MUTE_HOVER_IMG)
 
     def __set_image(self) -> None:
         """
@@ -0,0 +1,159 @@
+"""
+Analytic collider shapes - circles, axis aligned boxes & capsules (segments with a radius).
+Boxes are pygame Rects (pixel bounds), so box-box tests are Rect.colliderect().
+Shapes which touch collide (same as pygame's collide_circle()).
+Masks are kept for the sprites whose outline matters (player & zombies) & can be tested against a box.
+"""
+
+from . import pg
+
+from typing import NamedTuple
+
+AABB = pg.Rect  # axis aligned box
+
+_filled_masks = {}  # size -> mask with all bits set (boxes tested against masks)
+
+
+class Circle(NamedTuple):
+    """
+    Circle.
+    """
+    x: float
+    y: float
+    radius: float
+
+
+class Capsule(NamedTuple):
+    """
+    Capsule - every point within the radius of the segment (x1, y1) - (x2, y2).
+    """
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+    radius: float
+
+
+def get_mask_bounds(mask: pg.mask.Mask) -> AABB:
+    """
+    Get the box which bounds the set bits of a mask (relative to the mask).
+    :param mask: mask
+    :return: box
+    """
+    rects = mask.get_bounding_rects()
+    return rects[0].unionall(rects[1:]) if rects else AABB(0, 0, 0, 0)
+
+
+def get_point_segment_distance(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Get squared distance of a point from a segment.
+    :param x: point x
+    :param y: point y
+    :param x1: segment start x
+    :param y1: segment start y
+    :param x2: segment end x
+    :param y2: segment end y
+    :return: squared distance
+    """
+    dx, dy = x2 - x1, y2 - y1
+    length = dx * dx + dy * dy
+    t = 0 if length == 0 else min(1, max(0, ((x - x1) * dx + (y - y1) * dy) / length))
+    px, py = x1 + t * dx - x, y1 + t * dy - y
+    return px * px + py * py
+
+
+def get_point_box_distance(x: float, y: float, box: AABB) -> float:
+    """
+    Get squared distance of a point from a box (0 inside).
+    :param x: point x
+    :param y: point y
+    :param box: box
+    :return: squared distance
+    """
+    left, top, width, height = box
+    dx = left - x if x < left else x - left - width if x > left + width else 0
+    dy = top - y if y < top else y - top - height if y > top + height else 0
+    return dx * dx + dy * dy
+
+
+def circle_circle(a: Circle, b: Circle, ratio: float = 1) -> bool:
+    """
+    Test circle-circle collision.
+    :param a: circle
+    :param b: circle
+    :param ratio: radius multiplier of both circles (like pygame's collide_circle_ratio())
+    :return: True if they collide
+    """
+    dx, dy, radius = a.x - b.x, a.y - b.y, (a.radius + b.radius) * ratio
+    return dx * dx + dy * dy <= radius * radius
+
+
+def circle_box(circle: Circle, box: AABB) -> bool:
+    """
+    Test circle-box collision (the point of the box closest to the center is within the radius).
+    :param circle: circle
+    :param box: box
+    :return: True if they collide
+    """
+    x, y, radius = circle
+    left, top, width, height = box
+    dx = left - x if x < left else x - left - width if x > left + width else 0
+    dy = top - y if y < top else y - top - height if y > top + height else 0
+    return dx * dx + dy * dy <= radius * radius
+
+
+def box_box(a: AABB, b: AABB) -> bool:
+    """
+    Test box-box collision.
+    :param a: box
+    :param b: box
+    :return: True if they overlap
+    """
+    return a.colliderect(b)
+
+
+def capsule_circle(capsule: Capsule, circle: Circle) -> bool:
+    """
+    Test capsule-circle collision (distance of the center from the segment).
+    :param capsule: capsule
+    :param circle: circle
+    :return: True if they collide
+    """
+    radius = capsule.radius + circle.radius
+    return get_point_segment_distance(circle.x, circle.y, *capsule[:4]) <= radius * radius
+
+
+def capsule_box(capsule: Capsule, box: AABB) -> bool:
+    """
+    Test capsule-box collision.
+    If the segment doesn't cross the box, the closest points are an end of the segment or a corner of the box.
+    :param capsule: capsule
+    :param box: box
+    :return: True if they collide
+    """
+    x1, y1, x2, y2, radius = capsule
+    left, top, width, height = box
+    if max(x1, x2) + radius < left or min(x1, x2) - radius > left + width or \
+            max(y1, y2) + radius < top or min(y1, y2) - radius > top + height:
+        return False  # bounds of the capsule don't touch the box
+    if box.clipline(x1, y1, x2, y2):
+        return True
+    squared = radius * radius
+    if get_point_box_distance(x1, y1, box) <= squared or get_point_box_distance(x2, y2, box) <= squared:
+        return True
+    return any(get_point_segment_distance(x, y, x1, y1, x2, y2) <= squared
+               for x, y in (box.topleft, box.topright, box.bottomleft, box.bottomright))
+
+
+def mask_box(mask: pg.mask.Mask, topleft: tuple, box: AABB) -> bool:
+    """
+    Test mask-box collision (a set bit of the mask is inside the box).
+    :param mask: mask
+    :param topleft: mask position
+    :param box: box
+    :return: True if they collide
+    """
+    filled = _filled_masks.get(box.size)
+    if filled is None:
+        filled = _filled_masks[box.size] = pg.Mask(box.size, fill=True)
+    return mask.overlap(filled, (box.x - topleft[0], box.y - topleft[1])) is not None
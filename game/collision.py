@@ -0,0 +1,469 @@
+from . import pg
+from .config import COLLISION_CELL_SIZE, SAW_HIT_RATIO, BULLET_COLLISION_LAYERS, DYNAMIC_HITS, PLAYER_LAYER, \
+    ZOMBIE_LAYER, SAW_LAYER, ITEM_LAYER
+from .colliders import Circle, get_mask_bounds, circle_circle, circle_box, mask_box
+
+from math import hypot
+from operator import itemgetter
+
+ALL_LAYERS = ~0  # layer mask of every collision layer
+
+collide_mask = pg.sprite.collide_mask
+
+
+def get_rect_circle(sprite) -> Circle:
+    """
+    Get the circle through the corners of the sprite's rect (as in pygame's collide_circle()).
+    :param sprite: sprite
+    :return: circle
+    """
+    return Circle(*sprite.rect.center, hypot(*sprite.rect.size) / 2)
+
+
+def collide_beam(sprite, laser) -> bool:
+    """
+    Sprite-laser beam collision (the beam is a box).
+    :param sprite: sprite with a mask
+    :param laser: laser beam
+    :return: True if they collide
+    """
+    return mask_box(sprite.mask, sprite.rect.topleft, laser.get_collider())
+
+
+def collide_pair(sprite, other) -> bool:
+    """
+    Exact test of a pair of moving sprites - saws are circles (hit by bullets, whose masks fill their rects),
+    the other sprites are tested with their masks.
+    :param sprite: hitting sprite
+    :param other: hit sprite
+    :return: True if they collide
+    """
+    if other.collision_layer == SAW_LAYER:
+        return circle_box(other.get_collider(), sprite.rect)
+    return collide_mask(sprite, other)
+
+
+def get_mask_rect(sprite) -> pg.Rect:
+    """
+    Get the rect which bounds the sprite's mask (masks of animated sprites can be bigger than their rect).
+    Sprites without a mask are tested with a mask of their image, which has the size of their rect.
+    :param sprite: sprite with a rect (& a mask)
+    :return: bounding rect
+    """
+    mask = getattr(sprite, 'mask', None)
+    return sprite.rect if mask is None else pg.Rect(sprite.rect.topleft, mask.get_size())
+
+
+def get_hits(sprite, sprites: list, rects: list, collided=collide_mask) -> list:
+    """
+    Get the sprites hit by a sprite - rects which overlap (broad phase), then the exact test (narrow phase).
+    :param sprite: sprite
+    :param sprites: other sprites
+    :param rects: rects of the other sprites (bounding their masks for a mask test)
+    :param collided: exact collision test (None to use only the rects)
+    :return: hit sprites (which weren't killed by an earlier hit)
+    """
+    rect = get_mask_rect(sprite) if collided is collide_mask else sprite.rect
+    hits = [sprites[index] for index in rect.collidelistall(rects)]
+    return [other for other in hits if other.alive() and (collided is None or collided(sprite, other))]
+
+
+def sweep(last_rect, rect, rects: list):
+    """
+    Sweep a moving rect along its path since the last frame (continuous collision detection), so rects it passed
+    through between two frames are found too. The path of its top left corner is clipped by the other rects
+    grown by its size (top left positions where the rects overlap).
+    Empty rects are skipped (colliderect() never finds them).
+    :param last_rect: rect before the move
+    :param rect: rect after the move
+    :param rects: other rects
+    :return: (distance along the path, top left position where it hits) of the first hit rect, None if none is hit
+    """
+    start, end = last_rect.topleft, rect.topleft
+    width, height = rect.size
+    first = None
+    for other in rects:
+        if other.width and other.height:
+            grown = pg.Rect(other.left - width + 1, other.top - height + 1, other.width + width - 1,
+                            other.height + height - 1)
+            clipped = grown.clipline(start, end)
+            if clipped:
+                distance = abs(clipped[0][0] - start[0]) + abs(clipped[0][1] - start[1])
+                if first is None or distance < first[0]:
+                    first = (distance, clipped[0])
+    return first
+
+
+def collide_at(sprite, topleft: tuple, other) -> bool:
+    """
+    Exact test of a moving sprite at another position (the same test as collide_pair()).
+    :param sprite: hitting sprite (with a mask)
+    :param topleft: top left position of its rect
+    :param other: hit sprite
+    :return: True if they collide
+    """
+    if other.collision_layer == SAW_LAYER:
+        return circle_box(other.get_collider(), pg.Rect(topleft, sprite.rect.size))
+    return other.mask.overlap(sprite.mask, (topleft[0] - other.rect.x, topleft[1] - other.rect.y)) is not None
+
+
+def sweep_sprites(sprite, last_rect, sprites: list):
+    """
+    Sweep a moving sprite along its path since the last frame against moving sprites (at their position
+    in this frame). The part of the path inside the bounds of each sprite (grown by the sprite's size, as in sweep())
+    is walked a pixel at a time with the exact test, so it stops where the masks touch, not at the bounds.
+    :param sprite: hitting sprite (with a mask)
+    :param last_rect: its rect before the move
+    :param sprites: sprites it hits
+    :return: (distance along the path, top left position where it hits) of the first hit sprite, None if none is hit
+    """
+    start, end = last_rect.topleft, sprite.rect.topleft
+    width, height = sprite.rect.size
+    first = None
+    for other in sprites:
+        bounds = get_mask_rect(other)
+        grown = pg.Rect(bounds.left - width + 1, bounds.top - height + 1, bounds.width + width - 1,
+                        bounds.height + height - 1)
+        clipped = grown.clipline(start, end)
+        if clipped:
+            (x1, y1), (x2, y2) = clipped
+            steps = max(abs(x2 - x1), abs(y2 - y1))
+            for step in range(steps + 1):
+                position = (x1 + round((x2 - x1) * step / steps), y1 + round((y2 - y1) * step / steps)) if steps \
+                    else (x1, y1)
+                distance = abs(position[0] - start[0]) + abs(position[1] - start[1])
+                if first is not None and distance >= first[0]:
+                    break
+                if collide_at(sprite, position, other):
+                    first = (distance, position)
+                    break
+    return first
+
+
+class SpatialHash:
+    """
+    Uniform grid of static sprites (obstacles) - every cell keeps the sprites whose rects overlap it,
+    so a collision query tests only the sprites near the queried rect instead of the whole group.
+    Sprites are partitioned by their collision layer (a grid for each layer), so a query with a layer mask
+    looks only into the grids of those layers.
+    Query results are in the order the sprites were added (same order as spritecollide() on their group).
+    """
+
+    def __init__(self, sprites=(), cell_size: int = COLLISION_CELL_SIZE):
+        """
+        Make the grid.
+        :param sprites: sprites to add (they must not move)
+        :param cell_size: width & height of a cell (px)
+        """
+        self.__cell_size = cell_size
+        self.__layers = {}  # collision layer -> cells: (column, row) -> indexes of the sprites in the cell
+        self.__sprites = []
+        for sprite in sprites:
+            self.add(sprite)
+
+    def __len__(self) -> int:
+        """
+        Number of sprites in the grid.
+        :return: number of sprites
+        """
+        return len(self.__sprites)
+
+    def add(self, sprite) -> None:
+        """
+        Add a sprite to every cell its rect overlaps (in the grid of its collision layer).
+        :param sprite: sprite with a rect & a collision layer
+        """
+        index = len(self.__sprites)
+        self.__sprites.append(sprite)
+
+        size = self.__cell_size
+        rect = sprite.rect
+        cells = self.__layers.setdefault(sprite.collision_layer, {})
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                cells.setdefault((column, row), []).append(index)
+
+    def query(self, rect, layers: int = ALL_LAYERS) -> list:
+        """
+        Get the sprites colliding with a rect.
+        :param rect: rect
+        :param layers: layer mask (only sprites in these collision layers are returned)
+        :return: colliding sprites
+        """
+        size = self.__cell_size
+        columns = range(rect.left // size, (rect.right - 1) // size + 1)
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        found = set()
+        for layer, cells in self.__layers.items():
+            if layer & layers:
+                for column in columns:
+                    for row in rows:
+                        indexes = cells.get((column, row))
+                        if indexes:
+                            found.update(indexes)
+
+        sprites = self.__sprites
+        return [sprites[index] for index in sorted(found) if rect.colliderect(sprites[index].rect)]
+
+    def collide(self, sprite, layers: int = ALL_LAYERS) -> list:
+        """
+        Get the sprites colliding with a sprite (like spritecollide(sprite, group, False)).
+        :param sprite: sprite with a rect
+        :param layers: layer mask (only sprites in these collision layers are returned)
+        :return: colliding sprites
+        """
+        return self.query(sprite.rect, layers)
+
+    def get_stats(self) -> dict:
+        """
+        Get grid statistics.
+        :return: number of sprites, sprites in each layer, used cells & average number of sprites in a used cell
+        """
+        layers = {layer: len({index for indexes in cells.values() for index in indexes})
+                  for layer, cells in self.__layers.items()}
+        cell_count = sum(len(cells) for cells in self.__layers.values())
+        entries = sum(len(indexes) for cells in self.__layers.values() for indexes in cells.values())
+        return {'sprites': len(self.__sprites), 'layers': layers, 'cells': cell_count,
+                'per_cell': entries / cell_count if cell_count else 0}
+
+
+class SweepAndPrune:
+    """
+    Incremental sweep & prune broad phase of the moving sprites.
+    The bounds of the sprites are kept sorted by their left edge between frames. Sprites move only a few pixels
+    a frame, so the order barely changes and sorting it again takes about linear time (list.sort() is adaptive -
+    it finds the sorted runs & merges them, which is faster than an insertion sort in Python).
+    The sweep along the x axis compares only sprites whose x intervals overlap.
+    """
+
+    def __init__(self, hits: dict = DYNAMIC_HITS):
+        """
+        Initialize sweep & prune.
+        :param hits: layer -> layers which sprites of the layer hit (only those pairs are reported)
+        """
+        self.__hits = hits
+        self.__entries = []  # [left, right, top, bottom, layer, layers it hits, sprite] sorted by left
+
+    def __len__(self) -> int:
+        """
+        Number of sprites in the broad phase.
+        :return: number of sprites
+        """
+        return len(self.__entries)
+
+    def update(self, sprites: list) -> None:
+        """
+        Update the bounds & the order of the sprites (sprites which aren't given anymore are removed).
+        :param sprites: all sprites of the broad phase (with a rect & a collision layer)
+        """
+        current = set(sprites)
+        entries = [entry for entry in self.__entries if entry[6] in current]
+        if len(entries) < len(current):
+            known = {entry[6] for entry in entries}
+            entries.extend([0, 0, 0, 0, sprite.collision_layer, self.__hits.get(sprite.collision_layer, 0), sprite]
+                           for sprite in sprites if sprite not in known)
+
+        for entry in entries:
+            rect = get_mask_rect(entry[6])
+            entry[0] = rect.left
+            entry[1] = rect.right
+            entry[2] = rect.top
+            entry[3] = rect.bottom
+        entries.sort(key=itemgetter(0))
+        self.__entries = entries
+
+    def get_pairs(self) -> list:
+        """
+        Sweep - get the pairs whose bounds overlap, where one sprite hits the layer of the other.
+        :return: (hitting sprite, hit sprite) pairs
+        """
+        entries = self.__entries
+        count = len(entries)
+        pairs = []
+        for index in range(count):
+            left, right, top, bottom, layer, layer_hits, sprite = entries[index]
+            other_index = index + 1
+            while other_index < count:
+                other = entries[other_index]
+                if other[0] >= right:
+                    break  # this one & all the next ones start after the sprite ends
+                other_index += 1
+                if other[2] < bottom and top < other[3]:
+                    if layer_hits & other[4]:
+                        pairs.append((sprite, other[6]))
+                    elif other[5] & layer:
+                        pairs.append((other[6], sprite))
+        return pairs
+
+
+class CollisionPhase:
+    """
+    Collisions of the sprites which hit others (bullets, laser bullets & the player), found once a frame
+    after all sprites are updated. Bullets are swept along their path first & moved back to the first wall,
+    spike, laser or laser receiver they passed through, so they can't skip thin ones when the frame time is long.
+    Pairs of moving sprites come from the sweep & prune broad phase,
+    the sprites which don't move (hazards & receivers) are found with one Rect.collidelistall() call per group,
+    and only those candidates are tested exactly. Hits are handled by the hit handlers of the sprites.
+    """
+
+    def __init__(self, game):
+        """
+        Initialize collision phase.
+        :param game: game
+        """
+        self.__game = game
+        self.__broad_phase = SweepAndPrune()
+
+    def run(self) -> None:
+        """
+        Find & handle all hits of this frame.
+        """
+        game = self.__game
+        self.__sweep_bullets()
+
+        # moving sprites
+        sprites = game.zombies.sprites() + game.saws.sprites() + game.items.sprites() + game.bullets.sprites() + \
+            game.laser_bullets.sprites()
+        if game.player.alive():
+            sprites.append(game.player)
+        self.__broad_phase.update(sprites)
+
+        # exact test of the candidates: hitting sprite -> layer -> hit sprites
+        hits = {}
+        for sprite, other in self.__broad_phase.get_pairs():
+            if collide_pair(sprite, other):
+                hits.setdefault(sprite, {}).setdefault(other.collision_layer, []).append(other)
+
+        self.__check_bullets(hits)
+        self.__check_laser_bullets(hits)
+        self.__check_player(hits)
+
+    def __sweep_bullets(self) -> None:
+        """
+        Continuous collision detection - move the bullets & laser bullets back to the first thing they hit,
+        static (walls, spikes, lasers & laser receivers) or moving (the sprites of the layers they hit).
+        The hits are then found at that position.
+        """
+        game = self.__game
+        blockers = [spike.rect for spike in game.spikes] + [laser.get_collider() for laser in game.lasers]
+        targets = game.zombies.sprites() + game.saws.sprites() + game.laser_machines.sprites()
+        for bullet in game.bullets:
+            self.__sweep(bullet, blockers, targets, BULLET_COLLISION_LAYERS)
+
+        receivers = [get_mask_bounds(receiver.mask).move(receiver.rect.topleft)
+                     for receiver in game.laser_receivers]
+        targets = [game.player] if game.player.alive() else []
+        for laser_bullet in game.laser_bullets:
+            self.__sweep(laser_bullet, receivers, targets)
+
+    def __sweep(self, sprite, rects: list, targets: list, layers: int = 0) -> None:
+        """
+        Sweep the sprite along its path & move it back to the earliest hit - the solid part of the sprite
+        (the bounds of its mask) against the static rects, its mask against the moving targets.
+        :param sprite: bullet or laser bullet
+        :param rects: rects which stop it
+        :param targets: moving sprites it hits
+        :param layers: layer mask of the obstacles which stop it
+        """
+        last_rect = sprite.get_last_rect()
+        if last_rect.topleft == sprite.rect.topleft:
+            return  # didn't move
+
+        bounds = get_mask_bounds(sprite.mask)
+        start, end = bounds.move(last_rect.topleft), bounds.move(sprite.rect.topleft)
+        if layers:
+            rects = rects + [obstacle.rect for obstacle in self.__game.obstacle_grid.query(start.union(end), layers)]
+        hit = sweep(start, end, rects)
+        if hit:
+            hit = (hit[0], (hit[1][0] - bounds.x, hit[1][1] - bounds.y))
+
+        path = last_rect.union(sprite.rect)
+        targets = [target for target in targets if path.colliderect(get_mask_rect(target))]
+        if targets:
+            target_hit = sweep_sprites(sprite, last_rect, targets)
+            if target_hit and (hit is None or target_hit[0] < hit[0]):
+                hit = target_hit
+        if hit:
+            sprite.move_back(hit[1])
+
+    def __check_bullets(self, hits: dict) -> None:
+        """
+        Player's bullets - every hit of the bullet is handled (a bullet hitting a saw in the ground damages the saw).
+        :param hits: hits of the moving sprites
+        """
+        game = self.__game
+        bullets = game.bullets.sprites()
+        if not bullets:
+            return
+
+        spikes = game.spikes.sprites()
+        spike_rects = [spike.rect for spike in spikes]
+        lasers = game.lasers.sprites()
+        laser_rects = [laser.get_collider() for laser in lasers]
+        machines = game.laser_machines.sprites()
+        machine_rects = [get_mask_rect(machine) for machine in machines]
+
+        for bullet in bullets:
+            bullet_hits = hits.get(bullet, {})
+
+            # zombies
+            if ZOMBIE_LAYER in bullet_hits:
+                bullet.hit_zombies(bullet_hits[ZOMBIE_LAYER])
+
+            # walls
+            if game.solid_map.collide_rect(bullet.rect):
+                bullet.kill()
+
+            # saws (which weren't destroyed by another bullet)
+            saws = [saw for saw in bullet_hits.get(SAW_LAYER, ()) if saw.alive()]
+            if saws:
+                bullet.hit_saws(saws)
+
+            # spikes & lasers
+            if get_hits(bullet, spikes, spike_rects, None) or get_hits(bullet, lasers, laser_rects, collide_beam):
+                bullet.kill()
+
+            # laser machines
+            machines_hit = get_hits(bullet, machines, machine_rects)
+            if machines_hit:
+                bullet.hit_laser_machines(machines_hit)
+
+    def __check_laser_bullets(self, hits: dict) -> None:
+        """
+        Laser bullets - killed when they hit the player or a laser receiver.
+        :param hits: hits of the moving sprites
+        """
+        game = self.__game
+        laser_bullets = game.laser_bullets.sprites()
+        if not laser_bullets:
+            return
+
+        receivers = game.laser_receivers.sprites()
+        receiver_rects = [get_mask_rect(receiver) for receiver in receivers]
+        for laser_bullet in laser_bullets:
+            if PLAYER_LAYER in hits.get(laser_bullet, {}):
+                laser_bullet.hit_player()
+            elif get_hits(laser_bullet, receivers, receiver_rects):
+                laser_bullet.kill()
+
+    def __check_player(self, hits: dict) -> None:
+        """
+        Player - zombie attacks, saws & item pickup.
+        :param hits: hits of the moving sprites
+        """
+        game = self.__game
+        player = game.player
+        if not player.alive():
+            return
+
+        player_hits = hits.get(player, {})
+        player.hit_zombies(player_hits.get(ZOMBIE_LAYER, []))
+
+        # circles a bit smaller than the sprites - they can touch when the rects don't, so all saws (a few) are tested
+        player_circle = get_rect_circle(player)
+        saws = [saw for saw in game.saws if circle_circle(player_circle, saw.get_collider(), SAW_HIT_RATIO)]
+        if saws:
+            player.hit_saws(saws)
+
+        if ITEM_LAYER in player_hits:
+            player.pick_up_items(player_hits[ITEM_LAYER])
@@ -0,0 +1,52 @@
+"""
+Level compiler.
+Compiles all maps into binary level files (tile layers, rendered map image & spawn tables),
+so starting a level doesn't parse the .tmx file & render the tiles.
+The obstacles are merged into the fewest rects which cover the same pixels (greedy meshing).
+Levels are also compiled when they are loaded from the .tmx file (COMPILE_LEVELS), this compiles them ahead of time.
+Run with: python -m game.compile
+"""
+
+from . import pg
+from .config import LEVEL_DIR, LEVELS
+from .tilemap import load_tmx, render_map
+from .levelfile import write_level, get_spawn_objects
+from .meshing import merge_obstacles
+
+import time
+
+MAPS = tuple(level['map'] for level in LEVELS)
+
+
+def compile_levels(directory: str = LEVEL_DIR) -> list:
+    """
+    Compile all maps.
+    :param directory: compiled levels directory
+    :return: list of (map file, level file size, compile time in ms, obstacles in the map, merged obstacles)
+    """
+    results = []
+    for filename in MAPS:
+        start = time.perf_counter()
+        tiled_map = load_tmx(filename)
+        obstacles = [tile_object for tile_object in get_spawn_objects(tiled_map) if tile_object.name == 'obstacle']
+        merged = merge_obstacles(obstacles)
+        size = write_level(filename, tiled_map, render_map(tiled_map), merged, directory)
+        results.append((filename, size, (time.perf_counter() - start) * 1000, len(obstacles), len(merged)))
+    return results
+
+
+def main() -> None:
+    """
+    Compile the levels (a hidden window is needed for converting the tileset).
+    """
+    pg.display.init()
+    pg.display.set_mode((1, 1), pg.HIDDEN)
+
+    for filename, size, elapsed, obstacles, merged in compile_levels():
+        print('Compiled {map} ({kib:.1f} KiB) in {ms:.0f} ms, {obstacles} obstacles merged into {merged}'.format(
+            map=filename, kib=size / 1024, ms=elapsed, obstacles=obstacles, merged=merged))
+    print('Levels written to', LEVEL_DIR)
+
+
+if __name__ == '__main__':
+    main()
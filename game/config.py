@@ -14,6 +14,9 @@ MENU_SOUNDS_DIR = join(BASE_DIR, 'assets/audio/snd/menu')
 PLAYER_SOUNDS_DIR = join(BASE_DIR, 'assets/audio/snd/player')
 ZOMBIE_SOUNDS_DIR = join(BASE_DIR, 'assets/audio/snd/mob')
 SFX_DIR = join(BASE_DIR, 'assets/audio/snd/sfx')
+BAKE_DIR = join(BASE_DIR, 'assets/cache')  # made by: python -m game.bake
+SOUND_CACHE_DIR = join(BAKE_DIR, 'sounds')  # decoded sounds (None to decode the sound files every time)
+LEVEL_DIR = join(BAKE_DIR, 'levels')  # compiled levels (made by: python -m game.compile)
 
 # ========== GENERAL SETTINGS ==========
 GAME_TITLE = 'IS-Shifty'
@@ -22,11 +25,32 @@ VERSION = 'v1.1'
 WIDTH = 1920
 HEIGHT = 1080
 
-FPS = 60
-TARGET_FPS = 60
+FPS = 60  # frame rate cap (bullets are swept along their path, so a lower one like 30 works on slow machines)
+TARGET_FPS = 60  # frame rate the movement speeds are set for (delta_time is 1 at this frame rate)
 
 SETTINGS_FILE = join(BASE_DIR, 'settings.json')
 
+# ========== BAKED ASSETS ==========
+BAKE_VERSION = 2  # change when the way frames are made or indexed changes (invalidates the baked frames)
+BAKE_FORMAT = 'BGRA'  # raw pixel format of the baked frames (same byte order as the display surface)
+PACK_FILE = join(BAKE_DIR, 'assets.pack')  # made by: python -m game.pack
+PACK_VERSION = 1
+LEVEL_VERSION = 2  # change when the compiled level format changes (invalidates the compiled levels)
+COMPILE_LEVELS = True  # compile a level when it's loaded from the .tmx file (not compiled yet or changed)
+MERGE_OBSTACLES = True  # spawn the obstacles merged into the fewest rects when compiling (same pixels)
+
+# ========== ASSET LOADER ==========
+LOADER_THREADS = 4  # worker threads which decode the assets at startup
+LOADER_FRAME_TIME = 1 / 30  # time between two frames of the loading screen (s)
+SHOW_LOAD_TIMES = False  # print per-asset load times after loading
+
+# ========== MUSIC ==========
+MUSIC_FADE_TIME = 500  # fade out & fade in time when music tracks change (ms)
+GAME_MUSIC_VOLUME = 0.5
+
+# ========== SOUNDS ==========
+PREWARM_SOUNDS = True  # load sound effects in the background after startup (otherwise when first played)
+
 # ========== FONTS ==========
 TITLE_FONT = join(FONTS_DIR, 'ZOMBIE.TTF')
 FONT = join(FONTS_DIR, 'Impacted2.0.TTF')
@@ -36,6 +60,64 @@ MAP1 = join(MAP_DIR, 'map_1.tmx')
 MAP2 = join(MAP_DIR, 'map_2.tmx')
 MAP3 = join(MAP_DIR, 'map_3.tmx')
 
+# ========== LEVELS ==========
+# level manifest: map, game timer seconds & what the player keeps from the previous level
+LEVELS = (
+    {'map': MAP1, 'seconds': 180, 'keep': ()},
+    {'map': MAP2, 'seconds': 180, 'keep': ('health', 'score')},
+    {'map': MAP3, 'seconds': 180, 'keep': ('health', 'score')},
+)
+LEVEL_LOAD_BUDGET = 0.008  # time for loading the next level in one frame (s), the rest of the frame is drawing
+WARN_SLOW_LOAD_STEPS = False  # print a warning when one level loading step takes longer than LEVEL_LOAD_BUDGET
+PRELOAD_LEVELS = True  # prepare the next level in the background (level 1 in the menus)
+LEVEL_CACHE_SIZE = 3  # prepared levels kept in memory (playing them again doesn't load them)
+LEVEL_CACHE_MEMORY = 96 * 2 ** 20  # max bytes held by the prepared levels (~28 MB a level: map image & solid map)
+RESTORE_BATCH_SIZE = 20  # sprites reset between two steps of restarting a level from its snapshot
+
+# ========== COLLISIONS ==========
+COLLISION_CELL_SIZE = 128  # cell size of the obstacle grid (px)
+SAW_HIT_RATIO = 0.9  # player-saw collision (circles a bit smaller than the sprites)
+
+# collision layers (bits of a layer mask) - obstacles are in the layer of their type, sprites query only their layers
+GROUND_LAYER = 1
+ZOMBIE_LIMIT_LAYER = 2
+SAW_LIMIT_UP_LAYER = 4
+SAW_LIMIT_DOWN_LAYER = 8
+SAW_LIMIT_LEFT_LAYER = 16
+SAW_LIMIT_RIGHT_LAYER = 32
+OBSTACLE_LAYERS = {  # obstacle type (in Tiled) -> collision layer
+    'ground': GROUND_LAYER,
+    'zombie_limit': ZOMBIE_LIMIT_LAYER,
+    'saw_limit_up': SAW_LIMIT_UP_LAYER,
+    'saw_limit_down': SAW_LIMIT_DOWN_LAYER,
+    'saw_limit_left': SAW_LIMIT_LEFT_LAYER,
+    'saw_limit_right': SAW_LIMIT_RIGHT_LAYER
+}
+PLAYER_COLLISION_LAYERS = GROUND_LAYER
+ZOMBIE_COLLISION_LAYERS = GROUND_LAYER | ZOMBIE_LIMIT_LAYER
+BULLET_COLLISION_LAYERS = GROUND_LAYER
+SOLID_MAP_LAYERS = GROUND_LAYER  # obstacles drawn into the solid map of a level (has the layers bullets hit)
+
+# layers of the moving sprites (sweep & prune broad phase) & the layers each one hits
+PLAYER_LAYER = 64
+ZOMBIE_LAYER = 128
+BULLET_LAYER = 256
+LASER_BULLET_LAYER = 512
+SAW_LAYER = 1024
+ITEM_LAYER = 2048
+DYNAMIC_HITS = {  # layer -> layers it hits
+    BULLET_LAYER: ZOMBIE_LAYER | SAW_LAYER,
+    LASER_BULLET_LAYER: PLAYER_LAYER,
+    PLAYER_LAYER: ZOMBIE_LAYER | ITEM_LAYER
+}
+
+# ========== SAVE GAMES ==========
+SAVE_DIR = join(BASE_DIR, 'saves')
+QUICK_SAVE_FILE = join(SAVE_DIR, 'quicksave.sav')  # F5 saves, F9 loads the latest save
+AUTO_SAVE_FILE = join(SAVE_DIR, 'autosave.sav')
+SAVE_VERSION = 1  # change when the save format changes (older saves aren't loaded)
+AUTO_SAVE_INTERVAL = 30000  # time between autosaves while playing (ms, 0 turns autosave off)
+
 # ========== COLORS ==========
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -70,6 +152,7 @@ BULLET_DAMAGE = 15
 BULLET_UPGRADED_DAMAGE = 20
 BULLET_RATE = 250
 BULLET_LIFETIME = 1000
+BULLET_SCALE = (1 / 1.5, 1 / 1.5)  # bullet frames size (width & height multipliers)
 
 # zombie
 ZOMBIE_ACC = 0.1
@@ -92,6 +175,7 @@ SAW_DAMAGE = 30
 SAW_HEALTH = 16
 SAW_SPEED = 1
 SAW_KNOCK_BACK = (1, 1)
+SAW_ROTATION_STEP = 15  # degrees between two rotation frames
 
 # laser
 LASER_DAMAGE = 1
@@ -129,3 +213,5 @@ LAYERS = {
 DAMAGE_ALPHA = [i for i in range(0, 255, 25)]
 FLASH_DURATION = 40
 EXPLOSION_DURATION = 800
+MUZZLE_FLASH_SCALE = (2, 1.2)  # muzzle flash frames size (width & height multipliers)
+EXPLOSION_SCALE = (0.5, 0.5)  # explosion frames size (width & height multipliers)
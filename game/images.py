@@ -1,10 +1,34 @@
 from os.path import join
-from .config import SPRITE_SHEET_DIR, IMAGES_DIR
+from .config import SPRITE_SHEET_DIR, IMAGES_DIR, BULLET_SCALE, MUZZLE_FLASH_SCALE, EXPLOSION_SCALE
 
 PLAYER_SPRITE_SHEET = join(SPRITE_SHEET_DIR, 'player_sprites.png')
 ZOMBIE_SPRITE_SHEET = join(SPRITE_SHEET_DIR, 'zombies.png')
 EXPLOSION_SPRITE_SHEET = join(SPRITE_SHEET_DIR, 'explosion.png')
 
+# animation clips used in the game (baked by: python -m game.bake)
+# sprite sheet -> name of the animation -> (number of frames, width & height multipliers)
+ANIMATION_CLIPS = {
+    PLAYER_SPRITE_SHEET: {
+        'idle': (10, None),
+        'jump': (10, None),
+        'jump_shoot': (5, None),
+        'run': (8, None),
+        'run_shoot': (9, None),
+        'shoot': (4, None),
+        'slide': (10, None),
+        'bullet': (5, BULLET_SCALE),
+        'muzzle': (5, MUZZLE_FLASH_SCALE)
+    },
+    ZOMBIE_SPRITE_SHEET: {
+        'attack': (8, None),
+        'idle': (15, None),
+        'walk': (10, None)
+    },
+    EXPLOSION_SPRITE_SHEET: {
+        'explosion': (9, EXPLOSION_SCALE)
+    }
+}
+
 BULLET_ICON = join(IMAGES_DIR, 'objects/bullet_icon.png')
 
 KEY_IMAGE = join(IMAGES_DIR, 'objects/key.png')
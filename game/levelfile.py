@@ -0,0 +1,338 @@
+"""
+Compiled levels.
+A level (.tmx map) is compiled into one binary file with its tile layers, the rendered map image & spawn tables,
+so loading a level doesn't parse the .tmx file, load the tileset or render the tiles again.
+The file is memory-mapped; it's used only if the map, tilesets & tileset images didn't change after compiling.
+"""
+
+from . import pg
+from .config import LEVEL_DIR, LEVEL_VERSION, BAKE_FORMAT
+from .pack import open_asset
+
+from os import makedirs, replace, stat
+from os.path import join, basename, splitext, dirname, normpath, relpath
+from hashlib import sha1
+from typing import NamedTuple
+from array import array
+import json
+import mmap
+import struct
+
+LEVEL_MAGIC = b'SHFTLEVL'
+HEADER = struct.Struct('<8sII')  # magic, version, metadata size
+SPAWN_OBJECT = struct.Struct('<3H5d')  # name, type & properties (string indices), x, y, width, height, rotation
+ALIGNMENT = 16  # data blocks start at multiples of this
+
+# Tiled GID flags (flipped horizontally, vertically & diagonally)
+GID_FLAGS = (1 << 31, 1 << 30, 1 << 29)
+
+
+class SpawnObject(NamedTuple):
+    """
+    Object from the map's object layers (obstacle, zombie, item...).
+    Has the same attributes as pytmx objects which the game uses.
+    """
+    name: str
+    type: str
+    x: float
+    y: float
+    width: float
+    height: float
+    rotation: float
+    properties: dict
+
+
+def get_level_file(filename: str, directory: str = LEVEL_DIR) -> str:
+    """
+    Get the compiled level file of the map.
+    :param filename: .tmx (map) file
+    :param directory: compiled levels directory
+    :return: compiled level file
+    """
+    return join(directory, splitext(basename(filename))[0] + '.lvl')
+
+
+def hash_file(path: str) -> str:
+    """
+    Hash the file (from the asset pack if it's packed).
+    :param path: file
+    :return: hex digest
+    """
+    with open_asset(path) as f:
+        return sha1(f.read()).hexdigest()
+
+
+def get_source_info(path: str) -> list:
+    """
+    Get modification time, size & hash of a source file of the level.
+    :param path: map, tileset or tileset image file
+    :return: [mtime (ns), size, hash] (mtime & size are None if the file is only in the asset pack)
+    """
+    try:
+        info = stat(path)
+        mtime, size = info.st_mtime_ns, info.st_size
+    except OSError:
+        mtime = size = None
+    return [mtime, size, hash_file(path)]
+
+
+def is_source_unchanged(path: str, info: list) -> bool:
+    """
+    Check if a source file of the level didn't change after compiling.
+    The modification time & size are checked first, the file is hashed only if they are different.
+    :param path: map, tileset or tileset image file
+    :param info: [mtime (ns), size, hash] from compiling
+    :return: True if unchanged
+    """
+    mtime, size, digest = info
+    try:
+        current = stat(path)
+        if mtime is not None and current.st_mtime_ns == mtime and current.st_size == size:
+            return True
+    except OSError:
+        pass
+    try:
+        return hash_file(path) == digest
+    except OSError:
+        return False
+
+
+def get_tile_layers(tiled_map) -> list:
+    """
+    Get the tile layers of the pytmx map as Tiled GIDs (with flip flags, 0 = no tile).
+    :param tiled_map: pytmx map
+    :return: list of (layer name, visible, GIDs row by row)
+    """
+    # pytmx renumbers the tiles, map its GIDs back to the ones in the .tmx file
+    tiled_gids = {0: 0}
+    for tiled_gid, gids in tiled_map.gidmap.items():
+        for gid, flags in gids:
+            if flags is not None:
+                for flag, bit in zip(flags, GID_FLAGS):
+                    if flag:
+                        tiled_gid |= bit
+            tiled_gids[gid] = tiled_gid
+
+    layers = []
+    for layer in tiled_map.layers:
+        if hasattr(layer, 'data'):
+            gids = array('I', (tiled_gids.get(gid, 0) for row in layer.data for gid in row))
+            layers.append((layer.name, bool(layer.visible), gids))
+    return layers
+
+
+def get_spawn_objects(tiled_map) -> tuple:
+    """
+    Get all objects of the pytmx map.
+    :param tiled_map: pytmx map
+    :return: spawn objects
+    """
+    return tuple(SpawnObject(tile_object.name, tile_object.type, tile_object.x, tile_object.y, tile_object.width,
+                             tile_object.height, tile_object.rotation, dict(tile_object.properties))
+                 for tile_object in tiled_map.objects)
+
+
+def make_layer_view(data, width: int, height: int) -> memoryview:
+    """
+    Make a 2D view of the layer's GIDs (indexed as layer[y, x]).
+    :param data: GIDs as bytes
+    :param width: layer width (tiles)
+    :param height: layer height (tiles)
+    :return: read-only view
+    """
+    return memoryview(data).toreadonly().cast('B').cast('I', (height, width))
+
+
+def copy_pixels(data, size: tuple) -> pg.Surface:
+    """
+    Copy raw pixels into a new (opaque) surface.
+    If the surface has the same pixel layout as the data, it's a plain memory copy, otherwise the pixels are converted.
+    :param data: pixels (BAKE_FORMAT)
+    :param size: width & height
+    :return: surface
+    """
+    width, height = size
+    image = pg.Surface(size)
+    masks = pg.image.frombuffer(bytes(4), (1, 1), BAKE_FORMAT).get_masks()[:3]
+    if image.get_bytesize() != 4 or image.get_pitch() != width * 4 or image.get_masks()[:3] != masks:
+        image.blit(pg.image.frombuffer(data, size, BAKE_FORMAT), (0, 0))
+        return image
+
+    pixels = image.get_view('1')  # locks the surface until it's released
+    view = memoryview(pixels)
+    view.cast('B')[:] = data
+    view.release()
+    del pixels
+    return image
+
+
+class CompiledLevel:
+    """
+    Compiled level mapped from its file.
+    Tile layers are views into the map, the map image is copied out of it into a surface.
+    """
+
+    def __init__(self, data: mmap.mmap, metadata: dict, offset: int):
+        """
+        Initialize compiled level.
+        :param data: mapped file
+        :param metadata: level metadata
+        :param offset: start of the data blocks
+        """
+        self.__data = data
+        self.__view = memoryview(data)[offset:]
+        self.__metadata = metadata
+
+        self.width = metadata['width'] * metadata['tilewidth']
+        self.height = metadata['height'] * metadata['tileheight']
+        self.tile_size = (metadata['tilewidth'], metadata['tileheight'])
+
+        # tile layers
+        self.layers = {}
+        self.visible_layers = []
+        for name, visible, start in metadata['layers']:
+            size = metadata['width'] * metadata['height'] * 4
+            self.layers[name] = make_layer_view(self.__view[start:start + size], metadata['width'],
+                                                metadata['height'])
+            if visible:
+                self.visible_layers.append(name)
+
+        # spawn tables (objects of the map & the obstacles merged when compiling)
+        self.objects = self.__read_objects(metadata['objects'])
+        self.obstacles = self.__read_objects(metadata['obstacles'])
+
+    def __read_objects(self, block: tuple) -> tuple:
+        """
+        Read a spawn table.
+        :param block: start & number of objects
+        :return: spawn objects
+        """
+        strings = self.__metadata['strings']
+        start, count = block
+        return tuple(
+            SpawnObject(strings[name], strings[object_type], x, y, width, height, rotation,
+                        json.loads(strings[properties]))
+            for name, object_type, properties, x, y, width, height, rotation
+            in SPAWN_OBJECT.iter_unpack(self.__view[start:start + count * SPAWN_OBJECT.size]))
+
+    def make_image(self) -> pg.Surface:
+        """
+        Make the map image (copy of the rendered map).
+        :return: map image
+        """
+        start, width, height = self.__metadata['image']
+        return copy_pixels(self.__view[start:start + width * height * 4], (width, height))
+
+    def get_size_in_bytes(self) -> int:
+        """
+        Get size of the compiled level file.
+        :return: bytes
+        """
+        return len(self.__data)
+
+
+def load_level(filename: str, directory: str = LEVEL_DIR):
+    """
+    Load the compiled level of the map.
+    :param filename: .tmx (map) file
+    :param directory: compiled levels directory
+    :return: compiled level or None if the level isn't compiled or its sources changed
+    """
+    try:
+        with open(get_level_file(filename, directory), 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, size = HEADER.unpack_from(data)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise ValueError('old compiled level')
+        metadata = json.loads(data[HEADER.size:HEADER.size + size])
+        if metadata['format'] != BAKE_FORMAT:
+            raise ValueError('different pixel format')
+        # source paths are relative to the map
+        for path, info in metadata['sources'].items():
+            if not is_source_unchanged(normpath(join(dirname(filename), path)), info):
+                raise ValueError('level changed')
+        return CompiledLevel(data, metadata, get_data_offset(HEADER.size + size))
+    except (ValueError, KeyError, struct.error):
+        data.close()
+        return None
+
+
+def get_data_offset(position: int) -> int:
+    """
+    Align the position to the start of the next data block.
+    :param position: position in the file
+    :return: aligned position
+    """
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def write_level(filename: str, tiled_map, image: pg.Surface, obstacles: tuple, directory: str = LEVEL_DIR) -> int:
+    """
+    Compile the level - write the tile layers, the map image & spawn tables of the map into its level file.
+    :param filename: .tmx (map) file
+    :param tiled_map: pytmx map (loaded with tilemap.load_tmx)
+    :param image: rendered map
+    :param obstacles: merged obstacles (meshing.merge_obstacles)
+    :param directory: compiled levels directory
+    :return: size of the level file (bytes)
+    """
+    blocks = []
+    offset = 0
+
+    def add_block(data) -> int:
+        nonlocal offset
+        start = offset
+        padding = get_data_offset(len(data)) - len(data)
+        blocks.append(bytes(data) + bytes(padding))
+        offset += len(data) + padding
+        return start
+
+    metadata = {
+        'format': BAKE_FORMAT,
+        'sources': {relpath(path, dirname(filename)): get_source_info(path) for path in tiled_map.sources},
+        'width': tiled_map.width,
+        'height': tiled_map.height,
+        'tilewidth': tiled_map.tilewidth,
+        'tileheight': tiled_map.tileheight,
+        'layers': [],
+    }
+
+    for name, visible, gids in get_tile_layers(tiled_map):
+        metadata['layers'].append((name, visible, add_block(gids.tobytes())))
+
+    # strings (names, types & properties) are stored once, objects refer to them by index
+    strings = {}
+
+    def get_string(value) -> int:
+        return strings.setdefault(value, len(strings))
+
+    def add_objects(objects: tuple) -> tuple:
+        table = b''.join(SPAWN_OBJECT.pack(get_string(tile_object.name), get_string(tile_object.type),
+                                           get_string(json.dumps(tile_object.properties, default=str)),
+                                           tile_object.x, tile_object.y, tile_object.width, tile_object.height,
+                                           tile_object.rotation)
+                         for tile_object in objects)
+        return add_block(table), len(objects)
+
+    metadata['objects'] = add_objects(get_spawn_objects(tiled_map))
+    metadata['obstacles'] = add_objects(obstacles)
+    metadata['strings'] = list(strings)
+    metadata['image'] = (add_block(pg.image.tobytes(image, BAKE_FORMAT)), image.get_width(), image.get_height())
+
+    encoded = json.dumps(metadata).encode()
+    header = HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, len(encoded)) + encoded
+    header += bytes(get_data_offset(len(header)) - len(header))
+
+    # write to a temporary file first, so a running game never maps a half written level
+    makedirs(directory, exist_ok=True)
+    level_file = get_level_file(filename, directory)
+    with open(level_file + '.tmp', 'wb') as f:
+        f.write(header)
+        for block in blocks:
+            f.write(block)
+    replace(level_file + '.tmp', level_file)
+    return len(header) + offset
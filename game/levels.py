@@ -0,0 +1,205 @@
+from . import pg
+from .config import LEVELS, LEVEL_CACHE_SIZE, LEVEL_CACHE_MEMORY, PRELOAD_LEVELS, RESTORE_BATCH_SIZE
+from .assets import AssetCache
+from .preloader import LevelPreloader, PreparedLevel
+
+from collections import OrderedDict
+
+
+class LevelSnapshot:
+    """
+    Pristine level right after it was loaded - its map, groups, obstacle grid & every sprite with its groups.
+    Restoring it puts the same sprites back into the same groups & resets them to their spawn state
+    (positions, health, hits, items...; settings are read again & timers start), so the level starts again
+    without loading the map or making any sprites. Sprites without a reset() method don't change while playing.
+    """
+
+    def __init__(self, prepared: PreparedLevel, groups: dict, player, obstacle_grid):
+        """
+        Take the snapshot.
+        :param prepared: prepared level (map, map image & solid map)
+        :param groups: sprite groups of the level by name
+        :param player: player
+        :param obstacle_grid: grid of the obstacles (they don't move, so it's used again)
+        """
+        self.prepared = prepared
+        self.groups = groups
+        self.player = player
+        self.obstacle_grid = obstacle_grid
+
+        # every sprite once (in the order of the groups, so the drawing order stays) with its groups
+        self.__sprites = []
+        seen = set()
+        for group in groups.values():
+            for sprite in group.sprites():
+                if sprite not in seen:
+                    seen.add(sprite)
+                    # sprites keep the groups they are made with in 'groups', so call pygame's method
+                    self.__sprites.append((sprite, tuple(pg.sprite.Sprite.groups(sprite))))
+
+    def restore(self):
+        """
+        Put the level back into its pristine state in steps (sprites made while playing are removed).
+        :return: generator which yields restoring progress (0 - 1) after each batch of sprites
+        """
+        for group in self.groups.values():
+            group.empty()
+        for start in range(0, len(self.__sprites), RESTORE_BATCH_SIZE):
+            for sprite, groups in self.__sprites[start:start + RESTORE_BATCH_SIZE]:
+                if hasattr(sprite, 'reset'):
+                    sprite.reset()
+                pg.sprite.Sprite.add(sprite, *groups)
+            yield min(start + RESTORE_BATCH_SIZE, len(self.__sprites)) / len(self.__sprites)
+
+    def get_sprites(self) -> list:
+        """
+        Get the sprites of the level (always in the same order, save games match the sprites by it).
+        :return: sprites
+        """
+        return [sprite for sprite, _ in self.__sprites]
+
+    def __len__(self) -> int:
+        """
+        Number of sprites in the snapshot.
+        :return: number of sprites
+        """
+        return len(self.__sprites)
+
+
+class LevelManager:
+    """
+    Levels of the game from the level manifest (config.LEVELS).
+    Prepared levels (map, map image & solid map) are kept in a LRU cache with a memory limit,
+    so playing a level again doesn't load it again. Upcoming levels are prepared in the background.
+    Levels which were played keep a snapshot of their starting state, so they start again without making the sprites.
+    """
+
+    def __init__(self, levels: tuple = LEVELS, cache_size: int = LEVEL_CACHE_SIZE,
+                 memory_limit: int = LEVEL_CACHE_MEMORY):
+        """
+        Initialize level manager.
+        :param levels: level manifest
+        :param cache_size: max number of prepared levels kept (the level being loaded is always kept)
+        :param memory_limit: max bytes held by the prepared levels
+        """
+        self.__levels = levels
+        self.__cache_size = cache_size
+        self.__memory_limit = memory_limit
+        self.__cache = OrderedDict()  # level -> prepared level (least recently used first)
+        self.__snapshots = {}  # level -> pristine level (removed with its prepared level)
+        self.__preloader = LevelPreloader()
+
+    def __len__(self) -> int:
+        """
+        Number of levels.
+        :return: number of levels
+        """
+        return len(self.__levels)
+
+    def get_info(self, level: int) -> dict:
+        """
+        Get the level from the manifest.
+        :param level: level number (from 1)
+        :return: map, timer seconds & what the player keeps from the previous level
+        """
+        return self.__levels[level - 1]
+
+    def preload(self, level: int) -> None:
+        """
+        Start preparing the level in the background (if it exists & isn't prepared already).
+        :param level: level number
+        """
+        if PRELOAD_LEVELS and 1 <= level <= len(self) and level not in self.__cache:
+            self.__preloader.preload(self.get_info(level)['map'])
+
+    def is_pending(self, level: int) -> bool:
+        """
+        Check if the level is still being prepared in the background (prepare() would wait for it).
+        :param level: level number
+        :return: True if it's being prepared
+        """
+        return level not in self.__cache and self.__preloader.is_pending(self.get_info(level)['map'])
+
+    def prepare(self, level: int) -> PreparedLevel:
+        """
+        Get the prepared level (from the cache, the preloader or loaded now).
+        :param level: level number
+        :return: prepared level
+        """
+        try:
+            self.__cache.move_to_end(level)
+            return self.__cache[level]
+        except KeyError:
+            prepared = self.__cache[level] = self.__preloader.get(self.get_info(level)['map'])
+            self.__evict(level)
+            return prepared
+
+    def __evict(self, keep: int) -> None:
+        """
+        Remove the least recently used levels over the cache size & memory limit.
+        :param keep: level which is never removed (the one that is being loaded)
+        """
+        for level in list(self.__cache):
+            if len(self.__cache) <= self.__cache_size and self.get_memory() <= self.__memory_limit:
+                break
+            if level != keep:
+                del self.__cache[level]
+                self.__snapshots.pop(level, None)
+
+    def get_snapshot(self, level: int):
+        """
+        Get the pristine state of a level which was played (its prepared level becomes the most recently used).
+        :param level: level number
+        :return: level snapshot or None
+        """
+        snapshot = self.__snapshots.get(level)
+        if snapshot is not None:
+            self.__cache.move_to_end(level)
+        return snapshot
+
+    def save_snapshot(self, level: int, snapshot: LevelSnapshot) -> None:
+        """
+        Keep the pristine state of a level (if its prepared level is cached).
+        :param level: level number
+        :param snapshot: level snapshot
+        """
+        if level in self.__cache:
+            self.__snapshots[level] = snapshot
+
+    def get_memory(self) -> int:
+        """
+        Get approximate number of bytes held by the prepared levels.
+        :return: bytes
+        """
+        return sum(AssetCache.size_of((prepared.image, prepared.solid_map)) for prepared in self.__cache.values())
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+        :return: cached levels (least recently used first), sprites in the snapshots & bytes held by the levels
+        """
+        snapshots = {level: len(snapshot) for level, snapshot in self.__snapshots.items()}
+        return {'levels': list(self.__cache), 'snapshots': snapshots, 'bytes': self.get_memory()}
+
+    def clear_snapshots(self) -> None:
+        """
+        Remove all snapshots (levels are started by making their sprites again).
+        """
+        self.__snapshots.clear()
+
+    def clear(self) -> None:
+        """
+        Remove all prepared levels & snapshots.
+        """
+        self.__cache.clear()
+        self.__snapshots.clear()
+
+    @staticmethod
+    def teardown(groups: tuple) -> None:
+        """
+        Remove all sprites of the current level from their groups (before the next level is made).
+        :param groups: sprite groups of the level
+        """
+        for group in groups:
+            for sprite in group.sprites():
+                sprite.kill()
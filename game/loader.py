@@ -0,0 +1,166 @@
+from . import pg
+from . import images
+from .config import WIDTH, HEIGHT, FONT, WHITE, DARK_GREY, SUBMENU_GREY, LOADER_THREADS, LOADER_FRAME_TIME, \
+    SHOW_LOAD_TIMES
+from .images import PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET, EXPLOSION_SPRITE_SHEET, DOOR_LOCKED_IMAGE, \
+    DOOR_UNLOCKED_IMAGE, DOOR_OPEN_IMAGE, DOOR_SWITCH_DISABLED_IMAGE, DOOR_SWITCH_ENABLED_IMAGE
+from .sounds import decode_sound
+from .assets import asset_cache, load_font, get_files, decode_image, convert_image, read_json, ALPHA, OPAQUE
+from .spritesheet import baked_frames
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import time
+
+SPRITE_SHEETS = (PLAYER_SPRITE_SHEET, ZOMBIE_SPRITE_SHEET, EXPLOSION_SPRITE_SHEET)
+
+# images loaded with convert() instead of convert_alpha()
+OPAQUE_IMAGES = SPRITE_SHEETS + (DOOR_LOCKED_IMAGE, DOOR_UNLOCKED_IMAGE, DOOR_OPEN_IMAGE,
+                                 DOOR_SWITCH_DISABLED_IMAGE, DOOR_SWITCH_ENABLED_IMAGE)
+
+
+class AssetLoader:
+    """
+    Loads the assets on a thread pool while the main thread draws the loading screen.
+    Worker threads only decode (images, sounds & .json data), images are converted on the main thread.
+    Loaded assets are put into the shared asset cache, where the game gets them from.
+    """
+
+    def __init__(self, game, threads: int = LOADER_THREADS):
+        """
+        Initialize the asset loader.
+        :param game: game
+        :param threads: number of worker threads
+        """
+        self.game = game
+        self.__threads = threads
+        self.__jobs = []
+        self.__timings = []  # (kind, path, decode time, finish time) in ms
+
+    def add_image(self, path: str, convert: str = ALPHA) -> None:
+        """
+        Add image to load.
+        :param path: image file
+        :param convert: convert mode (ALPHA/OPAQUE/None)
+        """
+        key = asset_cache.get_image_key(path, convert=convert)
+        self.__jobs.append(('image', path, decode_image, lambda image: convert_image(image, convert), key))
+
+    def add_sound(self, path: str) -> None:
+        """
+        Add sound to load.
+        :param path: sound file
+        """
+        self.__jobs.append(('sound', path, decode_sound, None, ('sound', path)))
+
+    def add_json(self, path: str) -> None:
+        """
+        Add .json file to load.
+        :param path: .json file
+        """
+        self.__jobs.append(('json', path, read_json, None, ('json', path)))
+
+    def add_startup_assets(self) -> None:
+        """
+        Add all images and the sprite sheets which are not baked (sounds are loaded lazily).
+        """
+        for path in get_files(images, '.png'):
+            if path in SPRITE_SHEETS:
+                if baked_frames.is_baked(path):
+                    continue
+                self.add_json(path.replace('png', 'json'))
+            self.add_image(path, OPAQUE if path in OPAQUE_IMAGES else ALPHA)
+
+    def load(self) -> None:
+        """
+        Load all added assets & draw the loading screen until they are loaded.
+        """
+        total = len(self.__jobs)
+        done = 0
+        self.__draw(done, total)
+
+        with ThreadPoolExecutor(self.__threads) as executor:
+            futures = {executor.submit(self.__decode, job[2], job[1]): job for job in self.__jobs}
+            last_draw = time.perf_counter()
+            while futures:
+                finished, _ = wait(futures, timeout=LOADER_FRAME_TIME, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self.__finish(futures.pop(future), future)
+                    done += 1
+                pg.event.pump()  # keep the window responsive
+
+                # redraw only at the loading screen frame rate (drawing takes time from the workers)
+                now = time.perf_counter()
+                if now - last_draw >= LOADER_FRAME_TIME or not futures:
+                    last_draw = now
+                    self.__draw(done, total)
+
+        self.__jobs.clear()
+        if SHOW_LOAD_TIMES:
+            self.print_timings()
+
+    @staticmethod
+    def __decode(decode, path: str) -> tuple:
+        """
+        Decode the asset (worker thread).
+        :param decode: decode function
+        :param path: asset file
+        :return: decoded asset & decode time (ms)
+        """
+        start = time.perf_counter()
+        asset = decode(path)
+        return asset, (time.perf_counter() - start) * 1000
+
+    def __finish(self, job: tuple, future) -> None:
+        """
+        Finish the loaded asset (main thread) & put it into the asset cache.
+        If the asset couldn't be loaded, it's skipped - the game loads it again when it needs it.
+        :param job: loading job
+        :param future: decode result
+        """
+        kind, path, decode, finish, key = job
+        try:
+            asset, decode_time = future.result()
+        except Exception as e:
+            print(f"Warning: Could not load {path}: {e}")
+            return
+
+        start = time.perf_counter()
+        if finish is not None:
+            asset = finish(asset)
+        asset_cache.get(key, lambda: asset)
+        self.__timings.append((kind, path, decode_time, (time.perf_counter() - start) * 1000))
+
+    def __draw(self, done: int, total: int) -> None:
+        """
+        Draw the loading screen.
+        :param done: number of loaded assets
+        :param total: number of all assets
+        """
+        display = self.game.display
+        display.fill(DARK_GREY)
+
+        progress = done / total if total else 1
+        bar = pg.Rect(0, 0, WIDTH / 2, 30)
+        bar.center = (WIDTH / 2, HEIGHT / 2)
+        pg.draw.rect(display, SUBMENU_GREY, bar)
+        pg.draw.rect(display, WHITE, (bar.x, bar.y, bar.width * progress, bar.height))
+
+        text = load_font(FONT, 40).render(f'Loading... {int(progress * 100)}%', True, WHITE)
+        display.blit(text, text.get_rect(midbottom=(bar.centerx, bar.top - 20)))
+
+        self.game.window.blit(display, (0, 0))
+        pg.display.update()
+
+    def get_timings(self) -> list:
+        """
+        Get per-asset timings of the last load.
+        :return: list of (kind, path, decode time, finish time) in ms, slowest first
+        """
+        return sorted(self.__timings, key=lambda timing: timing[2] + timing[3], reverse=True)
+
+    def print_timings(self) -> None:
+        """
+        Print per-asset timings of the last load.
+        """
+        for kind, path, decode_time, finish_time in self.get_timings():
+            print(f'{kind:<6}{decode_time:>9.1f} ms{finish_time:>9.1f} ms  {path}')
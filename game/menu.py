@@ -2,6 +2,7 @@ from . import pg
 from .config import VERSION, WIDTH, HEIGHT, GAME_TITLE, TITLE_FONT, FONT, SETTINGS_FILE, WHITE, RED, DARK_GREY, \
     SUBMENU_GREY, GAME_COMPLETED_POINTS
 from .sounds import *
+from .assets import load_font
 from .button import TextButton, VolumeControl, VolumeIndicator, MuteToggle, OnOffSwitch
 import json
 
@@ -95,6 +96,7 @@ class Menu:
         """
         Draw menu on screen.
         """
+        self.game.music.update()
         self.game.window.blit(self.game_display, (0, 0))
         pg.display.update()
 
@@ -135,7 +137,7 @@ class Menu:
         :param color: font color
         :param pos: position (x, y)
         """
-        font = pg.font.Font(font_name, size)
+        font = load_font(font_name, size)
         text_surface = font.render(text, True, color)
         text_rect = text_surface.get_rect()
         text_rect.center = (pos[0], pos[1])
@@ -332,7 +334,7 @@ class MainMenu(Menu):
                         if self.click:
                             if not self.game.settings_menu.restart_required:
                                 self.game.level = 1  # ensure level is 1 on new game start
-                                self.menu_music.stop()  # stop menu music
+                                self.menu_music.fadeout()  # fade out menu music
                                 self.game.run()  # run the game
 
                     # settings
@@ -480,36 +482,36 @@ class MainMenu(Menu):
         """
         try:
             # general sounds
-            self.menu_music = pg.mixer.Sound(MENU_MUSIC)
-            self.menu_in_sound = pg.mixer.Sound(MENU_IN_SOUND)
-            self.menu_out_sound = pg.mixer.Sound(MENU_OUT_SOUND)
-            self.switch_toggle_sound = pg.mixer.Sound(SWITCH_TOGGLE_SOUND)
-            self.high_score_sound = pg.mixer.Sound(HIGH_SCORE_SOUND)
-            self.game_over_music = pg.mixer.Sound(GAME_OVER_MUSIC)
-            self.level_start_sound = pg.mixer.Sound(LEVEL_START_SOUND)
+            self.menu_music = self.game.music.get_track(MENU_MUSIC)
+            self.menu_in_sound = LazySound(MENU_IN_SOUND)
+            self.menu_out_sound = LazySound(MENU_OUT_SOUND)
+            self.switch_toggle_sound = LazySound(SWITCH_TOGGLE_SOUND)
+            self.high_score_sound = LazySound(HIGH_SCORE_SOUND)
+            self.game_over_music = self.game.music.get_track(GAME_OVER_MUSIC)
+            self.level_start_sound = LazySound(LEVEL_START_SOUND)
 
             # game sfx
-            self.door_switch_press_sound = pg.mixer.Sound(DOOR_SWITCH_PRESS_SOUND)
-            self.door_switch_fail_sound = pg.mixer.Sound(DOOR_SWITCH_FAIL_SOUND)
-            self.door_open_sound = pg.mixer.Sound(DOOR_OPEN_SOUND)
-            self.xp_pickup_sound = pg.mixer.Sound(XP_PICKUP_SOUND)
-            self.coin_pickup_sound = pg.mixer.Sound(COIN_PICKUP_SOUND)
-            self.health_pickup_sound = pg.mixer.Sound(HEALTH_PICKUP_SOUND)
-            self.key_pickup_sound = pg.mixer.Sound(KEY_PICKUP_SOUND)
-            self.lever_pull_sound = pg.mixer.Sound(LEVER_PULL_SOUND)
-            self.laser_sound = pg.mixer.Sound(LASER_SOUND)
-            self.laser_gun_sound = pg.mixer.Sound(LASER_GUN_SOUND)
-            self.burn_sound = pg.mixer.Sound(BURN_SOUND)
-            self.saw_sound = pg.mixer.Sound(SAW_SOUND)
-            self.explosion_sound = pg.mixer.Sound(EXPLOSION_SOUND)
+            self.door_switch_press_sound = LazySound(DOOR_SWITCH_PRESS_SOUND)
+            self.door_switch_fail_sound = LazySound(DOOR_SWITCH_FAIL_SOUND)
+            self.door_open_sound = LazySound(DOOR_OPEN_SOUND)
+            self.xp_pickup_sound = LazySound(XP_PICKUP_SOUND)
+            self.coin_pickup_sound = LazySound(COIN_PICKUP_SOUND)
+            self.health_pickup_sound = LazySound(HEALTH_PICKUP_SOUND)
+            self.key_pickup_sound = LazySound(KEY_PICKUP_SOUND)
+            self.lever_pull_sound = LazySound(LEVER_PULL_SOUND)
+            self.laser_sound = LazySound(LASER_SOUND)
+            self.laser_gun_sound = LazySound(LASER_GUN_SOUND)
+            self.burn_sound = LazySound(BURN_SOUND)
+            self.saw_sound = LazySound(SAW_SOUND)
+            self.explosion_sound = LazySound(EXPLOSION_SOUND)
 
             # sprites sounds
-            self.player_jump_sound = pg.mixer.Sound(PLAYER_JUMP_SOUND)
-            self.player_hit_sound = pg.mixer.Sound(PLAYER_HIT_SOUND)
-            self.gun_sound = pg.mixer.Sound(GUN_SOUND)
-            self.zombie_hit_sound = pg.mixer.Sound(ZOMBIE_HIT_SOUND)
-            self.zombie_die_sound = pg.mixer.Sound(ZOMBIE_DIE_SOUND)
-            self.zombie_moan_sounds = [pg.mixer.Sound(sound) for sound in ZOMBIE_MOAN_SOUNDS]
+            self.player_jump_sound = LazySound(PLAYER_JUMP_SOUND)
+            self.player_hit_sound = LazySound(PLAYER_HIT_SOUND)
+            self.gun_sound = LazySound(GUN_SOUND)
+            self.zombie_hit_sound = LazySound(ZOMBIE_HIT_SOUND)
+            self.zombie_die_sound = LazySound(ZOMBIE_DIE_SOUND)
+            self.zombie_moan_sounds = [LazySound(sound) for sound in ZOMBIE_MOAN_SOUNDS]
 
             # set volumes for sounds
             self.__set_volumes()
@@ -2670,6 +2672,7 @@ class PauseMenu:
         """
         self.__draw_menu()
         self.__check_clicks()
+        self.game.music.update()
         self.game.window.blit(self.game.display, (0, 0))
         pg.display.update()
 
@@ -2772,12 +2775,20 @@ class GameOverMenu:
                                  self.main_menu.burn_sound,
                                  self.main_menu.laser_sound)
 
+    def show(self) -> None:
+        """
+        Show game over menu (from the next frame).
+        """
+        self.game.game_over = True
+        self.game.levels.preload(1)  # new game starts without loading
+
     def display_menu(self) -> None:
         """
         Display game over menu.
         """
         self.__draw_menu()
         self.__check_clicks()
+        self.game.music.update()
         pg.display.update()
 
     def __init_buttons(self) -> None:
@@ -2855,7 +2866,7 @@ class GameOverMenu:
                 # new game
                 if button == self.new_game_btn:
                     if self.game.click:
-                        self.main_menu.game_over_music.stop()
+                        self.main_menu.game_over_music.fadeout()
                         self.game.playing = False
                         self.game.level = 1  # ensure level is 1 on new game start
                         self.game.run()
@@ -2863,7 +2874,7 @@ class GameOverMenu:
                 # main menu
                 if button == self.main_menu_btn:
                     if self.game.click:
-                        self.main_menu.game_over_music.stop()
+                        self.main_menu.game_over_music.fadeout()
                         self.game.current_menu.accidental_click = True  # fix accidental clicks bug
                         self.game.playing = False  # break the game loop (go to main menu)
                         if self.game.main_menu.menu_music_on:
@@ -2890,7 +2901,7 @@ class GameOverMenu:
         # stop zombie moan sounds
         for sound in self.main_menu.zombie_moan_sounds:
             sound.stop()
-        pg.mixer.music.stop()
+        self.game.game_music.fadeout()
 
     def set_game_completed(self) -> None:
         """
@@ -2900,7 +2911,7 @@ class GameOverMenu:
         self.__save_final_score()
         play_sound(self.main_menu.high_score_sound_on, self.main_menu.high_score_sound)
         play_sound(self.main_menu.game_over_music_on, self.main_menu.game_over_music)
-        self.game.game_over = True
+        self.show()
         self.game_completed = True
 
     def __save_final_score(self) -> None:
@@ -0,0 +1,82 @@
+"""
+Greedy meshing of the level collision - the obstacle rects of a type are merged into fewer, bigger rects
+which cover exactly the same pixels (overlapping & adjacent rects become one), so collision queries test fewer rects.
+Rects are merged on the grid made by their edges (a cell between every two neighbouring x & y edges),
+which is the tile grid if the rects are tiles, but keeps the thin platforms & posts which aren't whole tiles.
+"""
+
+from . import pg
+from .levelfile import SpawnObject
+
+from bisect import bisect_left
+
+
+def merge_rects(rects) -> list:
+    """
+    Merge rects into maximal rects (greedy meshing).
+    Each step takes the biggest rect of free cells - from every free cell, grown right then down & down then right -
+    until all cells are taken, so the merged rects don't overlap. Empty rects cover nothing, so they are dropped.
+    :param rects: rects
+    :return: merged rects (cover the same pixels)
+    """
+    rects = [pg.Rect(rect) for rect in rects if rect[2] > 0 and rect[3] > 0]
+    if not rects:
+        return []
+
+    xs = sorted({x for rect in rects for x in (rect.left, rect.right)})
+    ys = sorted({y for rect in rects for y in (rect.top, rect.bottom)})
+    columns, rows = len(xs) - 1, len(ys) - 1
+    free = [[False] * columns for _ in range(rows)]
+    for rect in rects:
+        left, right = bisect_left(xs, rect.left), bisect_left(xs, rect.right)
+        for row in free[bisect_left(ys, rect.top):bisect_left(ys, rect.bottom)]:
+            row[left:right] = [True] * (right - left)
+
+    merged = []
+    while True:
+        best = None  # area, left, top, right, bottom (cells)
+        for top, row in enumerate(free):
+            for left in range(columns):
+                if not row[left]:
+                    continue
+                # right then down
+                right = left + 1
+                while right < columns and row[right]:
+                    right += 1
+                bottom = top + 1
+                while bottom < rows and all(free[bottom][left:right]):
+                    bottom += 1
+                # down then right
+                low = top + 1
+                while low < rows and free[low][left]:
+                    low += 1
+                wide = left + 1
+                while wide < columns and all(cells[wide] for cells in free[top:low]):
+                    wide += 1
+                for right, bottom in ((right, bottom), (wide, low)):
+                    area = (xs[right] - xs[left]) * (ys[bottom] - ys[top])
+                    if best is None or area > best[0]:
+                        best = (area, left, top, right, bottom)
+        if best is None:
+            return merged
+
+        _, left, top, right, bottom = best
+        for row in free[top:bottom]:
+            row[left:right] = [False] * (right - left)
+        merged.append(pg.Rect(xs[left], ys[top], xs[right] - xs[left], ys[bottom] - ys[top]))
+
+
+def merge_obstacles(objects) -> tuple:
+    """
+    Merge the obstacles of the map (each obstacle type separately, types collide with different sprites).
+    Obstacle rects are made the same way as the obstacles make them (pg.Rect of the object's position & size).
+    :param objects: spawn objects of the map
+    :return: merged obstacles (spawn objects)
+    """
+    types = {}
+    for tile_object in objects:
+        if tile_object.name == 'obstacle':
+            types.setdefault(tile_object.type, []).append(
+                pg.Rect(tile_object.x, tile_object.y, tile_object.width, tile_object.height))
+    return tuple(SpawnObject('obstacle', obstacle_type, rect.x, rect.y, rect.width, rect.height, 0, {})
+                 for obstacle_type, rects in types.items() for rect in merge_rects(rects))
@@ -0,0 +1,208 @@
+from . import pg
+from .config import MUSIC_FADE_TIME
+from .pack import open_asset
+
+
+class MusicTrack:
+    """
+    Long music track streamed from its file (never decoded into memory as a whole).
+    Has the same methods as pg.mixer.Sound which the menus & sprites use (play, stop, volume...).
+    """
+
+    def __init__(self, service, path: str, volume: float = 1.0):
+        """
+        Initialize music track.
+        :param service: music service which plays the track
+        :param path: music file
+        :param volume: track volume
+        """
+        self.__service = service
+        self.path = path
+        self.__volume = volume
+
+    def play(self, loops: int = 0) -> None:
+        """
+        Play the track (the track that is playing fades out first).
+        :param loops: number of repeats (-1 to loop forever)
+        """
+        self.__service.play(self, loops)
+
+    def queue(self, loops: int = 0) -> None:
+        """
+        Play the track after the current track ends.
+        :param loops: number of repeats (-1 to loop forever)
+        """
+        self.__service.queue(self, loops)
+
+    def stop(self) -> None:
+        """
+        Stop the track (if it's playing or waiting to be played).
+        """
+        self.__service.stop(self)
+
+    def fadeout(self) -> None:
+        """
+        Fade out the track (if it's playing).
+        """
+        self.__service.fadeout(self)
+
+    def set_volume(self, volume: float) -> None:
+        """
+        Set track volume.
+        :param volume: volume (0.0 - 1.0)
+        """
+        self.__volume = min(max(volume, 0.0), 1.0)
+        self.__service.update_volume(self)
+
+    def get_volume(self) -> float:
+        """
+        Get track volume.
+        :return: volume
+        """
+        return self.__volume
+
+    def get_num_channels(self) -> int:
+        """
+        Get number of channels the track is playing on (same as for pg.mixer.Sound).
+        :return: 1 if playing, otherwise 0
+        """
+        return 1 if self.__service.is_playing(self) else 0
+
+
+class MusicService:
+    """
+    Plays music tracks through pg.mixer.music (one track at a time).
+    Changing the track fades the current track out and the next track in, tracks can also be queued.
+    update() must be called every frame (starts the next track when the fade out is done).
+    """
+
+    def __init__(self, fade_time: int = MUSIC_FADE_TIME):
+        """
+        Initialize music service.
+        :param fade_time: fade out & fade in time (ms)
+        """
+        self.__fade_time = fade_time
+        self.__tracks = {}
+        self.__current = None  # track which is playing (or fading out)
+        self.__fading = False
+        self.__next = []  # (track, loops, fade in) to play after the current track
+        self.__file = None  # keep the streamed file open
+
+    def get_track(self, path: str, volume: float = 1.0) -> MusicTrack:
+        """
+        Get the track for the music file (made once for each file).
+        :param path: music file
+        :param volume: starting track volume
+        :return: music track
+        """
+        try:
+            return self.__tracks[path]
+        except KeyError:
+            track = self.__tracks[path] = MusicTrack(self, path, volume)
+            return track
+
+    def play(self, track: MusicTrack, loops: int = 0) -> None:
+        """
+        Play the track. If another track is playing, it fades out first.
+        :param track: music track
+        :param loops: number of repeats (-1 to loop forever)
+        """
+        if self.is_playing(track):
+            return
+        self.__next = [(track, loops, True)]
+        if self.__current is not None and pg.mixer.music.get_busy():
+            self.__fade_current()
+        else:
+            self.__start(track, loops, False)
+
+    def queue(self, track: MusicTrack, loops: int = 0) -> None:
+        """
+        Play the track after the current (and already queued) tracks.
+        :param track: music track
+        :param loops: number of repeats (-1 to loop forever)
+        """
+        self.__next.append((track, loops, False))
+        self.update()
+
+    def stop(self, track: MusicTrack) -> None:
+        """
+        Stop the track.
+        :param track: music track
+        """
+        self.__next = [entry for entry in self.__next if entry[0] is not track]
+        if track is self.__current:
+            pg.mixer.music.stop()
+            self.__current = None
+            self.__fading = False
+
+    def fadeout(self, track: MusicTrack) -> None:
+        """
+        Fade out the track.
+        :param track: music track
+        """
+        self.__next = [entry for entry in self.__next if entry[0] is not track]
+        if track is self.__current:
+            self.__fade_current()
+
+    def pause(self) -> None:
+        """
+        Pause the music.
+        """
+        pg.mixer.music.pause()
+
+    def unpause(self) -> None:
+        """
+        Resume the paused music.
+        """
+        pg.mixer.music.unpause()
+
+    def is_playing(self, track: MusicTrack) -> bool:
+        """
+        Check if the track is playing (and not fading out).
+        :param track: music track
+        :return: True if playing
+        """
+        return track is self.__current and not self.__fading and pg.mixer.music.get_busy()
+
+    def update_volume(self, track: MusicTrack) -> None:
+        """
+        Apply changed track volume if the track is playing.
+        :param track: music track
+        """
+        if track is self.__current and not self.__fading:
+            pg.mixer.music.set_volume(track.get_volume())
+
+    def update(self) -> None:
+        """
+        Start the next track when the current track is done (faded out or ended).
+        """
+        if self.__next and not pg.mixer.music.get_busy():
+            track, loops, fade_in = self.__next.pop(0)
+            self.__start(track, loops, fade_in)
+
+    def __fade_current(self) -> None:
+        """
+        Fade out the current track (the next track starts in update() when it's done).
+        """
+        if not self.__fading:
+            self.__fading = True
+            pg.mixer.music.fadeout(self.__fade_time)
+
+    def __start(self, track: MusicTrack, loops: int, fade_in: bool) -> None:
+        """
+        Load & play the track.
+        :param track: music track
+        :param loops: number of repeats
+        :param fade_in: True to fade in
+        """
+        try:
+            self.__file = open_asset(track.path)
+            pg.mixer.music.load(self.__file, track.path)
+            pg.mixer.music.set_volume(track.get_volume())
+            pg.mixer.music.play(loops, fade_ms=self.__fade_time if fade_in else 0)
+        except pg.error as e:
+            print(f"Warning: Could not play music {track.path}: {e}")
+            self.__current = None
+        else:
+            self.__current = track
+        self.__fading = False
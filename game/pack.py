@@ -0,0 +1,223 @@
+"""
+Asset pack - all files from the assets directory in one file.
+The pack is memory-mapped once and every asset is read through a file-like view into the map,
+so loading the assets doesn't open, stat & seek hundreds of loose files.
+Build with: python -m game.pack (build again after changing the assets)
+"""
+
+from .config import ASSETS_DIR, BAKE_DIR, PACK_FILE, PACK_VERSION
+
+from os import makedirs, replace, sep, walk
+from os.path import join, normpath, relpath, dirname
+import io
+import json
+import mmap
+import struct
+import time
+
+PACK_MAGIC = b'SHFTPACK'
+HEADER = struct.Struct('<8sII')  # magic, version, index size
+
+
+class PackFile(io.RawIOBase):
+    """
+    Read-only file-like view of one asset in the pack (no copy of the data is made).
+    """
+
+    def __init__(self, view: memoryview, name: str):
+        """
+        Initialize pack file.
+        :param view: asset data
+        :param name: asset path (used as the file name)
+        """
+        super().__init__()
+        self.__view = view
+        self.__pos = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        """
+        :return: True (view can be read)
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """
+        :return: True (view supports seek)
+        """
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Read data into the buffer.
+        :param buffer: writable buffer
+        :return: number of bytes read
+        """
+        size = min(len(buffer), len(self.__view) - self.__pos)
+        if size <= 0:
+            return 0
+        buffer[:size] = self.__view[self.__pos:self.__pos + size]
+        self.__pos += size
+        return size
+
+    def readall(self) -> bytes:
+        """
+        Read the rest of the data.
+        :return: data
+        """
+        data = bytes(self.__view[self.__pos:])
+        self.__pos = len(self.__view)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Change the position.
+        :param offset: offset
+        :param whence: SEEK_SET, SEEK_CUR or SEEK_END
+        :return: new position
+        """
+        if whence == io.SEEK_CUR:
+            offset += self.__pos
+        elif whence == io.SEEK_END:
+            offset += len(self.__view)
+        self.__pos = max(0, offset)
+        return self.__pos
+
+    def tell(self) -> int:
+        """
+        :return: current position
+        """
+        return self.__pos
+
+
+class AssetPack:
+    """
+    Indexed asset pack.
+    Index maps asset paths (relative to the assets directory) to (offset, size) of their data
+    (offsets are relative to the start of the data, which follows the header & the index).
+    """
+
+    def __init__(self, filename: str = PACK_FILE):
+        """
+        Initialize asset pack (the pack is opened on first use).
+        :param filename: pack file
+        """
+        self.__filename = filename
+        self.__index = {}
+        self.__data = None
+        self.__opened = False
+
+    def __open(self) -> None:
+        """
+        Map the pack & read the index (no pack or a pack with another version is not used).
+        """
+        self.__opened = True
+        try:
+            with open(self.__filename, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_size = HEADER.unpack_from(data)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                data.close()
+                return
+            self.__index = json.loads(data[HEADER.size:HEADER.size + index_size])
+        except (OSError, ValueError, struct.error):
+            return
+        self.__data = memoryview(data)[HEADER.size + index_size:]
+
+    @staticmethod
+    def get_name(path: str) -> str:
+        """
+        Get the name of an asset in the pack.
+        :param path: asset file
+        :return: path relative to the assets directory (with / as separator) or None if not an asset
+        """
+        path = normpath(path)
+        assets_dir = normpath(ASSETS_DIR) + sep
+        if not path.startswith(assets_dir):
+            return None
+        return path[len(assets_dir):].replace(sep, '/')
+
+    def open(self, path: str):
+        """
+        Open an asset from the pack.
+        :param path: asset file
+        :return: file-like view or None if the asset is not in the pack
+        """
+        if not self.__opened:
+            self.__open()
+        entry = self.__index.get(self.get_name(path))
+        if entry is None:
+            return None
+        offset, size = entry
+        return PackFile(self.__data[offset:offset + size], path)
+
+
+# shared (process-wide) asset pack
+asset_pack = AssetPack()
+
+
+def open_asset(path: str):
+    """
+    Open an asset file for reading - from the asset pack if it's packed, otherwise from the disk.
+    :param path: asset file
+    :return: file-like object
+    """
+    f = asset_pack.open(path)
+    if f is None:
+        f = open(path, 'rb')
+    return f
+
+
+def build(filename: str = PACK_FILE) -> dict:
+    """
+    Build the asset pack from all files in the assets directory (except generated files).
+    :param filename: pack file
+    :return: number of files & bytes packed
+    """
+    assets_dir = normpath(ASSETS_DIR)
+    bake_dir = normpath(BAKE_DIR)
+
+    files = []
+    for directory, directories, names in walk(assets_dir):
+        if normpath(directory) == bake_dir:
+            directories.clear()
+            continue
+        directories.sort()
+        files.extend(join(directory, name) for name in sorted(names))
+
+    # offsets in the index are relative to the start of the data (which follows the index)
+    blobs = []
+    index = {}
+    offset = 0
+    for path in files:
+        with open(path, 'rb') as f:
+            data = f.read()
+        blobs.append(data)
+        index[relpath(path, assets_dir).replace(sep, '/')] = (offset, len(data))
+        offset += len(data)
+    index_data = json.dumps(index).encode()
+
+    makedirs(dirname(filename), exist_ok=True)
+    with open(filename + '.tmp', 'wb') as f:
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_data)))
+        f.write(index_data)
+        for data in blobs:
+            f.write(data)
+    replace(filename + '.tmp', filename)
+
+    return {'files': len(index), 'bytes': offset}
+
+
+def main() -> None:
+    """
+    Build the asset pack.
+    """
+    start = time.perf_counter()
+    stats = build()
+    elapsed = (time.perf_counter() - start) * 1000
+    print('Packed {files} files ({kib:.1f} KiB) in {ms:.0f} ms to {pack}'.format(
+        files=stats['files'], kib=stats['bytes'] / 1024, ms=elapsed, pack=PACK_FILE))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+from . import pg
+from .config import SAW_ROTATION_STEP, BLACK
+from .images import SAW_IMAGE, LASER_MACHINE_DOWN_SHOOT_IMAGE, LASER_MACHINE_DOWN_OFF_IMAGE, \
+    LASER_MACHINE_RIGHT_SHOOT_IMAGE, LASER_MACHINE_RIGHT_OFF_IMAGE, LASER_MACHINE_LEFT_SHOOT_IMAGE, \
+    LASER_MACHINE_LEFT_OFF_IMAGE, LASER_RECEIVER_IMAGE, DOOR_SWITCH_DISABLED_IMAGE, DOOR_SWITCH_ENABLED_IMAGE, \
+    DOOR_LOCKED_IMAGE, DOOR_UNLOCKED_IMAGE, DOOR_OPEN_IMAGE, BLUE_LEVER_ON_IMAGE, BLUE_LEVER_OFF_IMAGE, \
+    RED_LEVER_ON_IMAGE, RED_LEVER_OFF_IMAGE, GREEN_LEVER_ON_IMAGE, GREEN_LEVER_OFF_IMAGE, YELLOW_LEVER_ON_IMAGE, \
+    YELLOW_LEVER_OFF_IMAGE
+from .assets import asset_cache, load_image, scale_image, get_rotation_key, make_rotation_frames, ALPHA, OPAQUE
+from .levelfile import load_level
+from .tilemap import TiledMap
+from .solidmap import SolidMap
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import NamedTuple
+
+# images which the sprites scale to the size of their map object: object name -> (image, convert mode)
+OBJECT_IMAGES = {
+    'laser_machine': ((LASER_MACHINE_DOWN_SHOOT_IMAGE, ALPHA), (LASER_MACHINE_DOWN_OFF_IMAGE, ALPHA),
+                      (LASER_MACHINE_RIGHT_SHOOT_IMAGE, ALPHA), (LASER_MACHINE_RIGHT_OFF_IMAGE, ALPHA),
+                      (LASER_MACHINE_LEFT_SHOOT_IMAGE, ALPHA), (LASER_MACHINE_LEFT_OFF_IMAGE, ALPHA)),
+    'laser_receiver': ((LASER_RECEIVER_IMAGE, ALPHA),),
+    'door_switch': ((DOOR_SWITCH_DISABLED_IMAGE, OPAQUE), (DOOR_SWITCH_ENABLED_IMAGE, OPAQUE)),
+    'door': ((DOOR_LOCKED_IMAGE, OPAQUE), (DOOR_UNLOCKED_IMAGE, OPAQUE), (DOOR_OPEN_IMAGE, OPAQUE)),
+    'lever': ((BLUE_LEVER_ON_IMAGE, ALPHA), (BLUE_LEVER_OFF_IMAGE, ALPHA), (RED_LEVER_ON_IMAGE, ALPHA),
+              (RED_LEVER_OFF_IMAGE, ALPHA), (GREEN_LEVER_ON_IMAGE, ALPHA), (GREEN_LEVER_OFF_IMAGE, ALPHA),
+              (YELLOW_LEVER_ON_IMAGE, ALPHA), (YELLOW_LEVER_OFF_IMAGE, ALPHA)),
+}
+
+
+class PreparedLevel(NamedTuple):
+    """
+    Level data ready to be used by the game (only the sprites are left to make).
+    The sprite assets are made by the worker & put into the asset cache when the level is taken (main thread).
+    """
+    map: TiledMap
+    image: pg.Surface
+    solid_map: SolidMap
+    assets: dict  # asset cache key -> asset
+
+
+def get_base_images() -> dict:
+    """
+    Get the loaded & converted images which the sprites of the map objects scale (main thread, the cache isn't locked).
+    Images which aren't loaded yet are left to the sprites.
+    :return: (image, convert mode) -> image
+    """
+    images = {}
+    for path, convert in {(SAW_IMAGE, ALPHA), *chain.from_iterable(OBJECT_IMAGES.values())}:
+        if asset_cache.has(asset_cache.get_image_key(path, convert=convert)):
+            images[path, convert] = load_image(path, convert=convert)
+    return images
+
+
+def prepare_assets(objects: tuple, images: dict) -> dict:
+    """
+    Scale the images (and rotate the saws) the sprites of the map objects will use.
+    The assets aren't put into the shared cache here (worker thread), they are returned with their cache keys.
+    :param objects: map objects
+    :param images: loaded & converted images to scale (from get_base_images())
+    :return: asset cache key -> asset
+    """
+    assets = {}
+    for tile_object in objects:
+        size = (int(tile_object.width), int(tile_object.height))
+        if tile_object.name == 'saw' and (SAW_IMAGE, ALPHA) in images:
+            key = get_rotation_key(SAW_IMAGE, size, SAW_ROTATION_STEP, BLACK)
+            if key not in assets:
+                image = assets[asset_cache.get_image_key(SAW_IMAGE, size)] = scale_image(images[SAW_IMAGE, ALPHA], size)
+                frames = assets[key] = make_rotation_frames(image, SAW_ROTATION_STEP, BLACK)
+                frames.make_all()
+        for path, convert in OBJECT_IMAGES.get(tile_object.name, ()):
+            key = asset_cache.get_image_key(path, size, convert)
+            if key not in assets and (path, convert) in images:
+                assets[key] = scale_image(images[path, convert], size)
+    return assets
+
+
+def prepare_level(filename: str, images: dict):
+    """
+    Prepare the level (worker thread) - map the compiled level, copy out the map image, draw the solid map
+    & prepare the sprite assets.
+    Levels which aren't compiled (or changed) are left to the main thread, because loading a .tmx file converts
+    the tiles.
+    :param filename: .tmx (map) file
+    :param images: loaded & converted images to scale for the sprites
+    :return: prepared level or None
+    """
+    level = load_level(filename)
+    if level is None:
+        return None
+    tiled_map = TiledMap(filename, level)
+    image = tiled_map.make_map()
+    solid_map = tiled_map.make_solid_map()
+    return PreparedLevel(tiled_map, image, solid_map, prepare_assets(tiled_map.objects, images))
+
+
+class LevelPreloader:
+    """
+    Prepares upcoming levels on a worker thread while the current screen runs (main menu, game over, a level).
+    """
+
+    def __init__(self):
+        """
+        Initialize level preloader.
+        """
+        self.__executor = ThreadPoolExecutor(1, thread_name_prefix='level-preloader')
+        self.__jobs = {}  # map file -> future with the prepared level
+
+    def preload(self, filename: str) -> None:
+        """
+        Start preparing the level (if it's not prepared or being prepared already).
+        :param filename: .tmx (map) file
+        """
+        if filename not in self.__jobs:
+            self.__jobs[filename] = self.__executor.submit(prepare_level, filename, get_base_images())
+
+    def is_ready(self, filename: str) -> bool:
+        """
+        Check if the level is prepared.
+        :param filename: .tmx (map) file
+        :return: True if prepared
+        """
+        future = self.__jobs.get(filename)
+        return future is not None and future.done()
+
+    def is_pending(self, filename: str) -> bool:
+        """
+        Check if the level is still being prepared.
+        :param filename: .tmx (map) file
+        :return: True if it's being prepared
+        """
+        future = self.__jobs.get(filename)
+        return future is not None and not future.done()
+
+    def get(self, filename: str) -> PreparedLevel:
+        """
+        Get the prepared level (waits if it's still being prepared).
+        If the level wasn't preloaded or couldn't be prepared, it's loaded now.
+        :param filename: .tmx (map) file
+        :return: prepared level
+        """
+        prepared = None
+        future = self.__jobs.pop(filename, None)
+        if future is not None:
+            try:
+                prepared = future.result()
+            except Exception as e:
+                print(f"Warning: Could not preload level {filename}: {e}")
+
+        if prepared is None:
+            tiled_map = TiledMap(filename)
+            return PreparedLevel(tiled_map, tiled_map.make_map(), tiled_map.make_solid_map(), {})
+
+        # sprite assets made by the worker are shared from now on
+        for key, asset in prepared.assets.items():
+            asset_cache.get(key, lambda: asset)
+
+        # the image is made in the worker thread, convert it if its pixel format isn't the display's
+        image = prepared.image
+        display = pg.display.get_surface()
+        if display is not None and image.get_masks() != display.get_masks():
+            image = image.convert()
+        return prepared._replace(image=image, assets={})
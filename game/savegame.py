@@ -0,0 +1,204 @@
+"""
+Save games.
+A save game is a versioned binary file - a header (level & game timer seconds) and a section for every saved
+sprite type with a struct-packed record for each sprite of the level (alive flag & the sprite's state).
+Sprites are matched to the level by their order in the level snapshot, so loading starts the level from its
+pristine state and sets the saved state. Items spawned while playing (XP from zombies) have their own section.
+"""
+
+from . import vec
+from .config import SAVE_VERSION
+from .sprites import Player, Zombie, Saw, LaserMachine, LaserBeam, Item, Door, DoorSwitch, Lever
+
+from concurrent.futures import ThreadPoolExecutor
+from os import makedirs, replace, fsync
+from os.path import dirname, getmtime, isfile
+from typing import NamedTuple
+import struct
+
+SAVE_MAGIC = b'SHFTSAVE'
+HEADER = struct.Struct('<8sHHHI')  # magic, version, level, number of sections, timer seconds
+SECTION = struct.Struct('<4sI')  # tag, number of records
+
+# saved sprites: tag, sprite class & record format (state from get_save_state(), after the alive flag)
+# positions are doubles, so a loaded game continues exactly like the saved one
+SAVED_SPRITES = (
+    (b'PLYR', Player, '6dhi5?H'),
+    (b'ZOMB', Zombie, '4dh?2d'),
+    (b'SAWS', Saw, '2dhH?H'),
+    (b'LASM', LaserMachine, '?hH'),
+    (b'LASB', LaserBeam, ''),
+    (b'ITEM', Item, ''),
+    (b'DOOR', Door, '2?'),
+    (b'SWCH', DoorSwitch, '?'),
+    (b'LEVR', Lever, '?'),
+)
+RECORDS = {tag: struct.Struct('<?' + record_format) for tag, _, record_format in SAVED_SPRITES}
+
+DROPS_TAG = b'DROP'
+DROPPED_ITEM = struct.Struct('<B2d')  # item type & center position
+ITEM_TYPES = ('health', 'xp', 'coin', 'key')
+
+
+class SaveGame(NamedTuple):
+    """
+    Unpacked save game.
+    """
+    level: int
+    seconds: int
+    sections: dict  # tag -> list of records (tuples)
+
+
+def pack_game(level: int, seconds: int, sprites: list, items) -> bytes:
+    """
+    Pack the game state.
+    :param level: level number
+    :param seconds: game timer seconds
+    :param sprites: sprites of the level (from the level snapshot)
+    :param items: item group (items which aren't in the level are saved as dropped items)
+    :return: save game data
+    """
+    chunks = []
+    for tag, sprite_class, record_format in SAVED_SPRITES:
+        record = RECORDS[tag]
+        records = [record.pack(sprite.alive(), *(sprite.get_save_state() if record_format else ()))
+                   for sprite in sprites if type(sprite) is sprite_class]
+        chunks.append(SECTION.pack(tag, len(records)))
+        chunks.extend(records)
+
+    in_level = set(sprites)
+    drops = [DROPPED_ITEM.pack(ITEM_TYPES.index(item.get_type()), *item.get_pos())
+             for item in items if item not in in_level]
+    chunks.append(SECTION.pack(DROPS_TAG, len(drops)))
+    chunks.extend(drops)
+
+    header = HEADER.pack(SAVE_MAGIC, SAVE_VERSION, level, len(SAVED_SPRITES) + 1, seconds)
+    return header + b''.join(chunks)
+
+
+def unpack_game(data: bytes) -> SaveGame:
+    """
+    Unpack the game state.
+    :param data: save game data
+    :return: save game
+    """
+    magic, version, level, section_count, seconds = HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise ValueError('not a save game')
+    if version != SAVE_VERSION:
+        raise ValueError(f'save game version {version} is not supported')
+
+    sections = {}
+    offset = HEADER.size
+    for _ in range(section_count):
+        tag, count = SECTION.unpack_from(data, offset)
+        offset += SECTION.size
+        record = DROPPED_ITEM if tag == DROPS_TAG else RECORDS.get(tag)
+        if record is None:
+            raise ValueError(f'unknown section {tag}')
+        size = record.size * count
+        if offset + size > len(data):
+            raise ValueError('save game is truncated')
+        sections[tag] = list(record.iter_unpack(data[offset:offset + size]))
+        offset += size
+    return SaveGame(level, seconds, sections)
+
+
+def apply_game(save: SaveGame, game, sprites: list) -> None:
+    """
+    Set the saved state to the sprites of the level (the level must be in its pristine state).
+    Nothing is changed if the save game doesn't match the level.
+    :param save: save game
+    :param game: game (for spawning dropped items)
+    :param sprites: sprites of the level (from the level snapshot)
+    """
+    saved = []
+    for tag, sprite_class, record_format in SAVED_SPRITES:
+        level_sprites = [sprite for sprite in sprites if type(sprite) is sprite_class]
+        records = save.sections.get(tag, ())
+        if len(records) != len(level_sprites):
+            raise ValueError(f'save game does not match the level ({tag.decode()})')
+        saved.append((level_sprites, records, record_format))
+
+    for level_sprites, records, record_format in saved:
+        for sprite, (alive, *state) in zip(level_sprites, records):
+            if record_format:
+                sprite.set_save_state(tuple(state))
+            if not alive:
+                sprite.kill()
+
+    for item_type, x, y in save.sections.get(DROPS_TAG, ()):
+        Item(game, vec(x, y), ITEM_TYPES[item_type])
+
+
+def read_game(filename: str):
+    """
+    Read a save game.
+    :param filename: save file
+    :return: save game or None (if it doesn't exist or can't be read)
+    """
+    try:
+        with open(filename, 'rb') as file:
+            return unpack_game(file.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Warning: Could not load save game {filename}: {e}")
+        return None
+
+
+def write_game(filename: str, data: bytes) -> None:
+    """
+    Write a save game (to a temporary file which replaces the save, so a crash never leaves a broken save).
+    :param filename: save file
+    :param data: save game data
+    """
+    try:
+        makedirs(dirname(filename), exist_ok=True)
+        with open(filename + '.tmp', 'wb') as file:
+            file.write(data)
+            file.flush()
+            fsync(file.fileno())
+        replace(filename + '.tmp', filename)
+    except OSError as e:
+        print(f"Warning: Could not save the game to {filename}: {e}")
+
+
+def get_latest_save(filenames: tuple):
+    """
+    Get the most recently written save file.
+    :param filenames: save files
+    :return: save file or None
+    """
+    saves = [filename for filename in filenames if isfile(filename)]
+    return max(saves, key=getmtime, default=None)
+
+
+class SaveWriter:
+    """
+    Writes save games on a worker thread, so saving takes the game loop only packing the state.
+    """
+
+    def __init__(self):
+        """
+        Initialize save writer.
+        """
+        self.__executor = ThreadPoolExecutor(1, thread_name_prefix='save-writer')
+        self.__jobs = []
+
+    def write(self, filename: str, data: bytes) -> None:
+        """
+        Start writing the save game (saves are written in order).
+        :param filename: save file
+        :param data: save game data
+        """
+        self.__jobs = [job for job in self.__jobs if not job.done()]
+        self.__jobs.append(self.__executor.submit(write_game, filename, data))
+
+    def wait(self) -> None:
+        """
+        Wait until all save games are written.
+        """
+        for job in self.__jobs:
+            job.result()
+        self.__jobs.clear()
@@ -0,0 +1,153 @@
+"""
+Solid map - bitmap of a level's solid pixels, drawn once per map from the rects of the obstacles (they don't move;
+it's drawn when the level is prepared & kept with the prepared level), so "is anything solid here" queries
+are array lookups instead of walking rect lists.
+Every query takes arrays (NumPy arrays or sequences), so a whole batch of sprites is tested in one call.
+Pixels outside the map aren't solid.
+"""
+
+from . import pg
+
+import numpy as np
+
+
+class SolidMap:
+    """
+    Boolean occupancy grid of a level (a pixel for each pixel of the map), kept as two tables made from it:
+    the summed area table gives the number of solid pixels in any rect with 4 lookups
+    & the next solid pixel down each column is looked up for a column scan (a pixel is solid if it's its own).
+    """
+
+    def __init__(self, rects, size: tuple):
+        """
+        Draw the solid map.
+        :param rects: rects of the solid obstacles
+        :param size: map width & height (px)
+        """
+        width, height = size
+        self.__size = (width, height)
+        self.__area = pg.Rect(0, 0, width, height)
+
+        solid = np.zeros((height, width), dtype=bool)
+        for rect in rects:
+            left, top, rect_width, rect_height = pg.Rect(rect).clip(self.__area)
+            solid[top:top + rect_height, left:left + rect_width] = True
+
+        # solid pixels above & left of each pixel (first row & column are zeros)
+        self.__table = np.zeros((height + 1, width + 1), dtype=np.int32)
+        counts = self.__table[1:, 1:]
+        np.cumsum(solid, axis=1, dtype=np.int32, out=counts)  # rows first (contiguous), then down the columns
+        np.cumsum(counts, axis=0, out=counts)
+
+        # y of the first solid pixel at or below each pixel (height if there is none) - a pixel is solid if it's its own
+        dtype = np.int16 if height < np.iinfo(np.int16).max else np.int32
+        self.__below = np.where(solid, np.arange(height, dtype=dtype)[:, np.newaxis], dtype(height))
+        np.minimum.accumulate(self.__below[::-1], axis=0, out=self.__below[::-1])
+
+    @classmethod
+    def from_sprites(cls, sprites, size: tuple, layers: int):
+        """
+        Draw the solid map of obstacle sprites.
+        :param sprites: obstacles (with a rect & a collision layer)
+        :param size: map width & height (px)
+        :param layers: layer mask of the solid obstacles
+        :return: solid map
+        """
+        return cls([sprite.rect for sprite in sprites if sprite.collision_layer & layers], size)
+
+    def get_size(self) -> tuple:
+        """
+        Get map size.
+        :return: width & height (px)
+        """
+        return self.__size
+
+    def get_solid_count(self) -> int:
+        """
+        Get number of solid pixels.
+        :return: number of pixels
+        """
+        return int(self.__table[-1, -1])
+
+    def get_size_in_bytes(self) -> int:
+        """
+        Get number of bytes held by the tables.
+        :return: bytes
+        """
+        return self.__table.nbytes + self.__below.nbytes
+
+    def is_solid(self, xs, ys) -> np.ndarray:
+        """
+        Test points.
+        :param xs: x positions
+        :param ys: y positions
+        :return: True for each solid point
+        """
+        xs, ys = np.asarray(xs, dtype=np.intp), np.asarray(ys, dtype=np.intp)
+        width, height = self.__size
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        solid = np.zeros(xs.shape, dtype=bool)
+        solid[inside] = self.__below[ys[inside], xs[inside]] == ys[inside]
+        return solid
+
+    def collide_rect(self, rect) -> bool:
+        """
+        Test a rect (a rect collides if any pixel in it is solid - same as colliderect() with the obstacles).
+        :param rect: rect
+        :return: True if a pixel in the rect is solid
+        """
+        left, top, width, height = rect.clip(self.__area)
+        if not width or not height:
+            return False
+        right, bottom = left + width, top + height
+        table = self.__table
+        return bool(table[bottom, right] - table[top, right] != table[bottom, left] - table[top, left])
+
+    def collide_rects(self, rects) -> np.ndarray:
+        """
+        Test a batch of rects (like collide_rect()).
+        :param rects: rects (x, y, width, height)
+        :return: True for each rect with a solid pixel
+        """
+        rects = np.asarray(rects, dtype=np.intp).reshape(-1, 4)
+        width, height = self.__size
+        bounds = rects.copy()
+        bounds[:, 2:] += rects[:, :2]
+        left, top, right, bottom = np.clip(bounds, 0, (width, height, width, height)).T
+        table = self.__table
+        count = table[bottom, right] - table[top, right] - table[bottom, left] + table[top, left]
+        return (count > 0) & (right > left) & (bottom > top)
+
+    def scan_columns(self, xs, tops, bottoms) -> np.ndarray:
+        """
+        Scan columns down - find the first solid pixel of each column between a top & a bottom (e.g. ground below).
+        :param xs: column x positions
+        :param tops: first y to scan in each column
+        :param bottoms: y where the scan of each column stops (not scanned)
+        :return: y of the first solid pixel in each column (-1 if there is none)
+        """
+        xs, tops, bottoms = np.broadcast_arrays(*(np.asarray(values, dtype=np.intp) for values in (xs, tops, bottoms)))
+        width, height = self.__size
+        inside = (xs >= 0) & (xs < width) & (tops < height)
+        below = np.full(xs.shape, height, dtype=np.intp)
+        below[inside] = self.__below[np.maximum(tops[inside], 0), xs[inside]]
+        return np.where(below < np.minimum(bottoms, height), below, -1)
+
+    def cast_rays(self, starts, ends) -> tuple:
+        """
+        Cast rays - find the first solid pixel on each segment (from the start to the end).
+        Segments are sampled at least once per pixel, so they can't skip a solid pixel.
+        :param starts: start positions (x, y)
+        :param ends: end positions (x, y)
+        :return: True for each ray which hits & the positions of the hits (x, y; the end if there is no hit)
+        """
+        starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+        steps = int(np.abs(ends - starts).max(initial=0)) + 2
+        t = np.linspace(0, 1, steps)[np.newaxis, :, np.newaxis]
+        points = np.floor(starts[:, np.newaxis] + (ends - starts)[:, np.newaxis] * t).astype(np.intp)
+
+        solid = self.is_solid(points[..., 0], points[..., 1])
+        hit = solid.any(axis=1)
+        first = np.where(hit, solid.argmax(axis=1), steps - 1)
+        return hit, points[np.arange(len(points)), first]
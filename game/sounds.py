@@ -1,5 +1,13 @@
+from os import makedirs, replace
 from os.path import join
-from .config import MUSIC_DIR, MENU_SOUNDS_DIR, PLAYER_SOUNDS_DIR, ZOMBIE_SOUNDS_DIR, SFX_DIR
+from . import pg
+from .config import MUSIC_DIR, MENU_SOUNDS_DIR, PLAYER_SOUNDS_DIR, ZOMBIE_SOUNDS_DIR, SFX_DIR, SOUND_CACHE_DIR
+from .pack import open_asset
+from .assets import asset_cache
+from hashlib import sha1
+from threading import Lock, Thread
+import io
+import mmap
 
 
 def play_sound(sound_on, sound, volume=None) -> None:
@@ -19,6 +27,172 @@ def play_sound(sound_on, sound, volume=None) -> None:
         sound.play()
 
 
+def decode_sound(path: str) -> pg.mixer.Sound:
+    """
+    Decode sound (from the asset pack if it's packed).
+    Decoded samples are kept in the sound cache directory (keyed by the file hash & mixer format),
+    so next time the sound is made from them without decoding the file.
+    :param path: sound file
+    :return: pygame sound
+    """
+    with open_asset(path) as f:
+        data = f.read()
+
+    if SOUND_CACHE_DIR is None:
+        return pg.mixer.Sound(io.BytesIO(data))
+
+    digest = sha1(data)
+    digest.update(repr(pg.mixer.get_init()).encode())
+    cache_file = join(SOUND_CACHE_DIR, digest.hexdigest() + '.pcm')
+
+    # cached samples
+    try:
+        with open(cache_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as samples:
+            return pg.mixer.Sound(buffer=samples)
+    except (OSError, ValueError):
+        pass
+
+    # decode & cache the samples
+    sound = pg.mixer.Sound(io.BytesIO(data))
+    try:
+        makedirs(SOUND_CACHE_DIR, exist_ok=True)
+        with open(cache_file + '.tmp', 'wb') as f:
+            f.write(sound.get_raw())
+        replace(cache_file + '.tmp', cache_file)
+    except OSError as e:
+        print(f"Warning: Could not cache sound {path}: {e}")
+    return sound
+
+
+# sounds can be loaded by the main thread & the pre-warm thread at the same time
+sound_lock = Lock()
+
+
+def load_sound(path: str) -> pg.mixer.Sound:
+    """
+    Get sound through the shared asset cache (each sound file is decoded only once).
+    :param path: sound file
+    :return: pygame sound
+    """
+    with sound_lock:
+        return asset_cache.get(('sound', path), lambda: decode_sound(path))
+
+
+def prewarm_sounds(paths: list) -> Thread:
+    """
+    Load sounds in a background thread, so they are ready before they are played for the first time.
+    :param paths: sound files (in the order to load them)
+    :return: pre-warm thread
+    """
+    def prewarm() -> None:
+        for path in paths:
+            try:
+                load_sound(path)
+            except pg.error:
+                pass  # reported when the sound is played
+
+    thread = Thread(target=prewarm, name='sound pre-warm', daemon=True)
+    thread.start()
+    return thread
+
+
+class LazySound:
+    """
+    Sound which is loaded when it's played for the first time.
+    Has the same methods as pg.mixer.Sound which the menus & sprites use; volume can be set before it's loaded.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize lazy sound.
+        :param path: sound file
+        """
+        self.path = path
+        self.__volume = 1.0
+        self.__sound = None
+
+    def get_sound(self) -> pg.mixer.Sound:
+        """
+        Get the sound (load it if it's not loaded yet).
+        If the sound can't be loaded, a silent sound is used.
+        :return: pygame sound
+        """
+        if self.__sound is None:
+            try:
+                self.__sound = load_sound(self.path)
+            except pg.error as e:
+                print(f"Warning: Could not load sound {self.path}: {e}")
+                self.__sound = pg.mixer.Sound(buffer=bytes(4))
+            self.__sound.set_volume(self.__volume)
+        return self.__sound
+
+    def is_loaded(self) -> bool:
+        """
+        Check if the sound is loaded.
+        :return: True if loaded
+        """
+        return self.__sound is not None
+
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> pg.mixer.Channel:
+        """
+        Play the sound.
+        :param loops: number of repeats
+        :param maxtime: stop playing after this time (ms)
+        :param fade_ms: fade in time (ms)
+        :return: channel the sound plays on
+        """
+        return self.get_sound().play(loops, maxtime, fade_ms)
+
+    def stop(self) -> None:
+        """
+        Stop the sound (if it's loaded).
+        """
+        if self.__sound is not None:
+            self.__sound.stop()
+
+    def fadeout(self, time: int) -> None:
+        """
+        Fade out the sound (if it's loaded).
+        :param time: fade out time (ms)
+        """
+        if self.__sound is not None:
+            self.__sound.fadeout(time)
+
+    def set_volume(self, volume: float) -> None:
+        """
+        Set sound volume.
+        :param volume: volume (0.0 - 1.0)
+        """
+        self.__volume = volume
+        if self.__sound is not None:
+            self.__sound.set_volume(volume)
+
+    def get_volume(self) -> float:
+        """
+        Get sound volume.
+        :return: volume
+        """
+        if self.__sound is not None:
+            return self.__sound.get_volume()
+        return self.__volume
+
+    def get_num_channels(self) -> int:
+        """
+        Get number of channels the sound is playing on.
+        :return: number of channels
+        """
+        if self.__sound is not None:
+            return self.__sound.get_num_channels()
+        return 0
+
+    def get_length(self) -> float:
+        """
+        Get sound length.
+        :return: length in seconds
+        """
+        return self.get_sound().get_length()
+
+
 # ========== SOUNDS ==========
 BG_MUSIC = join(MUSIC_DIR, 'game_music.ogg')
 
@@ -30,6 +204,9 @@ MENU_OUT_SOUND = join(MENU_SOUNDS_DIR, 'menu_out.ogg')
 SWITCH_TOGGLE_SOUND = join(MENU_SOUNDS_DIR, 'toggle.ogg')
 GAME_OVER_MUSIC = join(MUSIC_DIR, 'game_over_music.ogg')
 
+# long tracks which are streamed (not decoded into memory)
+STREAMED_MUSIC = [BG_MUSIC, MENU_MUSIC, GAME_OVER_MUSIC]
+
 # player sounds
 PLAYER_HIT_SOUND = join(PLAYER_SOUNDS_DIR, 'hit/player_hit.ogg')
 PLAYER_JUMP_SOUND = join(PLAYER_SOUNDS_DIR, 'jump/player_jump.ogg')
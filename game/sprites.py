@@ -2,8 +2,10 @@ from . import pg, vec
 from .config import *
 from .images import *
 from .sounds import play_sound
+from .assets import load_image, load_font, load_rotation_frames, asset_cache, OPAQUE
+from .colliders import Circle, AABB, get_mask_bounds, mask_box
+from .spritesheet import AnimationClip
 
-from pygame.transform import flip, scale
 from random import randint, choice, random
 from itertools import chain
 from pytweening import easeInOutSine
@@ -27,18 +29,31 @@ class Player(pg.sprite.Sprite):
         self.groups = game.all_sprites
         pg.sprite.Sprite.__init__(self, self.groups)
         self.game = game
+        self.collision_layer = PLAYER_LAYER
 
         self.main_menu = self.game.main_menu
+        self.__spawn_pos = vec(x, y)
 
         # load player data
         self.__load_data()
 
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the player to its spawn state (when it's made & when the level starts again from its snapshot).
+        Controls & sound settings are read (they could be changed in the menu) & the animation timer starts.
+        """
+        self.__load_controls()
+        self.__load_sound_settings()
+
         # player image (starting)
-        self.image = self.__idle_frames_right[0]
+        self.image = self.__idle.right[0]
+        self.mask = self.__idle.right_masks[0]
         self.rect = self.image.get_rect()
 
         # movement vectors
-        self.__pos = vec(x, y)
+        self.__pos = vec(self.__spawn_pos)
         self.__vel = vec(0, 0)
         self.__acc = vec(0, 0)
 
@@ -56,7 +71,7 @@ class Player(pg.sprite.Sprite):
         self.__sliding = False
         self.__sliding_counter = 0  # for auto-sliding
         self.__current_frame = 0
-        self.__last_update = 0
+        self.__last_update = pg.time.get_ticks()
 
         # attacking
         self.__shooting = False
@@ -85,6 +100,7 @@ class Player(pg.sprite.Sprite):
     def __process_animations(self) -> None:
         """
         Animate player sprite.
+        Image & mask are changed only when the frame changes (masks are precomputed).
         """
         now = pg.time.get_ticks()
 
@@ -98,12 +114,9 @@ class Player(pg.sprite.Sprite):
         if self.__on_ground and not self.__walking:
             if now - self.__last_update > 90:
                 self.__last_update = now
-                self.__current_frame = (self.__current_frame + 1) % len(self.__idle_frames_right)
+                self.__current_frame = (self.__current_frame + 1) % len(self.__idle.right)
                 bottom = self.rect.bottom
-                if self.__FACING_RIGHT:
-                    self.image = self.__idle_frames_right[self.__current_frame]
-                else:
-                    self.image = self.__idle_frames_left[self.__current_frame]
+                self.__set_frame(self.__idle, self.__FACING_RIGHT)
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
@@ -111,12 +124,9 @@ class Player(pg.sprite.Sprite):
         if self.__walking and not self.__jumping:
             if now - self.__last_update > 100:
                 self.__last_update = now
-                self.__current_frame = (self.__current_frame + 1) % len(self.__run_frames_right)
+                self.__current_frame = (self.__current_frame + 1) % len(self.__run.right)
                 bottom = self.rect.bottom
-                if self.__vel.x > 0:  # run right
-                    self.image = self.__run_frames_right[self.__current_frame]
-                else:  # run left
-                    self.image = self.__run_frames_left[self.__current_frame]
+                self.__set_frame(self.__run, self.__vel.x > 0)  # run right/left
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
@@ -124,12 +134,9 @@ class Player(pg.sprite.Sprite):
         if self.__walking and self.__jumping:
             if now - self.__last_update > 100:
                 self.__last_update = now
-                self.__current_frame = (self.__current_frame + 1) % len(self.__jump_frames_right)
+                self.__current_frame = (self.__current_frame + 1) % len(self.__jump.right)
                 bottom = self.rect.bottom
-                if self.__vel.x > 0:  # run right
-                    self.image = self.__jump_frames_right[self.__current_frame]
-                else:  # run left
-                    self.image = self.__jump_frames_left[self.__current_frame]
+                self.__set_frame(self.__jump, self.__vel.x > 0)  # run right/left
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
@@ -137,11 +144,8 @@ class Player(pg.sprite.Sprite):
         if self.__jumping and not self.__shooting:
             if now - self.__last_update > 100:
                 self.__last_update = now
-                self.__current_frame = (self.__current_frame + 1) % len(self.__jump_frames_right)
-                if self.__FACING_RIGHT:
-                    self.image = self.__jump_frames_right[self.__current_frame]
-                else:
-                    self.image = self.__jump_frames_left[self.__current_frame]
+                self.__current_frame = (self.__current_frame + 1) % len(self.__jump.right)
+                self.__set_frame(self.__jump, self.__FACING_RIGHT)
                 self.rect = self.image.get_rect()
 
         # jumping & shooting
@@ -149,11 +153,8 @@ class Player(pg.sprite.Sprite):
             if now - self.__last_update > 80:
                 self.__last_update = now
                 bottom = self.rect.bottom
-                self.__current_frame = (self.__current_frame + 1) % len(self.__jump_shoot_frames_right)
-                if self.__FACING_RIGHT:
-                    self.image = self.__jump_shoot_frames_right[self.__current_frame]
-                else:
-                    self.image = self.__jump_shoot_frames_left[self.__current_frame]
+                self.__current_frame = (self.__current_frame + 1) % len(self.__jump_shoot.right)
+                self.__set_frame(self.__jump_shoot, self.__FACING_RIGHT)
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
@@ -162,11 +163,8 @@ class Player(pg.sprite.Sprite):
             if now - self.__last_update > 70:
                 self.__last_update = now
                 bottom = self.rect.bottom
-                self.__current_frame = (self.__current_frame + 1) % len(self.__shooting_frames_right)
-                if self.__FACING_RIGHT:
-                    self.image = self.__shooting_frames_right[self.__current_frame]
-                else:
-                    self.image = self.__shooting_frames_left[self.__current_frame]
+                self.__current_frame = (self.__current_frame + 1) % len(self.__shooting_clip.right)
+                self.__set_frame(self.__shooting_clip, self.__FACING_RIGHT)
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
@@ -176,11 +174,8 @@ class Player(pg.sprite.Sprite):
             if now - self.__last_update > 80:
                 self.__last_update = now
                 bottom = self.rect.bottom
-                self.__current_frame = (self.__current_frame + 1) % len(self.__run_shoot_frames_right)
-                if self.__FACING_RIGHT:
-                    self.image = self.__run_shoot_frames_right[self.__current_frame]
-                else:
-                    self.image = self.__run_shoot_frames_left[self.__current_frame]
+                self.__current_frame = (self.__current_frame + 1) % len(self.__run_shoot.right)
+                self.__set_frame(self.__run_shoot, self.__FACING_RIGHT)
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
         else:
@@ -191,12 +186,9 @@ class Player(pg.sprite.Sprite):
             if now - self.__last_update > 50:
                 self.__last_update = now
                 bottom = self.rect.bottom
-                self.__current_frame = (self.__current_frame + 1) % len(self.__sliding_frames_right)
+                self.__current_frame = (self.__current_frame + 1) % len(self.__sliding_clip.right)
                 self.__sliding_counter += 1  # increment sliding counter (auto sliding)
-                if self.__FACING_RIGHT:
-                    self.image = self.__sliding_frames_right[self.__current_frame]
-                else:
-                    self.image = self.__sliding_frames_left[self.__current_frame]
+                self.__set_frame(self.__sliding_clip, self.__FACING_RIGHT)
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
@@ -208,73 +200,50 @@ class Player(pg.sprite.Sprite):
         # set the position of sprite
         self.rect.midbottom = self.__pos  # fix the bug where the player disappears
 
-        # for precise collisions
-        self.mask = pg.mask.from_surface(self.image)
+    def __set_frame(self, clip: AnimationClip, facing_right: bool, frame: int = None) -> None:
+        """
+        Set the image & its precomputed mask (for precise collisions).
+        :param clip: animation clip
+        :param facing_right: True for right frames, False for left frames
+        :param frame: frame index (current frame if not given)
+        """
+        if frame is None:
+            frame = self.__current_frame
+        if facing_right:
+            self.image = clip.right[frame]
+            self.mask = clip.right_masks[frame]
+        else:
+            self.image = clip.left[frame]
+            self.mask = clip.left_masks[frame]
 
     # ===== Load player data =====
     def __load_data(self) -> None:
         """
         Load all player data.
-        Images, controls, sounds & sounds settings.
+        Images & sounds (controls & sounds settings are read when the player is reset).
         """
         self.__load_images()
-        self.__load_controls()
         self.__load_sounds()
 
     def __load_images(self) -> None:
         """
         Load all player related images.
         """
-        # access player sprite sheet
-        load_img = self.game.player_sprite_sheet.parse_sprite
-
-        # idle
-        self.__idle_frames_right = [load_img('idle_{}.png'.format(i)) for i in range(10)]
-        self.__idle_frames_left = [flip(img, True, False) for img in self.__idle_frames_right]
+        # access player sprite sheet (clips are shared, made only once)
+        get_clip = self.game.player_sprite_sheet.get_clip
 
-        # jump
-        self.__jump_frames_right = [load_img('jump_{}.png'.format(i)) for i in range(10)]
-        self.__jump_frames_left = [flip(img, True, False) for img in self.__jump_frames_right]
-
-        # falling
-        self.__falling_frames_right = [self.__jump_frames_right[6], self.__jump_frames_right[7],
-                                       self.__jump_frames_right[8]]
-        self.__falling_frames_left = [flip(img, True, False) for img in self.__falling_frames_right]
-
-        # jump shoot
-        self.__jump_shoot_frames_right = [load_img('jump_shoot_{}.png'.format(i)) for i in range(5)]
-        self.__jump_shoot_frames_left = [flip(img, True, False) for img in self.__jump_shoot_frames_right]
-
-        # run
-        self.__run_frames_right = [load_img('run_{}.png'.format(i)) for i in range(8)]
-        self.__run_frames_left = [flip(img, True, False) for img in self.__run_frames_right]
-
-        # run shoot
-        self.__run_shoot_frames_right = [load_img('run_shoot_{}.png'.format(i)) for i in range(9)]
-        self.__run_shoot_frames_left = [flip(img, True, False) for img in self.__run_shoot_frames_right]
-
-        # shooting
-        self.__shooting_frames_right = [load_img('shoot_{}.png'.format(i)) for i in range(4)]
-        self.__shooting_frames_left = [flip(img, True, False) for img in self.__shooting_frames_right]
-
-        # sliding
-        self.__sliding_frames_right = [load_img('slide_{}.png'.format(i)) for i in range(10)]
-        self.__sliding_frames_left = [flip(img, True, False) for img in self.__sliding_frames_right]
+        self.__idle = get_clip('idle')
+        self.__jump = get_clip('jump')  # falling frames are jump frames 6-8
+        self.__jump_shoot = get_clip('jump_shoot')
+        self.__run = get_clip('run')
+        self.__run_shoot = get_clip('run_shoot')
+        self.__shooting_clip = get_clip('shoot')
+        self.__sliding_clip = get_clip('slide')
 
     def __load_sounds(self) -> None:
         """
-        Load player sounds and sounds settings.
+        Load player sounds.
         """
-        # settings
-        self.__jump_sound_on = self.main_menu.player_jump_sound_on
-        self.__hit_sound_on = self.main_menu.player_hit_sound_on
-        self.__gun_sound_on = self.main_menu.gun_sound_on
-        self.__burn_sound_on = self.main_menu.burn_sound_on
-        self.__health_pickup_sound_on = self.main_menu.health_pickup_sound_on
-        self.__xp_coin_sound_on = self.main_menu.xp_coin_sound_on
-        self.__key_pickup_sound_on = self.main_menu.key_pickup_sound_on
-
-        # sounds
         self.__jump_sound = self.main_menu.player_jump_sound
         self.__hit_sound = self.main_menu.player_hit_sound
         self.__gun_sound = self.main_menu.gun_sound
@@ -284,6 +253,18 @@ class Player(pg.sprite.Sprite):
         self.__coin_pickup_sound = self.main_menu.coin_pickup_sound
         self.__key_pickup_sound = self.main_menu.key_pickup_sound
 
+    def __load_sound_settings(self) -> None:
+        """
+        Load sounds settings from main menu.
+        """
+        self.__jump_sound_on = self.main_menu.player_jump_sound_on
+        self.__hit_sound_on = self.main_menu.player_hit_sound_on
+        self.__gun_sound_on = self.main_menu.gun_sound_on
+        self.__burn_sound_on = self.main_menu.burn_sound_on
+        self.__health_pickup_sound_on = self.main_menu.health_pickup_sound_on
+        self.__xp_coin_sound_on = self.main_menu.xp_coin_sound_on
+        self.__key_pickup_sound_on = self.main_menu.key_pickup_sound_on
+
     def __load_controls(self) -> None:
         """
         Load controls from main menu (settings.json) and convert them to integer (unicode).
@@ -418,6 +399,28 @@ class Player(pg.sprite.Sprite):
         """
         self.__score = self.get_score() + points
 
+    # save games
+    def get_save_state(self) -> tuple:
+        """
+        Get the state kept in save games.
+        :return: position, velocity & acceleration (x, y), health, score, key & movement flags
+        """
+        return (*self.__pos, *self.__vel, *self.__acc, self.__health, self.__score, self.__has_key,
+                self.__FACING_RIGHT, self.__jumping, self.__on_ground, self.__sliding, self.__sliding_counter)
+
+    def set_save_state(self, state: tuple) -> None:
+        """
+        Set the state from a save game.
+        :param state: state from get_save_state()
+        """
+        (pos_x, pos_y, vel_x, vel_y, acc_x, acc_y, self.__health, self.__score, self.__has_key, self.__FACING_RIGHT,
+         self.__jumping, self.__on_ground, self.__sliding, self.__sliding_counter) = state
+        self.__pos = vec(pos_x, pos_y)
+        self.__vel = vec(vel_x, vel_y)
+        self.__acc = vec(acc_x, acc_y)
+        self.rect.x = self.__pos.x
+        self.rect.bottom = self.__pos.y
+
     # shooting
     def __check_shooting(self) -> None:
         """
@@ -564,37 +567,35 @@ class Player(pg.sprite.Sprite):
         """
         Check for collisions when moving left-right.
         """
-        hits = pg.sprite.spritecollide(self, self.game.obstacles, False)
+        hits = self.game.obstacle_grid.collide(self, PLAYER_COLLISION_LAYERS)
         for obstacle in hits:
-            if obstacle.get_type() == 'ground':
-                # right
-                if self.__vel.x > 0:
-                    self.__pos.x = obstacle.rect.left - (self.rect.w + 2)  # 2 fixes collision
-                    self.rect.x = self.__pos.x - 5  # -5 prevents snapping player on the upper platform
-                # left
-                elif self.__vel.x < 0:
-                    self.__pos.x = obstacle.rect.right
-                    self.rect.x = self.__pos.x + 5  # +5 prevents snapping player on the upper platform
+            # right
+            if self.__vel.x > 0:
+                self.__pos.x = obstacle.rect.left - (self.rect.w + 2)  # 2 fixes collision
+                self.rect.x = self.__pos.x - 5  # -5 prevents snapping player on the upper platform
+            # left
+            elif self.__vel.x < 0:
+                self.__pos.x = obstacle.rect.right
+                self.rect.x = self.__pos.x + 5  # +5 prevents snapping player on the upper platform
 
     def __check_collisions_y(self) -> None:
         """
         Check for collisions when moving up-down.
         """
-        hits = pg.sprite.spritecollide(self, self.game.obstacles, False)
+        hits = self.game.obstacle_grid.collide(self, PLAYER_COLLISION_LAYERS)
         for obstacle in hits:
-            if obstacle.get_type() == 'ground':
-                # falling
-                if self.__vel.y > 0:
-                    self.__on_ground = True
-                    self.__jumping = False
-                    self.__vel.y = 0
-                    self.__pos.y = obstacle.rect.top
-                    self.rect.bottom = self.__pos.y + 4  # set player's bottom to that position (+4 puts player down)
-                # going up (jumping)
-                if self.__vel.y < 0:
-                    self.__vel.y = 0
-                    self.__pos.y = obstacle.rect.bottom + self.rect.h
-                    self.rect.bottom = self.__pos.y
+            # falling
+            if self.__vel.y > 0:
+                self.__on_ground = True
+                self.__jumping = False
+                self.__vel.y = 0
+                self.__pos.y = obstacle.rect.top
+                self.rect.bottom = self.__pos.y + 4  # set player's bottom to that position (+4 puts player down)
+            # going up (jumping)
+            if self.__vel.y < 0:
+                self.__vel.y = 0
+                self.__pos.y = obstacle.rect.bottom + self.rect.h
+                self.rect.bottom = self.__pos.y
 
     def __limit_walking_area(self) -> None:
         """
@@ -617,10 +618,7 @@ class Player(pg.sprite.Sprite):
         Set falling image.
         Used when player is free falling, or in acid.
         """
-        if self.__FACING_RIGHT:
-            self.image = self.__falling_frames_right[0]
-        else:
-            self.image = self.__falling_frames_left[0]
+        self.__set_frame(self.__jump, self.__FACING_RIGHT, 6)  # first falling frame
 
     # jump & slide
     def jump(self) -> None:
@@ -656,13 +654,10 @@ class Player(pg.sprite.Sprite):
     # collisions
     def __check_collisions(self) -> None:
         """
-        Check all collisions.
+        Check collisions with the hazards which don't move (zombies, saws & items are checked in the collision phase).
         """
         self.__check_acid_collision()
         self.__check_spikes_collision()
-        self.__check_zombie_attacks()
-        self.__check_saw_collision()
-        self.__check_item_pickup()
 
     def __check_acid_collision(self) -> None:
         """
@@ -699,26 +694,25 @@ class Player(pg.sprite.Sprite):
                 # game over message
                 self.set_dead_message('spikes')
 
-    def __check_saw_collision(self) -> None:
+    def hit_saws(self, saws: list) -> None:
         """
-        Check for saw collision.
+        Saws hit the player (called by the collision phase).
+        :param saws: saws touching the player
         """
-        hits = pg.sprite.spritecollide(self, self.game.saws, False, pg.sprite.collide_circle_ratio(0.9))
-        if hits:
-            self.__pos += vec(SAW_KNOCK_BACK)
-            for saw in hits:
-                saw.deal_damage()
-                play_sound(self.__hit_sound_on, self.__hit_sound)
-                # game over message
-                self.set_dead_message('saw')
+        self.__pos += vec(SAW_KNOCK_BACK)
+        for saw in saws:
+            saw.deal_damage()
+            play_sound(self.__hit_sound_on, self.__hit_sound)
+            # game over message
+            self.set_dead_message('saw')
 
-    def __check_zombie_attacks(self) -> None:
+    def hit_zombies(self, zombies: list) -> None:
         """
-        Zombie attacking player.
+        Zombies attacking player (called by the collision phase).
+        :param zombies: zombies touching the player
         """
-        hit_zombies = pg.sprite.spritecollide(self, self.game.zombies, False, pg.sprite.collide_mask)
-        if hit_zombies:
-            for zombie in hit_zombies:
+        if zombies:
+            for zombie in zombies:
                 if zombie.is_attacking():
                     if zombie.get_pos().x > self.__pos.x:  # player is left
                         self.__pos += vec(-ZOMBIE_KNOCK_BACK, 0)
@@ -730,12 +724,12 @@ class Player(pg.sprite.Sprite):
                     self.set_dead_message('zombies')
 
     # items
-    def __check_item_pickup(self) -> None:
+    def pick_up_items(self, items: list) -> None:
         """
-        Check for item collision (pickup).
+        Pick up the items (called by the collision phase).
+        :param items: items touching the player
         """
-        collected_items = pg.sprite.spritecollide(self, self.game.items, False, pg.sprite.collide_mask)
-        for item in collected_items:
+        for item in items:
             # key (for door switch)
             if item.get_type() == 'key':
                 self.__pick_up_key()
@@ -807,7 +801,7 @@ class Player(pg.sprite.Sprite):
         """
         Draw player health bar.
         """
-        health_icon = scale(pg.image.load(HEALTH_PACK_IMAGE), (27, 27)).convert_alpha()
+        health_icon = load_image(HEALTH_PACK_IMAGE, (27, 27))
 
         surface = self.game.display
 
@@ -845,7 +839,7 @@ class Player(pg.sprite.Sprite):
         """
         Draw player gun cool down bar.
         """
-        bullet_icon = scale(pg.image.load(BULLET_ICON), (27, 27)).convert_alpha()
+        bullet_icon = load_image(BULLET_ICON, (27, 27))
 
         surface = self.game.display
 
@@ -903,7 +897,7 @@ class Player(pg.sprite.Sprite):
         x = WIDTH / 2 - 750
         y = HEIGHT / 2 - offset
 
-        font = pg.font.Font(FONT, 25)
+        font = load_font(FONT, 25)
         score_text = font.render(f'Score: {str(self.__score)}', True, WHITE)
         self.game.display.blit(score_text, (x, y))
 
@@ -912,7 +906,8 @@ class Player(pg.sprite.Sprite):
         Apply acid damage color on player.
         """
         damage_alpha = chain(DAMAGE_ALPHA)
-        self.image.fill((255, 0, 0, next(damage_alpha)), special_flags=pg.BLEND_RGBA_MULT)
+        self.image = self.image.copy()  # images are shared, so color the copy
+        self.image.fill((255, 0, 0, next(damage_alpha)), special_flags=pg.BLEND_RGB_MULT)
 
 
 class Bullet(pg.sprite.Sprite):
@@ -931,49 +926,43 @@ class Bullet(pg.sprite.Sprite):
         self.groups = game.all_sprites, game.bullets
         pg.sprite.Sprite.__init__(self, self.groups)
         self.game = game
+        self.collision_layer = BULLET_LAYER
 
         # player reference
         self.__player = self.game.player
 
-        # image
-        self.__load_images()
-        self.image = self.__images[0]
-        self.rect = self.image.get_rect()
-
-        # movement
+        # image (frames are shared by all bullets)
+        self.__images = self.game.player_sprite_sheet.get_clip('bullet')
         self.__direction = direction
-        self.__pos = vec(pos)
-        self.__vel = self.__direction * BULLET_SPEED
-        self.rect.center = pos
+        self.__facing_right = self.__direction == vec(1, 0)
 
         # animation
         self.__spawn_time = pg.time.get_ticks()  # for killing it
         self.__last_update = 0
         self.__current_frame = 0
 
+        self.__set_frame()
+        self.rect = self.image.get_rect()
+
+        # movement
+        self.__pos = vec(pos)
+        self.__vel = self.__direction * BULLET_SPEED
+        self.rect.center = pos
+        self.__last_rect = self.rect.copy()  # rect before the last move (swept by the collision phase)
+
         # if gun upgrade on
         self.__gun_upgrade_on = self.game.main_menu.gun_upgrade_on
         self.__adjust_bullet_damage()
 
-        self.mask = pg.mask.from_surface(self.image)
-
     def update(self) -> None:
         """
-        Update bullet sprite.
+        Update bullet sprite (hits are checked in the collision phase).
         """
+        self.__last_rect = self.rect.copy()
         self.__animate()
         self.__move()
-        self.__check_collisions()
         self.__check_lifetime()
 
-    def __load_images(self) -> None:
-        """
-        Parse bullet images from player sprite sheet.
-        """
-        self.__images = [self.game.player_sprite_sheet.parse_sprite('bullet_{}.png'.format(i)) for i in range(5)]
-        self.__images = [scale(img, (int(img.get_width() // 1.5), int(img.get_height() // 1.5))) for img in
-                         self.__images]
-
     def __adjust_bullet_damage(self) -> None:
         """
         Adjust bullet damage if gun upgrade turned on.
@@ -1003,13 +992,21 @@ class Bullet(pg.sprite.Sprite):
         now = pg.time.get_ticks()
         if now - self.__last_update > 30:
             self.__last_update = now
-            self.__current_frame = (self.__current_frame + 1) % len(self.__images)
-            if self.__direction == vec(1, 0):
-                self.image = self.__images[self.__current_frame]
-            else:
-                self.image = flip(self.__images[self.__current_frame], True, False)
+            self.__current_frame = (self.__current_frame + 1) % len(self.__images.right)
+            self.__set_frame()
             self.rect = self.image.get_rect()
 
+    def __set_frame(self) -> None:
+        """
+        Set the current frame image & mask (based on direction).
+        """
+        if self.__facing_right:
+            self.image = self.__images.right[self.__current_frame]
+            self.mask = self.__images.right_masks[self.__current_frame]
+        else:
+            self.image = self.__images.left[self.__current_frame]
+            self.mask = self.__images.left_masks[self.__current_frame]
+
     def __move(self) -> None:
         """
         Move the bullet.
@@ -1018,91 +1015,58 @@ class Bullet(pg.sprite.Sprite):
         self.__pos += self.__vel * self.game.delta_time
         self.rect.center = self.__pos  # update rect to that location
 
-    def __check_collisions(self) -> None:
+    def get_last_rect(self) -> pg.Rect:
         """
-        Check for collision and kill the bullet if something is hit.
+        Get bullet rect before the last move.
+        :return: rect
         """
+        return self.__last_rect
 
-        # zombies
-        self.__check_zombie_hit()
-
-        # walls
-        self.__check_wall_hit()
-
-        # saws
-        self.__check_saw_hit()
-
-        # spikes
-        self.__check_spikes_hit()
-
-        # lasers
-        self.__check_laser_hit()
-
-        # laser machines
-        self.__check_laser_machine_hit()
-
-    def __check_laser_machine_hit(self) -> None:
+    def move_back(self, topleft: tuple) -> None:
         """
-        Check laser machine hits.
+        Move the bullet back along its path (to what it passed through since the last frame).
+        :param topleft: rect top left position
         """
-        hits = pg.sprite.spritecollide(self, self.game.laser_machines, False, pg.sprite.collide_mask)
-        if hits:
-            for machine in hits:
-                self.kill()
-                machine.damage_laser_machine(self.__hazard_damage)
-                if machine.get_times_hit() == machine.get_health():
-                    machine.kill()
-                    Explosion(self.game, machine.get_pos() + (32, 32))
-                    self.__player.add_points(LASER_MACHINE_POINTS)
+        self.rect.topleft = topleft
+        self.__pos = vec(self.rect.center)
 
-    def __check_wall_hit(self) -> None:
+    # hits (found by the collision phase)
+    def hit_zombies(self, zombies: list) -> None:
         """
-        Check if wall hit and kill the bullet.
+        Hurt the zombies & kill the bullet.
+        :param zombies: zombies hit
         """
-        hits = pg.sprite.spritecollide(self, self.game.obstacles, False)
-        for obstacle in hits:
-            if obstacle.get_type() == 'ground':
-                self.kill()
+        for zombie in zombies:
+            play_sound(self.game.main_menu.zombie_hit_sound_on, self.game.main_menu.zombie_hit_sound)
+            zombie.hurt(self.__damage)
+        self.kill()
 
-    def __check_saw_hit(self) -> None:
+    def hit_saws(self, saws: list) -> None:
         """
-        Check if saw hit and kill the bullet.
+        Damage the saws & kill the bullet.
         If saw is hit x number of times, destroy it and create explosion.
+        :param saws: saws hit
         """
-        saw_hits = pg.sprite.spritecollide(self, self.game.saws, False, pg.sprite.collide_mask)
-        if saw_hits:
-            for saw in saw_hits:
-                self.kill()  # kill the bullet
-                saw.damage_saw(self.__hazard_damage)
-                if saw.get_times_hit() == saw.get_health():
-                    saw.kill()  # kill the saw
-                    Explosion(self.game, saw.get_pos())
-                    self.__player.add_points(SAW_POINTS)
+        self.kill()  # kill the bullet
+        for saw in saws:
+            saw.damage_saw(self.__hazard_damage)
+            if saw.get_times_hit() == saw.get_health():
+                saw.kill()  # kill the saw
+                Explosion(self.game, saw.get_pos())
+                self.__player.add_points(SAW_POINTS)
 
-    def __check_laser_hit(self) -> None:
+    def hit_laser_machines(self, machines: list) -> None:
         """
-        Check if laser hit and kill the bullet.
+        Damage the laser machines & kill the bullet.
+        :param machines: laser machines hit
         """
-        if pg.sprite.spritecollide(self, self.game.lasers, False, pg.sprite.collide_mask):
-            self.kill()
-
-    def __check_zombie_hit(self) -> None:
-        """
-        Check for zombie hits.
-        """
-        zombies_hit = pg.sprite.groupcollide(self.game.zombies, self.game.bullets, False, True, pg.sprite.collide_mask)
-        if zombies_hit:
-            for zombie in zombies_hit:
-                for bullet in zombies_hit[zombie]:
-                    play_sound(self.game.main_menu.zombie_hit_sound_on, self.game.main_menu.zombie_hit_sound)
-                    zombie.hurt(bullet.__damage)
-
-    def __check_spikes_hit(self) -> None:
-        """
-        Check if spike hit and kill the bullet.
-        """
-        if pg.sprite.spritecollideany(self, self.game.spikes):
-            self.kill()
+        self.kill()
+        for machine in machines:
+            machine.damage_laser_machine(self.__hazard_damage)
+            if machine.get_times_hit() == machine.get_health():
+                machine.kill()
+                Explosion(self.game, machine.get_pos() + (32, 32))
+                self.__player.add_points(LASER_MACHINE_POINTS)
 
     def __check_lifetime(self) -> None:
         """
@@ -1129,15 +1093,30 @@ class Zombie(pg.sprite.Sprite):
         self.groups = game.all_sprites, game.zombies
         pg.sprite.Sprite.__init__(self, self.groups)
         self.game = game
+        self.collision_layer = ZOMBIE_LAYER
 
         self.main_menu = self.game.main_menu
 
         # player reference
         self.__player = self.game.player
+        self.__spawn_pos = vec(x, y)
 
-        # image
         self.__load_data()
-        self.image = self.__idle_frames_right[0]
+        self.__damage = ZOMBIE_DAMAGE
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the zombie to its spawn state (when it's made & when the level starts again from its snapshot).
+        Sound settings are read (they could be changed in the menu) & the animation & wandering timers start.
+        """
+        self.__load_sound_settings()
+
+        # image
+        x, y = self.__spawn_pos
+        self.image = self.__idle.right[0]
+        self.mask = self.__idle.right_masks[0]
         self.rect = self.image.get_rect()
         self.rect.center = (round(x), round(y))
 
@@ -1147,7 +1126,6 @@ class Zombie(pg.sprite.Sprite):
         self.__acc = vec(0, 0)
 
         self.__health = ZOMBIE_HEALTH
-        self.__damage = ZOMBIE_DAMAGE
 
         # animations
         self.__FACING_RIGHT = True
@@ -1156,11 +1134,11 @@ class Zombie(pg.sprite.Sprite):
         self.__attacking_animation = False
         self.__attacking = False
         self.__current_frame = 0
-        self.__last_update = 0
+        self.__last_update = pg.time.get_ticks()
 
         # wandering
         self.__random_target = vec(randint(0, WIDTH), randint(0, HEIGHT))
-        self.__last_target = 0
+        self.__last_target = self.__last_update
 
     def update(self) -> None:
         """
@@ -1176,6 +1154,7 @@ class Zombie(pg.sprite.Sprite):
     def __process_animations(self) -> None:
         """
         Animate zombie sprite.
+        Image & mask are changed only when the frame changes (masks are precomputed).
         """
         now = pg.time.get_ticks()
 
@@ -1190,12 +1169,9 @@ class Zombie(pg.sprite.Sprite):
             self.__prevent_moving = True
             if now - self.__last_update > 80:
                 self.__last_update = now
-                self.__current_frame = (self.__current_frame + 1) % len(self.__idle_frames_right)
+                self.__current_frame = (self.__current_frame + 1) % len(self.__idle.right)
                 bottom = self.rect.bottom
-                if self.__FACING_RIGHT:
-                    self.image = self.__idle_frames_right[self.__current_frame]
-                else:
-                    self.image = self.__idle_frames_left[self.__current_frame]
+                self.__set_frame(self.__idle, self.__FACING_RIGHT)
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
                 self.__prevent_moving = False
@@ -1204,12 +1180,9 @@ class Zombie(pg.sprite.Sprite):
         if self.__walking:
             if now - self.__last_update > 100:
                 self.__last_update = now
-                self.__current_frame = (self.__current_frame + 1) % len(self.__walk_frames_right)
+                self.__current_frame = (self.__current_frame + 1) % len(self.__walk.right)
                 bottom = self.rect.bottom
-                if self.__vel.x > 0:  # going right
-                    self.image = self.__walk_frames_right[self.__current_frame]
-                else:  # going left
-                    self.image = self.__walk_frames_left[self.__current_frame]
+                self.__set_frame(self.__walk, self.__vel.x > 0)  # going right/left
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
@@ -1218,53 +1191,53 @@ class Zombie(pg.sprite.Sprite):
             if now - self.__last_update > 82:
                 self.__last_update = now
                 bottom = self.rect.bottom
-                self.__current_frame = (self.__current_frame + 1) % len(self.__attack_frames_right)
-                if self.__FACING_RIGHT:
-                    self.image = self.__attack_frames_right[self.__current_frame]
-                    # if current frame is not first, attack player (fixes damage bug)
-                    if self.image != self.__attack_frames_right[0]:
-                        self.__attacking = True
-                else:
-                    self.image = self.__attack_frames_left[self.__current_frame]
-                    # if current frame is not first, attack player (fixes damage bug)
-                    if self.image != self.__attack_frames_left[0]:
-                        self.__attacking = True
+                self.__current_frame = (self.__current_frame + 1) % len(self.__attack.right)
+                self.__set_frame(self.__attack, self.__FACING_RIGHT)
+                # if current frame is not first, attack player (fixes damage bug)
+                if self.__current_frame != 0:
+                    self.__attacking = True
                 self.rect = self.image.get_rect()
                 self.rect.bottom = bottom
 
         self.rect.midbottom = self.__pos
 
-        # for precise collisions
-        self.mask = pg.mask.from_surface(self.image)
+    def __set_frame(self, clip: AnimationClip, facing_right: bool) -> None:
+        """
+        Set the current frame image & its precomputed mask (for precise collisions).
+        :param clip: animation clip
+        :param facing_right: True for right frames, False for left frames
+        """
+        if facing_right:
+            self.image = clip.right[self.__current_frame]
+            self.mask = clip.right_masks[self.__current_frame]
+        else:
+            self.image = clip.left[self.__current_frame]
+            self.mask = clip.left_masks[self.__current_frame]
 
     def __load_data(self) -> None:
         """
         Load zombie sprite images & sounds.
         """
-        load_img = self.game.zombies_sprite_sheet.parse_sprite
+        # shared clips (made only once, when the first zombie spawns)
+        get_clip = self.game.zombies_sprite_sheet.get_clip
 
-        # attack
-        self.__attack_frames_right = [load_img('attack_{}.png'.format(i)) for i in range(8)]
-        self.__attack_frames_left = [flip(img, True, False) for img in self.__attack_frames_right]
-
-        # idle
-        self.__idle_frames_right = [load_img('idle_{}.png'.format(i)) for i in range(15)]
-        self.__idle_frames_left = [flip(img, True, False) for img in self.__idle_frames_right]
-
-        # walk
-        self.__walk_frames_right = [load_img('walk_{}.png'.format(i)) for i in range(10)]
-        self.__walk_frames_left = [flip(img, True, False) for img in self.__walk_frames_right]
-
-        # sound settings
-        self.__hit_sound_on = self.main_menu.zombie_hit_sound_on
-        self.__die_sound_on = self.main_menu.zombie_die_sound_on
-        self.__moan_sound_on = self.main_menu.zombie_moan_sound_on
+        self.__attack = get_clip('attack')
+        self.__idle = get_clip('idle')
+        self.__walk = get_clip('walk')
 
         # sounds
         self.__hit_sound = self.main_menu.zombie_hit_sound
         self.__die_sound = self.main_menu.zombie_die_sound
         self.__moan_sounds = self.main_menu.zombie_moan_sounds
 
+    def __load_sound_settings(self) -> None:
+        """
+        Load zombie sounds settings from main menu.
+        """
+        self.__hit_sound_on = self.main_menu.zombie_hit_sound_on
+        self.__die_sound_on = self.main_menu.zombie_die_sound_on
+        self.__moan_sound_on = self.main_menu.zombie_moan_sound_on
+
     # getters
     def get_pos(self) -> vec:
         """
@@ -1302,6 +1275,25 @@ class Zombie(pg.sprite.Sprite):
         """
         self.__health -= damage
 
+    def get_save_state(self) -> tuple:
+        """
+        Get the state kept in save games.
+        :return: position & velocity (x, y), health, facing & wandering target (x, y)
+        """
+        return *self.__pos, *self.__vel, self.__health, self.__FACING_RIGHT, *self.__random_target
+
+    def set_save_state(self, state: tuple) -> None:
+        """
+        Set the state from a save game.
+        :param state: state from get_save_state()
+        """
+        pos_x, pos_y, vel_x, vel_y, self.__health, self.__FACING_RIGHT, target_x, target_y = state
+        self.__pos = vec(pos_x, pos_y)
+        self.__vel = vec(vel_x, vel_y)
+        self.__random_target = vec(target_x, target_y)
+        self.rect.x = self.__pos.x
+        self.rect.bottom = self.__pos.y
+
     def __kill(self) -> None:
         """
         Kill the zombie, make splat & spawn XP.
@@ -1506,7 +1498,7 @@ class Zombie(pg.sprite.Sprite):
         """
         Check for collisions when moving left-right.
         """
-        hits = pg.sprite.spritecollide(self, self.game.obstacles, False)
+        hits = self.game.obstacle_grid.collide(self, ZOMBIE_COLLISION_LAYERS)
         for obstacle in hits:
             # going right
             if self.__vel.x > 0:
@@ -1524,7 +1516,7 @@ class Zombie(pg.sprite.Sprite):
         Check for collisions when moving up-down.
         Not checking for y < 0, because zombie can't jump.
         """
-        hits = pg.sprite.spritecollide(self, self.game.obstacles, False)
+        hits = self.game.obstacle_grid.collide(self, ZOMBIE_COLLISION_LAYERS)
         for obstacle in hits:
             if self.__vel.y > 0:
                 self.__vel.y = 0
@@ -1532,12 +1524,13 @@ class Zombie(pg.sprite.Sprite):
                 self.rect.bottom = self.__pos.y + 1  # set zombie's bottom to that position
 
     # drawing
-    def draw_health(self) -> None:
+    def draw_health(self, surface: pg.Surface, pos: tuple) -> None:
         """
         Draw zombie health bar.
+        Drawn on the display (not on the image), because zombie images are shared.
+        :param surface: surface to draw on (game display)
+        :param pos: top-left position of the zombie on the surface
         """
-        surface = self.image
-
         percentage = self.__health / ZOMBIE_HEALTH  # health percentage
 
         # don't go below 0
@@ -1548,8 +1541,8 @@ class Zombie(pg.sprite.Sprite):
         bar_height = 7
         fill_width = percentage * bar_width
 
-        outline_rect = pg.Rect(0, 0, bar_width, bar_height)
-        filled_rect = pg.Rect(0, 0, fill_width, bar_height)
+        outline_rect = pg.Rect(pos[0], pos[1], bar_width, bar_height)
+        filled_rect = pg.Rect(pos[0], pos[1], fill_width, bar_height)
 
         # color
         if percentage >= 0.6:
@@ -1582,9 +1575,8 @@ class MuzzleFlash(pg.sprite.Sprite):
         pg.sprite.Sprite.__init__(self, self.groups)
         self.game = game
 
-        # image
-        self.__images = [self.game.player_sprite_sheet.parse_sprite('muzzle_{}.png'.format(i)) for i in range(5)]
-        self.__images = [scale(img, (int(img.get_width() * 2), int(img.get_height() * 1.2))) for img in self.__images]
+        # image (frames are shared by all muzzle flashes)
+        self.__images = self.game.player_sprite_sheet.get_clip('muzzle').right
         self.image = self.__images[0]
         self.rect = self.image.get_rect()
 
@@ -1631,9 +1623,8 @@ class Explosion(pg.sprite.Sprite):
         # for player to explode
         self.__player = player
 
-        # image
-        self.__images = [self.game.explosion_sprite_sheet.parse_sprite('explosion_{}.png'.format(i)) for i in range(9)]
-        self.__images = [scale(img, (int(img.get_width() // 2), int(img.get_height() // 2))) for img in self.__images]
+        # image (frames are shared by all explosions)
+        self.__images = self.game.explosion_sprite_sheet.get_clip('explosion').right
         self.image = self.__images[0]
         self.rect = self.image.get_rect()
 
@@ -1685,7 +1676,7 @@ class Explosion(pg.sprite.Sprite):
                     # if new high score, play sound
                     if self.__player.get_score() >= self.__main_menu.get_high_score():
                         play_sound(self.__main_menu.high_score_sound_on, self.__main_menu.high_score_sound)
-                    self.game.game_over = True
+                    self.game.set_game_over()
 
 
 class Splat(pg.sprite.Sprite):
@@ -1716,9 +1707,7 @@ class Splat(pg.sprite.Sprite):
         """
         Load splat images.
         """
-        self.__images = [pg.image.load(img) for img in SPLAT_IMAGES]
-        self.__images = [scale(img, (int(img.get_width() // 2.5), int(img.get_height() // 2.5))) for img in
-                         self.__images]
+        self.__images = [load_image(img, shrink=2.5) for img in SPLAT_IMAGES]
 
 
 # hazards
@@ -1749,6 +1738,12 @@ class Acid(pg.sprite.Sprite):
         self.rect = pg.Rect(x, y, width, height)
 
         self.__damage = ACID_DAMAGE
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the acid to its spawn state (when it's made & when the level starts again from its snapshot).
+        """
         self.__last_attack = 0
 
     def acid_damage(self) -> None:
@@ -1786,6 +1781,12 @@ class Spikes(pg.sprite.Sprite):
         self.rect = pg.Rect(x, y, width, height)
 
         self.__damage = SPIKES_DAMAGE
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the spikes to its spawn state (when it's made & when the level starts again from its snapshot).
+        """
         self.__last_attack = 0
 
     def spikes_damage(self) -> None:
@@ -1819,19 +1820,37 @@ class Saw(pg.sprite.Sprite):
         pg.sprite.Sprite.__init__(self, self.groups)
 
         self.game = game
+        self.collision_layer = SAW_LAYER
 
         self.__width = width
         self.__height = height
         self.__type = saw_type
 
-        # image
-        self.__load_images()
-        self.image = self.__images[0]
-        self.rect = self.image.get_rect(center=(x, y))
+        # image (rotation frames are shared by all saws of the same size)
+        self.__frames = load_rotation_frames(SAW_IMAGE, (self.__width, self.__height), SAW_ROTATION_STEP, BLACK)
+        self.__spawn_pos = (x, y)
 
-        # adjust position by the offset
         self.radius = int(self.__width / 2)  # circle radius
         self.__offset = self.radius
+
+        # attack
+        self.__damage = SAW_DAMAGE
+
+        # movement flags
+        self.__set_saw_type()
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the saw to its spawn state (when it's made & when the level starts again from its snapshot).
+        """
+        x, y = self.__spawn_pos
+        self.image = self.__frames.get_frame(0)
+        self.rect = self.image.get_rect(center=(x, y))
+
+        # adjust position by the offset
+        self.__collider = Circle(*self.rect.center, self.radius)  # moved with the rect
         self.__x = x + self.__offset
         self.__y = y + self.__offset
         self.__pos = (self.__x, self.__y)  # position for explosion spawning (updating in animation function)
@@ -1841,15 +1860,15 @@ class Saw(pg.sprite.Sprite):
         self.__current_frame = 0
 
         # attack
-        self.__damage = SAW_DAMAGE
         self.__last_attack = 0
 
         # health
         self.__health = SAW_HEALTH
         self.__times_hit = 0  # keep track of number of times it's hit by the bullet (used for killing it)
 
-        # movement flags
-        self.__set_saw_type()
+        # movement direction (only if the saw can move)
+        if self.__type is not None:
+            self.__change_direction = False
 
     def update(self) -> None:
         """
@@ -1860,19 +1879,6 @@ class Saw(pg.sprite.Sprite):
         # saw sound
         self.__adjust_sound()
 
-    def __load_images(self) -> None:
-        """
-        Load saw sprite image and make images by rotating it.
-        """
-        image = pg.image.load(SAW_IMAGE).convert_alpha()
-        image = scale(image, (int(self.__width), int(self.__height)))
-        image.set_colorkey(BLACK)
-        rot = 0
-        self.__images = []
-        for i in range(360):
-            self.__images.append(pg.transform.rotozoom(image, rot, 1))  # prevent rotating the background
-            rot += 1
-
     def __set_saw_type(self) -> None:
         """
         Set saw type based on tile object type in Tiled.
@@ -1886,7 +1892,6 @@ class Saw(pg.sprite.Sprite):
                 self.__can_move_vertically = True
             elif self.__type == 'horizontal':
                 self.__can_move_horizontally = True
-            self.__change_direction = False
 
     def __adjust_sound(self) -> None:
         """
@@ -1904,6 +1909,13 @@ class Saw(pg.sprite.Sprite):
         """
         return self.__pos
 
+    def get_collider(self) -> Circle:
+        """
+        Get saw collider (the blade is a circle, so it's hit without the masks of the rotated images).
+        :return: circle
+        """
+        return self.__collider
+
     def get_health(self) -> int:
         """
         Get health.
@@ -1926,6 +1938,27 @@ class Saw(pg.sprite.Sprite):
         """
         self.__times_hit += times_hit
 
+    def get_save_state(self) -> tuple:
+        """
+        Get the state kept in save games.
+        :return: position (x, y), health, times hit, movement direction & rotation frame
+        """
+        change_direction = self.__type is not None and self.__change_direction  # set only if the saw moves
+        return self.__x, self.__y, self.__health, self.__times_hit, change_direction, self.__current_frame
+
+    def set_save_state(self, state: tuple) -> None:
+        """
+        Set the state from a save game.
+        :param state: state from get_save_state()
+        """
+        self.__x, self.__y, self.__health, self.__times_hit, change_direction, self.__current_frame = state
+        if self.__type is not None:
+            self.__change_direction = change_direction
+        self.__pos = (self.__x, self.__y)
+        self.image = self.__frames.get_frame(self.__current_frame)
+        self.rect = self.image.get_rect(center=(self.__x, self.__y))
+        self.__collider = Circle(*self.rect.center, self.radius)
+
     def deal_damage(self) -> None:
         """
         Deal damage to player.
@@ -1949,8 +1982,6 @@ class Saw(pg.sprite.Sprite):
         # rotating animation
         self.__rotate()
 
-        self.mask = pg.mask.from_surface(self.image)
-
     def __rotate(self) -> None:
         """
         Rotate the saw.
@@ -1958,9 +1989,10 @@ class Saw(pg.sprite.Sprite):
         now = pg.time.get_ticks()
         if now - self.__last_rot > 30:
             self.__last_rot = now
-            self.__current_frame = (self.__current_frame + 15) % len(self.__images)
-            self.image = self.__images[self.__current_frame]
+            self.__current_frame = (self.__current_frame + 1) % len(self.__frames)
+            self.image = self.__frames.get_frame(self.__current_frame)
             self.rect = self.image.get_rect(center=(self.__x, self.__y))
+            self.__collider = Circle(*self.rect.center, self.radius)
 
     def __move(self) -> None:
         """
@@ -1978,11 +2010,11 @@ class Saw(pg.sprite.Sprite):
         Move the saw vertically.
         If it hits the limit obstacle, change direction.
         """
-        hits = pg.sprite.spritecollide(self, self.game.obstacles, False)
+        hits = self.game.obstacle_grid.collide(self, SAW_LIMIT_UP_LAYER | SAW_LIMIT_DOWN_LAYER)
         for limit in hits:
-            if limit.get_type() == 'saw_limit_down':
+            if limit.collision_layer == SAW_LIMIT_DOWN_LAYER:
                 self.__change_direction = True
-            elif limit.get_type() == 'saw_limit_up':
+            else:
                 self.__change_direction = False
 
         if not self.__change_direction:
@@ -1995,11 +2027,11 @@ class Saw(pg.sprite.Sprite):
         Move the saw horizontally.
         If it hits the limit obstacle, change direction.
         """
-        hits = pg.sprite.spritecollide(self, self.game.obstacles, False)
+        hits = self.game.obstacle_grid.collide(self, SAW_LIMIT_LEFT_LAYER | SAW_LIMIT_RIGHT_LAYER)
         for limit in hits:
-            if limit.get_type() == 'saw_limit_right':
+            if limit.collision_layer == SAW_LIMIT_RIGHT_LAYER:
                 self.__change_direction = True
-            elif limit.get_type() == 'saw_limit_left':
+            else:
                 self.__change_direction = False
 
         if not self.__change_direction:
@@ -2036,14 +2068,21 @@ class LaserMachine(pg.sprite.Sprite):
 
         # image
         self.__make_laser()
-        self.image = self.__laser_shoot
-        self.rect = self.image.get_rect()
+        self.rect = self.__laser_shoot.get_rect()
 
         # set position
         self.__pos = vec(x, y)
         self.rect.x = x
         self.rect.y = y
 
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the laser machine to its spawn state (when it's made & when the level starts again from its snapshot).
+        """
+        self.image = self.__laser_shoot
+
         # attack
         self.__shooting = True
         self.__last_shot = 0
@@ -2085,17 +2124,15 @@ class LaserMachine(pg.sprite.Sprite):
         """
         Load laser machine images.
         """
-        load_img = pg.image.load
-
-        scale_factor = (int(self.__width), int(self.__height))
+        scale_factor = (self.__width, self.__height)
 
         # load images
-        laser_down_shoot_image = scale(load_img(LASER_MACHINE_DOWN_SHOOT_IMAGE), scale_factor).convert_alpha()
-        laser_down_off_image = scale(load_img(LASER_MACHINE_DOWN_OFF_IMAGE), scale_factor).convert_alpha()
-        laser_right_shoot_image = scale(load_img(LASER_MACHINE_RIGHT_SHOOT_IMAGE), scale_factor).convert_alpha()
-        laser_right_off_image = scale(load_img(LASER_MACHINE_RIGHT_OFF_IMAGE), scale_factor).convert_alpha()
-        laser_left_shoot_image = scale(load_img(LASER_MACHINE_LEFT_SHOOT_IMAGE), scale_factor).convert_alpha()
-        laser_left_off_image = scale(load_img(LASER_MACHINE_LEFT_OFF_IMAGE), scale_factor).convert_alpha()
+        laser_down_shoot_image = load_image(LASER_MACHINE_DOWN_SHOOT_IMAGE, scale_factor)
+        laser_down_off_image = load_image(LASER_MACHINE_DOWN_OFF_IMAGE, scale_factor)
+        laser_right_shoot_image = load_image(LASER_MACHINE_RIGHT_SHOOT_IMAGE, scale_factor)
+        laser_right_off_image = load_image(LASER_MACHINE_RIGHT_OFF_IMAGE, scale_factor)
+        laser_left_shoot_image = load_image(LASER_MACHINE_LEFT_SHOOT_IMAGE, scale_factor)
+        laser_left_off_image = load_image(LASER_MACHINE_LEFT_OFF_IMAGE, scale_factor)
 
         # down
         self.__laser_down_shoot = laser_down_shoot_image
@@ -2183,6 +2220,21 @@ class LaserMachine(pg.sprite.Sprite):
         """
         self.__times_hit += times_hit
 
+    def get_save_state(self) -> tuple:
+        """
+        Get the state kept in save games.
+        :return: shooting, health & times hit
+        """
+        return self.__shooting, self.__health, self.__times_hit
+
+    def set_save_state(self, state: tuple) -> None:
+        """
+        Set the state from a save game.
+        :param state: state from get_save_state()
+        """
+        self.__shooting, self.__health, self.__times_hit = state
+        self.__set_image()
+
 
 class LaserBullet(pg.sprite.Sprite):
     """
@@ -2199,9 +2251,10 @@ class LaserBullet(pg.sprite.Sprite):
         """
 
         self._layer = LAYERS['fourth']
-        self.groups = game.all_sprites
+        self.groups = game.all_sprites, game.laser_bullets
         pg.sprite.Sprite.__init__(self, self.groups)
         self.game = game
+        self.collision_layer = LASER_BULLET_LAYER
 
         self.__player = self.game.player
 
@@ -2212,9 +2265,10 @@ class LaserBullet(pg.sprite.Sprite):
         self.__pos = vec(pos) + offset
 
         # image
-        self.image = pg.image.load(LASER_BULLET_IMAGE).convert_alpha()
+        self.image = load_image(LASER_BULLET_IMAGE)
         self.rect = self.image.get_rect()
         self.rect.center = self.__pos
+        self.__last_rect = self.rect.copy()  # rect before the last move (swept by the collision phase)
 
         # bullet movement
         self.__direction = direction
@@ -2228,10 +2282,10 @@ class LaserBullet(pg.sprite.Sprite):
 
     def update(self) -> None:
         """
-        Update laser bullet sprite.
+        Update laser bullet sprite (hits are checked in the collision phase).
         """
+        self.__last_rect = self.rect.copy()
         self.__move()
-        self.__check_collisions()
 
     def __move(self) -> None:
         """
@@ -2240,34 +2294,30 @@ class LaserBullet(pg.sprite.Sprite):
         self.__pos += self.__vel * self.game.delta_time
         self.rect.center = self.__pos  # update rect to that location
 
-    def __check_collisions(self) -> None:
+    def get_last_rect(self) -> pg.Rect:
         """
-        Check for collision and kill the bullet if something is hit.
+        Get laser bullet rect before the last move.
+        :return: rect
         """
+        return self.__last_rect
 
-        # player
-        self.__check_player_hit()
-
-        # laser receiver
-        self.__check_receiver_hit()
-
-    def __check_player_hit(self) -> None:
+    def move_back(self, topleft: tuple) -> None:
         """
-        Check if player is hit.
+        Move the laser bullet back along its path (to what it passed through since the last frame).
+        :param topleft: rect top left position
         """
-        if pg.sprite.collide_mask(self, self.__player):
-            self.kill()
-            self.__player.hurt(self.__damage)
-            play_sound(self.game.main_menu.player_hit_sound_on, self.game.main_menu.player_hit_sound)
-            # game over message
-            self.__player.set_dead_message('laser gun')
+        self.rect.topleft = topleft
+        self.__pos = vec(self.rect.center)
 
-    def __check_receiver_hit(self) -> None:
+    def hit_player(self) -> None:
         """
-        Check if laser receiver is hit.
+        Hurt the player & kill the bullet (called by the collision phase).
         """
-        if pg.sprite.spritecollide(self, self.game.laser_receivers, False, pg.sprite.collide_mask):
-            self.kill()
+        self.kill()
+        self.__player.hurt(self.__damage)
+        play_sound(self.game.main_menu.player_hit_sound_on, self.game.main_menu.player_hit_sound)
+        # game over message
+        self.__player.set_dead_message('laser gun')
 
 
 class LaserBeam(pg.sprite.Sprite):
@@ -2310,7 +2360,8 @@ class LaserBeam(pg.sprite.Sprite):
         Update the laser sprite.
         """
         # Check player collision
-        if pg.sprite.spritecollide(self.__player, self.game.lasers, False, pg.sprite.collide_mask):
+        player_mask, player_pos = self.__player.mask, self.__player.rect.topleft
+        if any(mask_box(player_mask, player_pos, laser.get_collider()) for laser in self.game.lasers):
             play_sound(self.game.main_menu.laser_sound_on, self.game.main_menu.laser_sound)
             self.__player.hurt(self.__damage)
             # game over message
@@ -2350,6 +2401,8 @@ class LaserBeam(pg.sprite.Sprite):
                     self.__adjust_position(self.image)
 
         self.mask = pg.mask.from_surface(self.image)
+        # collider - the beam fills a box in the image
+        self.__collider = get_mask_bounds(self.mask).move(self.rect.topleft)
 
     def __adjust_position(self, image: pg.Surface) -> None:
         """
@@ -2376,23 +2429,15 @@ class LaserBeam(pg.sprite.Sprite):
         """
         Load laser beam images.
         """
-        load_img = pg.image.load
-
         # scale factor values
-        scale_vertical = (int(self.__width * 12), int(self.__height + 4))
-        scale_horizontal = (int(self.__height + 6), int(self.__width * 12))
-
-        # load images
-        red_img = load_img(RED_LASER_IMAGE).convert_alpha()
-        blue_img = load_img(BLUE_LASER_IMAGE).convert_alpha()
-        green_img = load_img(GREEN_LASER_IMAGE).convert_alpha()
-        yellow_img = load_img(YELLOW_LASER_IMAGE).convert_alpha()
+        scale_vertical = (self.__width * 12, self.__height + 4)
+        scale_horizontal = (self.__height + 6, self.__width * 12)
 
-        # scale images
-        self.red_laser = scale(red_img, scale_vertical)
-        self.blue_laser = scale(blue_img, scale_vertical)
-        self.green_laser = scale(green_img, scale_horizontal)
-        self.yellow_laser = scale(yellow_img, scale_horizontal)
+        # load & scale images
+        self.red_laser = load_image(RED_LASER_IMAGE, scale_vertical)
+        self.blue_laser = load_image(BLUE_LASER_IMAGE, scale_vertical)
+        self.green_laser = load_image(GREEN_LASER_IMAGE, scale_horizontal)
+        self.yellow_laser = load_image(YELLOW_LASER_IMAGE, scale_horizontal)
 
     def get_type(self) -> str:
         """
@@ -2401,6 +2446,13 @@ class LaserBeam(pg.sprite.Sprite):
         """
         return self.__type
 
+    def get_collider(self) -> AABB:
+        """
+        Get laser beam collider.
+        :return: box
+        """
+        return self.__collider
+
 
 class LaserReceiver(pg.sprite.Sprite):
     """
@@ -2439,11 +2491,12 @@ class LaserReceiver(pg.sprite.Sprite):
         Make laser receiver.
         """
         # load image
-        receiver_img = pg.image.load(LASER_RECEIVER_IMAGE)
-
-        down_image = scale(receiver_img, (int(self.__width), int(self.__height))).convert_alpha()
-        right_image = pg.transform.rotate(down_image, 90)
-        left_image = pg.transform.rotate(down_image, 270)
+        size = (int(self.__width), int(self.__height))
+        down_image = load_image(LASER_RECEIVER_IMAGE, size)
+        right_image = asset_cache.get(('rotate', LASER_RECEIVER_IMAGE, size, 90),
+                                      lambda: pg.transform.rotate(down_image, 90))
+        left_image = asset_cache.get(('rotate', LASER_RECEIVER_IMAGE, size, 270),
+                                     lambda: pg.transform.rotate(down_image, 270))
 
         # set image (based on type)
         if self.__type == 'down':
@@ -2500,32 +2553,35 @@ class DoorSwitch(pg.sprite.Sprite):
 
         # image
         self.__load_images()
-        self.image = self.__disabled_img
-        self.image.set_colorkey(BLACK)
-        self.rect = self.image.get_rect(center=(x, y))
+        self.__disabled_img.set_colorkey(BLACK)
+        self.rect = self.__disabled_img.get_rect(center=(x, y))
         self.rect.x = x
         self.rect.y = y
 
-        self.__UNLOCKED = False
-
-        # load sounds settings
-        self.__sound_on = self.game.main_menu.door_switch_sound_on
+        # load sounds
         self.__press_sound = self.game.main_menu.door_switch_press_sound
         self.__fail_sound = self.game.main_menu.door_switch_fail_sound
 
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the door switch to its spawn state (when it's made & when the level starts again from its snapshot).
+        The sound setting is read (it could be changed in the menu).
+        """
+        self.image = self.__disabled_img
+        self.__UNLOCKED = False
+        self.__sound_on = self.game.main_menu.door_switch_sound_on
+
     def __load_images(self) -> None:
         """
         Load door switch images.
         """
-        scale_factor = (int(self.__width), int(self.__height))
+        scale_factor = (self.__width, self.__height)
 
-        # load images
-        disabled_img = pg.image.load(DOOR_SWITCH_DISABLED_IMAGE).convert()
-        enabled_img = pg.image.load(DOOR_SWITCH_ENABLED_IMAGE).convert()
-
-        # set images
-        self.__disabled_img = scale(disabled_img, scale_factor)
-        self.__enabled_img = scale(enabled_img, scale_factor)
+        # load & scale images
+        self.__disabled_img = load_image(DOOR_SWITCH_DISABLED_IMAGE, scale_factor, OPAQUE)
+        self.__enabled_img = load_image(DOOR_SWITCH_ENABLED_IMAGE, scale_factor, OPAQUE)
 
     def update(self) -> None:
         """
@@ -2562,6 +2618,20 @@ class DoorSwitch(pg.sprite.Sprite):
         """
         return self.__UNLOCKED
 
+    def get_save_state(self) -> tuple:
+        """
+        Get the state kept in save games.
+        :return: unlocked
+        """
+        return self.__UNLOCKED,
+
+    def set_save_state(self, state: tuple) -> None:
+        """
+        Set the state from a save game (the image is set when it's updated).
+        :param state: state from get_save_state()
+        """
+        self.__UNLOCKED, = state
+
 
 class Door(pg.sprite.Sprite):
     """
@@ -2596,35 +2666,36 @@ class Door(pg.sprite.Sprite):
 
         # image
         self.__load_images()
-        self.image = self.__locked_img
-        self.image.set_colorkey(BLACK)
-        self.rect = self.image.get_rect(center=(x, y))
+        self.__locked_img.set_colorkey(BLACK)
+        self.rect = self.__locked_img.get_rect(center=(x, y))
         self.rect.x = x
         self.rect.y = y
 
+        # load sounds
+        self.__open_sound = self.game.main_menu.door_open_sound
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the door to its spawn state (when it's made & when the level starts again from its snapshot).
+        The sound setting is read (it could be changed in the menu).
+        """
+        self.image = self.__locked_img
         self.__UNLOCKED = False
         self.__OPEN = False
-
-        # load sounds
         self.__open_sound_on = self.game.main_menu.door_open_sound_on
-        self.__open_sound = self.game.main_menu.door_open_sound
 
     def __load_images(self) -> None:
         """
         Load door images.
         """
-        load_img = pg.image.load
-        scale_by = (int(self.__width), int(self.__height))
-
-        # load images
-        locked_img = load_img(DOOR_LOCKED_IMAGE).convert()
-        unlocked_img = load_img(DOOR_UNLOCKED_IMAGE).convert()
-        opened_img = load_img(DOOR_OPEN_IMAGE).convert()
+        scale_by = (self.__width, self.__height)
 
-        # set images
-        self.__locked_img = scale(locked_img, scale_by)
-        self.__unlocked_img = scale(unlocked_img, scale_by)
-        self.__opened_img = scale(opened_img, scale_by)
+        # load & scale images
+        self.__locked_img = load_image(DOOR_LOCKED_IMAGE, scale_by, OPAQUE)
+        self.__unlocked_img = load_image(DOOR_UNLOCKED_IMAGE, scale_by, OPAQUE)
+        self.__opened_img = load_image(DOOR_OPEN_IMAGE, scale_by, OPAQUE)
 
     def update(self) -> None:
         """
@@ -2677,6 +2748,20 @@ class Door(pg.sprite.Sprite):
         """
         self.__UNLOCKED = True
 
+    def get_save_state(self) -> tuple:
+        """
+        Get the state kept in save games.
+        :return: unlocked & open
+        """
+        return self.__UNLOCKED, self.__OPEN
+
+    def set_save_state(self, state: tuple) -> None:
+        """
+        Set the state from a save game (the image is set when it's updated).
+        :param state: state from get_save_state()
+        """
+        self.__UNLOCKED, self.__OPEN = state
+
 
 class Lever(pg.sprite.Sprite):
     """
@@ -2705,8 +2790,6 @@ class Lever(pg.sprite.Sprite):
         self.__width = width
         self.__height = height
 
-        self.__pulled = False
-
         # image
         self.__make_lever()
         self.rect = self.image.get_rect()
@@ -2716,9 +2799,19 @@ class Lever(pg.sprite.Sprite):
         self.mask = pg.mask.from_surface(self.image)
 
         # load sounds
-        self.__pull_sound_on = game.main_menu.lever_pull_sound_on
         self.__pull_sound = game.main_menu.lever_pull_sound
 
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the lever to its spawn state (when it's made & when the level starts again from its snapshot).
+        The sound setting is read (it could be changed in the menu).
+        """
+        self.__set_on_image()
+        self.__pulled = False
+        self.__pull_sound_on = self.game.main_menu.lever_pull_sound_on
+
     def update(self) -> None:
         """
         Update the lever sprite.
@@ -2736,7 +2829,12 @@ class Lever(pg.sprite.Sprite):
         Lever type is color, it indicates which laser machine the lever is for.
         """
         self.__load_images()
+        self.__set_on_image()
 
+    def __set_on_image(self) -> None:
+        """
+        Set lever on image (not pulled).
+        """
         # red
         if self.__type == 'red':
             self.image = self.__red_lever_on_img
@@ -2754,28 +2852,17 @@ class Lever(pg.sprite.Sprite):
         """
         Load lever images.
         """
-        load_img = pg.image.load
-        scale_factor = (int(self.__width), int(self.__height))
+        scale_factor = (self.__width, self.__height)
 
-        # load images
-        blue_lever_on = load_img(BLUE_LEVER_ON_IMAGE).convert_alpha()
-        blue_lever_off = load_img(BLUE_LEVER_OFF_IMAGE).convert_alpha()
-        red_lever_on = load_img(RED_LEVER_ON_IMAGE).convert_alpha()
-        red_lever_off = load_img(RED_LEVER_OFF_IMAGE).convert_alpha()
-        green_lever_on = load_img(GREEN_LEVER_ON_IMAGE).convert_alpha()
-        green_lever_off = load_img(GREEN_LEVER_OFF_IMAGE).convert_alpha()
-        yellow_lever_on = load_img(YELLOW_LEVER_ON_IMAGE).convert_alpha()
-        yellow_lever_off = load_img(YELLOW_LEVER_OFF_IMAGE).convert_alpha()
-
-        # set images
-        self.__blue_lever_on_img = scale(blue_lever_on, scale_factor)
-        self.__blue_lever_off_img = scale(blue_lever_off, scale_factor)
-        self.__red_lever_on_img = scale(red_lever_on, scale_factor)
-        self.__red_lever_off_img = scale(red_lever_off, scale_factor)
-        self.__green_lever_on_img = scale(green_lever_on, scale_factor)
-        self.__green_lever_off_img = scale(green_lever_off, scale_factor)
-        self.__yellow_lever_on_img = scale(yellow_lever_on, scale_factor)
-        self.__yellow_lever_off_img = scale(yellow_lever_off, scale_factor)
+        # load & scale images
+        self.__blue_lever_on_img = load_image(BLUE_LEVER_ON_IMAGE, scale_factor)
+        self.__blue_lever_off_img = load_image(BLUE_LEVER_OFF_IMAGE, scale_factor)
+        self.__red_lever_on_img = load_image(RED_LEVER_ON_IMAGE, scale_factor)
+        self.__red_lever_off_img = load_image(RED_LEVER_OFF_IMAGE, scale_factor)
+        self.__green_lever_on_img = load_image(GREEN_LEVER_ON_IMAGE, scale_factor)
+        self.__green_lever_off_img = load_image(GREEN_LEVER_OFF_IMAGE, scale_factor)
+        self.__yellow_lever_on_img = load_image(YELLOW_LEVER_ON_IMAGE, scale_factor)
+        self.__yellow_lever_off_img = load_image(YELLOW_LEVER_OFF_IMAGE, scale_factor)
 
     def __set_off_image(self) -> None:
         """
@@ -2849,6 +2936,20 @@ class Lever(pg.sprite.Sprite):
         laser_machine.turn_off()
         laser_beam.kill()
 
+    def get_save_state(self) -> tuple:
+        """
+        Get the state kept in save games.
+        :return: pulled
+        """
+        return self.__pulled,
+
+    def set_save_state(self, state: tuple) -> None:
+        """
+        Set the state from a save game (the image is set when it's updated).
+        :param state: state from get_save_state()
+        """
+        self.__pulled, = state
+
 
 class Item(pg.sprite.Sprite):
     """
@@ -2873,6 +2974,7 @@ class Item(pg.sprite.Sprite):
         self._layer = LAYERS['first']
         self.groups = game.all_sprites, game.items
         pg.sprite.Sprite.__init__(self, self.groups)
+        self.collision_layer = ITEM_LAYER
 
         self.__type = item_type  # item type is item name in tiled
         self.__pos = pos
@@ -2880,10 +2982,20 @@ class Item(pg.sprite.Sprite):
         # spawn
         self.__spawn_item()
         self.rect = self.image.get_rect()
-        self.rect.center = pos
 
-        # animations
         self.__tween = easeInOutSine  # up-down animation
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the item to its spawn state (when it's made & when the level starts again from its snapshot).
+        """
+        self.rect.center = self.__pos
+        if self.__type == 'coin':
+            self.image = self.__coin_images[0]
+
+        # animations
         self.__step = 0  # keep track of where it is between 0 and 1 (start and end point)
         self.__direction = 1  # bob up, and then bob down (changes between 1 and -1)
         self.__last_update = 0
@@ -2917,17 +3029,14 @@ class Item(pg.sprite.Sprite):
         """
         Load items images.
         """
-        load_img = pg.image.load
-
         # health pack
-        self.__health_pack_image = scale(load_img(HEALTH_PACK_IMAGE), (22, 22)).convert_alpha()
+        self.__health_pack_image = load_image(HEALTH_PACK_IMAGE, (22, 22))
         # xp
-        self.__xp_image = load_img(XP_IMAGE).convert_alpha()
+        self.__xp_image = load_image(XP_IMAGE)
         # coin
-        self.__coins = [load_img(img).convert_alpha() for img in COIN_IMAGES]
-        self.__coin_images = [scale(img, (20, 20)) for img in self.__coins]
+        self.__coin_images = [load_image(img, (20, 20)) for img in COIN_IMAGES]
         # key
-        self.__key_img = scale(load_img(KEY_IMAGE), (22, 22)).convert_alpha()
+        self.__key_img = load_image(KEY_IMAGE, (22, 22))
 
     def get_type(self) -> str:
         """
@@ -2936,6 +3045,13 @@ class Item(pg.sprite.Sprite):
         """
         return self.__type
 
+    def get_pos(self) -> vec:
+        """
+        Get position (center).
+        :return: position vector
+        """
+        return self.__pos
+
     # animations
     def __animate(self) -> None:
         """
@@ -2991,6 +3107,7 @@ class Obstacle(pg.sprite.Sprite):
         pg.sprite.Sprite.__init__(self, self.groups)
 
         self.__type = obstacle_type
+        self.collision_layer = OBSTACLE_LAYERS.get(obstacle_type, 0)  # obstacles of unknown types collide with nothing
 
         # make obstacle rect
         self.rect = pg.Rect(x, y, width, height)
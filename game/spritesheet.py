@@ -1,6 +1,156 @@
 from . import pg
-from .config import BLACK
+from .config import BLACK, BAKE_DIR, BAKE_VERSION, BAKE_FORMAT
+from .images import ANIMATION_CLIPS
+from .assets import asset_cache, load_image, load_json, OPAQUE
+from .levelfile import get_source_info, is_source_unchanged
+from os.path import join, basename, splitext
+from typing import NamedTuple
 import json
+import mmap
+
+# baked frames (made by: python -m game.bake)
+INDEX_FILE = join(BAKE_DIR, 'frames.json')
+DATA_FILE = join(BAKE_DIR, 'frames.bin')
+
+
+class AnimationClip(NamedTuple):
+    """
+    Animation frames shared by all sprites using them.
+    Left frames are flipped right frames; every frame has its collision mask.
+    """
+    right: tuple
+    left: tuple
+    right_masks: tuple
+    left_masks: tuple
+
+
+def get_sprite_sheet_files(filename: str) -> tuple:
+    """
+    Get the files of the sprite sheet.
+    :param filename: sprite sheet file
+    :return: image & its .json data
+    """
+    return filename, splitext(filename)[0] + '.json'
+
+
+def get_sprite_sheet_info(filename: str) -> list:
+    """
+    Get modification time, size & hash of the sprite sheet files (used to invalidate the baked frames).
+    :param filename: sprite sheet file
+    :return: [mtime (ns), size, hash] of each file
+    """
+    return [get_source_info(path) for path in get_sprite_sheet_files(filename)]
+
+
+def is_sprite_sheet_unchanged(filename: str, info: list) -> bool:
+    """
+    Check if the sprite sheet files didn't change after baking.
+    The modification time & size are checked first, a file is hashed only if they are different.
+    :param filename: sprite sheet file
+    :param info: [mtime (ns), size, hash] of each file from baking
+    :return: True if unchanged
+    """
+    return all(is_source_unchanged(path, source) for path, source in zip(get_sprite_sheet_files(filename), info))
+
+
+def get_clip_key(filename: str, name: str, count: int, scale: tuple) -> str:
+    """
+    Get the key of the clip in the index.
+    :param filename: sprite sheet file
+    :param name: name of the animation
+    :param count: number of frames
+    :param scale: width & height multipliers
+    :return: clip key
+    """
+    return '{}/{}/{}/{}'.format(basename(filename), name, count, scale)
+
+
+class BakedFrames:
+    """
+    Baked animation frames.
+    The data file is memory-mapped and every frame is a surface over its part of the map (no decoding or copying).
+    Clips from a sprite sheet which changed after baking are not used (the sprite sheet is parsed instead).
+    """
+
+    def __init__(self, directory: str = BAKE_DIR):
+        """
+        Initialize baked frames (the cache is opened on first use).
+        :param directory: bake directory
+        """
+        self.__index_file = join(directory, basename(INDEX_FILE))
+        self.__data_file = join(directory, basename(DATA_FILE))
+        self.__index = None
+        self.__data = None
+        self.__opened = False
+        self.__valid_sheets = {}  # sprite sheet -> True if not changed after baking
+
+    def __open(self) -> None:
+        """
+        Read the index & map the data file.
+        """
+        self.__opened = True
+        try:
+            with open(self.__index_file) as f:
+                index = json.load(f)
+            if index['version'] != BAKE_VERSION or index['format'] != BAKE_FORMAT:
+                return
+            with open(self.__data_file, 'rb') as f:
+                # copy on write - surfaces over the map can be changed without touching the file
+                self.__data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError, KeyError):
+            return
+        self.__index = index
+
+    def __is_valid(self, filename: str) -> bool:
+        """
+        Check if the sprite sheet is unchanged since baking.
+        :param filename: sprite sheet file
+        :return: True if the baked frames can be used
+        """
+        try:
+            return self.__valid_sheets[filename]
+        except KeyError:
+            info = self.__index['sheets'].get(basename(filename))
+            valid = info is not None and is_sprite_sheet_unchanged(filename, info)
+            self.__valid_sheets[filename] = valid
+            return valid
+
+    def is_baked(self, filename: str) -> bool:
+        """
+        Check if the sprite sheet's frames are baked & the sprite sheet is unchanged since baking.
+        :param filename: sprite sheet file
+        :return: True if the baked frames can be used
+        """
+        if not self.__opened:
+            self.__open()
+        return self.__index is not None and self.__is_valid(filename)
+
+    def get_frames(self, filename: str, name: str, count: int, scale: tuple = None):
+        """
+        Get baked right & left frames of the animation.
+        :param filename: sprite sheet file
+        :param name: name of the animation
+        :param count: number of frames
+        :param scale: width & height multipliers
+        :return: right & left frames or None if the clip is not baked or the cache is stale
+        """
+        if not self.__opened:
+            self.__open()
+        if self.__index is None:
+            return None
+
+        clip = self.__index['clips'].get(get_clip_key(filename, name, count, scale))
+        if clip is None or not self.__is_valid(filename):
+            return None
+
+        view = memoryview(self.__data)
+        return tuple(tuple(pg.image.frombuffer(view[offset:offset + width * height * 4], (width, height), BAKE_FORMAT)
+                           for offset, width, height in clip[side])
+                     for side in ('right', 'left'))
+
+
+# shared (process-wide) baked frames
+baked_frames = BakedFrames()
 
 
 class SpriteSheet:
@@ -14,14 +164,20 @@ class SpriteSheet:
         :param filename: sprite sheet file
         :param is_sprite: True if sprite sheet contains player/zombie sprites
         """
+        self.__filename = filename
         self.__is_sprite = is_sprite
 
-        self.__sprite_sheet = pg.image.load(filename).convert()
-
-        # load data
+        # sprite sheet is loaded on first use (not needed if all frames are baked)
+        self.__sprite_sheet = None
         self.__meta_data = filename.replace('png', 'json')  # change .png to .json (because the name is the same)
-        with open(self.__meta_data) as f:
-            self.__data = json.load(f)  # converts data from the json file into python dictionary
+        self.__data = None
+
+    def __load(self) -> None:
+        """
+        Load sprite sheet image & data.
+        """
+        self.__sprite_sheet = load_image(self.__filename, convert=OPAQUE)
+        self.__data = load_json(self.__meta_data)  # converts data from the json file into python dictionary
 
     def __get_sprite(self, x: int, y: int, width: int, height: int) -> pg.Surface:
         """
@@ -50,6 +206,51 @@ class SpriteSheet:
         :param name: name of the sprite image in .json file
         :return: pygame surface (sprite image)
         """
+        if self.__data is None:
+            self.__load()
         sprite = self.__data['frames'][name]['frame']
         x, y, width, height = sprite['x'], sprite['y'], sprite['w'], sprite['h']
         return self.__get_sprite(x, y, width, height)
+
+    def get_clip(self, name: str) -> AnimationClip:
+        """
+        Get the animation clip (made only once per process).
+        Number of frames & scale of the clip are in ANIMATION_CLIPS.
+        :param name: name of the animation in .json file (without the frame number)
+        :return: animation clip
+        """
+        count, scale = ANIMATION_CLIPS[self.__filename][name]
+        key = ('clip', self.__filename, name, count, scale)
+        return asset_cache.get(key, lambda: self.__make_clip(name, count, scale))
+
+    def __make_clip(self, name: str, count: int, scale: tuple) -> AnimationClip:
+        """
+        Get baked frames (or make them if not baked) & make masks for all frames of the animation.
+        :param name: name of the animation in .json file
+        :param count: number of frames
+        :param scale: width & height multipliers
+        :return: animation clip
+        """
+        frames = baked_frames.get_frames(self.__filename, name, count, scale)
+        if frames is None:  # not baked or sprite sheet changed after baking
+            frames = self.make_frames(name, count, scale)
+        right, left = frames
+        right_masks = tuple(pg.mask.from_surface(img) for img in right)
+        left_masks = tuple(pg.mask.from_surface(img) for img in left)
+        return AnimationClip(right, left, right_masks, left_masks)
+
+    def make_frames(self, name: str, count: int, scale: tuple = None) -> tuple:
+        """
+        Parse, scale & flip all frames of the animation.
+        :param name: name of the animation in .json file
+        :param count: number of frames
+        :param scale: width & height multipliers (optional)
+        :return: right & left frames
+        """
+        right = [self.parse_sprite('{}_{}.png'.format(name, i)) for i in range(count)]
+        if scale is not None:
+            right = [pg.transform.scale(img, (int(img.get_width() * scale[0]), int(img.get_height() * scale[1])))
+                     for img in right]
+        right = tuple(right)
+        left = tuple(pg.transform.flip(img, True, False) for img in right)
+        return right, left
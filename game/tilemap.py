@@ -1,55 +1,240 @@
 from . import pg
-from .config import WIDTH, HEIGHT
+from .config import WIDTH, HEIGHT, COMPILE_LEVELS, MERGE_OBSTACLES, OBSTACLE_LAYERS, SOLID_MAP_LAYERS
+from .assets import load_image, AssetCache
+from .pack import open_asset
+from .levelfile import CompiledLevel, load_level, write_level, get_tile_layers, get_spawn_objects, make_layer_view
+from .meshing import merge_obstacles
+from .solidmap import SolidMap
+from os.path import join, dirname, normpath, relpath
+from xml.etree import ElementTree
+from pytmx.util_pygame import handle_transformation, smart_convert
 import pytmx
 
 
+class TilesetRegistry:
+    """
+    Tiles of all tilesets, shared by all maps.
+    Each tileset image is loaded once per process and a tile is made only the first time a map uses it
+    (pytmx asks only for the GIDs which are in the map's layers).
+    """
+
+    def __init__(self):
+        """
+        Initialize tileset registry.
+        """
+        self.__tilesets = {}  # (image file, colorkey, pixelalpha) -> {(rect, flags): tile}
+        self.__requests = 0  # tiles asked for by all loaded maps
+
+    def get_loader(self, filename: str, colorkey=None, pixelalpha: bool = True):
+        """
+        Get the function which gives the tiles of a tileset image.
+        :param filename: tileset image file
+        :param colorkey: transparent color (optional)
+        :param pixelalpha: True if the tiles have per-pixel alpha
+        :return: function which gives a tile for its rect & flags
+        """
+        filename = normpath(filename)
+        key = (filename, tuple(colorkey) if colorkey else None, pixelalpha)
+        tiles = self.__tilesets.setdefault(key, {})
+
+        def load_tile(rect: tuple = None, flags=None) -> pg.Surface:
+            self.__requests += 1
+            try:
+                return tiles[rect, flags]
+            except KeyError:
+                image = load_image(filename, convert=None)
+                tile = image.subsurface(rect) if rect else image.copy()
+                if flags:
+                    tile = handle_transformation(tile, flags)
+                tile = tiles[rect, flags] = smart_convert(tile, colorkey, pixelalpha)
+                return tile
+
+        return load_tile
+
+    def get_stats(self) -> dict:
+        """
+        Get tileset statistics.
+        :return: number of tilesets, resident tiles, tiles asked for by the maps & bytes used by the tiles
+        """
+        tiles = [tile for tileset in self.__tilesets.values() for tile in tileset.values()]
+        return {'tilesets': len(self.__tilesets), 'tiles': len(tiles), 'requests': self.__requests,
+                'bytes': sum(AssetCache.size_of(tile) for tile in tiles)}
+
+    def clear(self) -> None:
+        """
+        Remove all tiles.
+        """
+        self.__tilesets.clear()
+        self.__requests = 0
+
+
+# shared (process-wide) tileset registry
+tileset_registry = TilesetRegistry()
+
+
+def image_loader(filename: str, colorkey, **kwargs):
+    """
+    pytmx image loader which gives the tiles from the tileset registry (the image is loaded through the asset cache).
+    :param filename: image file
+    :param colorkey: colorkey from Tiled (optional)
+    :return: function which makes the tile images
+    """
+    if colorkey:
+        colorkey = pg.Color('#{0}'.format(colorkey))
+    return tileset_registry.get_loader(filename, colorkey, kwargs.get('pixelalpha', True))
+
+
+def load_tmx(filename: str) -> pytmx.TiledMap:
+    """
+    Load .tmx map (from the asset pack if it's packed).
+    External tilesets (.tsx) are read the same way and put into the map, because pytmx can read them only from disk.
+    Paths of the map, tileset & tileset image files are kept in the map's sources (used by the level compiler).
+    :param filename: .tmx (map) file
+    :return: pytmx map
+    """
+    with open_asset(filename) as f:
+        root = ElementTree.parse(f).getroot()
+    sources = [filename]
+
+    for tileset in root.findall('tileset'):
+        source = tileset.attrib.pop('source', None)
+        if source is None:
+            continue
+        tsx_filename = normpath(join(dirname(filename), source))
+        sources.append(tsx_filename)
+        with open_asset(tsx_filename) as f:
+            tsx = ElementTree.parse(f).getroot()
+        # image paths in the tileset are relative to the .tsx file, make them relative to the map
+        for image in tsx.iter('image'):
+            image.set('source', relpath(join(dirname(tsx_filename), image.get('source')), dirname(filename)))
+        firstgid = tileset.get('firstgid')
+        tileset.attrib.update(tsx.attrib)
+        tileset.set('firstgid', firstgid)
+        tileset.extend(list(tsx))
+
+    for image in root.iter('image'):
+        sources.append(normpath(join(dirname(filename), image.get('source'))))
+
+    tiled_map = pytmx.TiledMap(image_loader=image_loader)
+    tiled_map.filename = filename  # paths in the map are relative to it
+    tiled_map.sources = sources
+    tiled_map.parse_xml(root)
+    return tiled_map
+
+
+def render_map(tiled_map: pytmx.TiledMap) -> pg.Surface:
+    """
+    Draw all the tiles of the map onto a new surface.
+    :param tiled_map: pytmx map
+    :return: map image
+    """
+    surface = pg.Surface((tiled_map.width * tiled_map.tilewidth, tiled_map.height * tiled_map.tileheight))
+    # visible_layers - if checked as visible in tiled
+    for layer in tiled_map.visible_layers:
+        # if layer is of TiledTileLayer type
+        if isinstance(layer, pytmx.TiledTileLayer):
+            for x, y, gid in layer:
+                # find the image that goes with the number (tile)
+                tile = tiled_map.get_tile_image_by_gid(gid)
+                # if there is a tile (image) with that ID, draw it on screen
+                if tile:
+                    surface.blit(tile, (x * tiled_map.tilewidth, y * tiled_map.tileheight))
+    return surface
+
+
 class TiledMap:
     """
     Map made with Tiled map editor.
+    Loaded from the compiled level if it's up to date, otherwise from the .tmx file (and compiled for next time).
     """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, level: CompiledLevel = None):
         """
         Initialize tiled map.
         The map dimensions are 26x26 tiles.
         Each tile is 64x64 px.
         :param filename: .tmx (map) file
+        :param level: compiled level of the map if it's already loaded
         """
+        self.filename = filename
+        self.__tmx_data = None
+        self.__image = None  # map rendered when the map was loaded from the .tmx file
 
-        tiled_map = pytmx.load_pygame(filename, pixelalpha=True)
+        self.__level = level if level is not None else load_level(filename)
+        if self.__level is not None:
+            self.width = self.__level.width
+            self.height = self.__level.height
+            self.layers = self.__level.layers
+            self.objects = self.__level.objects
+            self.obstacles = self.__level.obstacles
+            return
 
         # map width & height
+        tiled_map = self.tmx_data
         self.width = tiled_map.width * tiled_map.tilewidth
         self.height = tiled_map.height * tiled_map.tileheight
 
-        # hold all this stuff so we can refer to it
-        self.tmx_data = tiled_map
+        # tile layers (Tiled GIDs), objects & merged obstacles - same as in the compiled level
+        self.layers = {name: make_layer_view(gids, tiled_map.width, tiled_map.height)
+                       for name, visible, gids in get_tile_layers(tiled_map)}
+        self.objects = get_spawn_objects(tiled_map)
+        self.obstacles = merge_obstacles(self.objects)
+
+        self.__image = render_map(tiled_map)
+        if COMPILE_LEVELS:
+            try:
+                write_level(filename, tiled_map, self.__image, self.obstacles)
+            except OSError as e:
+                print(f"Warning: Could not compile level {filename}: {e}")
+
+    @property
+    def tmx_data(self) -> pytmx.TiledMap:
+        """
+        Get pytmx map (the .tmx file is loaded the first time it's needed).
+        :return: pytmx map
+        """
+        if self.__tmx_data is None:
+            self.__tmx_data = load_tmx(self.filename)
+        return self.__tmx_data
 
-    def __render(self, surface: pg.Surface):
+    def is_compiled(self) -> bool:
         """
-        Draw all the tiles of the map onto the surface.
-        :param surface: pygame surface
+        Check if the map was loaded from the compiled level.
+        :return: True if compiled
         """
-        # visible_layers - if checked as visible in tiled
-        for layer in self.tmx_data.visible_layers:
-            # if layer is of TiledTileLayer type
-            if isinstance(layer, pytmx.TiledTileLayer):
-                for x, y, gid in layer:
-                    # find the image that goes with the number (tile)
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    # if there is a tile (image) with that ID, draw it on screen
-                    if tile:
-                        surface.blit(tile, (x * self.tmx_data.tilewidth, y * self.tmx_data.tileheight))
+        return self.__level is not None
 
     def make_map(self) -> pg.Surface:
         """
-        Create a surface to draw the map onto.
+        Create a surface with the map drawn onto it.
         :return: temp_surface (pg.Surface)
         """
-        temp_surface = pg.Surface((self.width, self.height))
-        self.__render(temp_surface)
+        if self.__image is not None:
+            temp_surface, self.__image = self.__image, None
+        elif self.__level is not None:
+            temp_surface = self.__level.make_image()
+        else:
+            temp_surface = render_map(self.tmx_data)
         return temp_surface
 
+    def get_obstacles(self) -> tuple:
+        """
+        Get the obstacles to spawn - merged when the level was compiled or as placed in Tiled (config.MERGE_OBSTACLES).
+        :return: obstacles (spawn objects)
+        """
+        if MERGE_OBSTACLES:
+            return self.obstacles
+        return tuple(tile_object for tile_object in self.objects if tile_object.name == 'obstacle')
+
+    def make_solid_map(self) -> SolidMap:
+        """
+        Draw the solid map of the obstacles (the same rects as the obstacle sprites have).
+        :return: solid map
+        """
+        rects = [pg.Rect(obstacle.x, obstacle.y, obstacle.width, obstacle.height) for obstacle in self.get_obstacles()
+                 if OBSTACLE_LAYERS.get(obstacle.type, 0) & SOLID_MAP_LAYERS]
+        return SolidMap(rects, (self.width, self.height))
+
 
 class Camera:
     """
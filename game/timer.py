@@ -41,13 +41,20 @@ class GameTimer:
         """
         self.__timer_seconds = seconds
 
+    def get_seconds(self) -> int:
+        """
+        Get the seconds left.
+        :return: timer seconds
+        """
+        return self.__timer_seconds
+
     def countdown(self) -> None:
         """
         Count down to 0.
         When the timer reaches 0, the game is over.
-        If the game is paused or over, don't count down.
+        If the game is paused, over or the level is loading, don't count down.
         """
-        if not self.__game.paused and not self.__game.game_over:
+        if not self.__game.paused and not self.__game.game_over and not self.__game.loading:
             if self.__timer_seconds > 0:
                 self.__timer_seconds -= 1
             else:
@@ -63,7 +70,7 @@ class GameTimer:
                 pg.time.set_timer(self.__game.timer, 0)
 
                 # game is over
-                self.__game.game_over = True
+                self.__game.set_game_over()
 
     def add_seconds(self) -> None:
         """
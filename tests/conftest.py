@@ -0,0 +1,51 @@
+"""
+Test fixtures.
+The game runs without a window or sound device (SDL dummy drivers) & with a copy of the settings file.
+"""
+
+import os
+import shutil
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+
+@pytest.fixture(scope='session')
+def display():
+    """
+    Hidden window (surfaces can be converted to the display format).
+    """
+    import pygame as pg
+
+    pg.display.init()
+    if pg.display.get_surface() is None:
+        pg.display.set_mode((1, 1), pg.HIDDEN)
+
+
+@pytest.fixture(scope='session')
+def game(tmp_path_factory):
+    """
+    Game with level 1 loaded (the main loop doesn't run, tests call its steps).
+    High scores & settings are written to a copy of the settings file.
+    """
+    from game import menu
+    from game.config import SETTINGS_FILE
+
+    settings = tmp_path_factory.mktemp('settings') / 'settings.json'
+    if os.path.isfile(SETTINGS_FILE):
+        shutil.copy(SETTINGS_FILE, settings)
+    menu.SETTINGS_FILE = str(settings)
+
+    from game import game
+    from game.timer import GameTimer
+
+    game.game_timer = GameTimer(game)
+    game.playing = True
+    game.delta_time = 1
+    game.level = 1
+    for _ in game._Game__load_level(1):
+        pass
+    return game
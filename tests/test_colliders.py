@@ -0,0 +1,76 @@
+import random
+
+import pygame as pg
+import pytest
+
+from game.colliders import Circle, Capsule, AABB, circle_circle, circle_box, capsule_circle, capsule_box, mask_box, \
+    get_mask_bounds
+
+
+def get_box_points(box: AABB) -> list:
+    return [(x, y) for x in range(box.left, box.right + 1) for y in range(box.top, box.bottom + 1)]
+
+
+def make_box(rng: random.Random) -> AABB:
+    return AABB(rng.randint(0, 40), rng.randint(0, 40), rng.randint(0, 20), rng.randint(0, 20))
+
+
+def test_circle_box():
+    rng = random.Random(1)
+    for _ in range(500):
+        box = make_box(rng)
+        circle = Circle(rng.randint(-10, 70), rng.randint(-10, 70), rng.randint(0, 20))
+        # with integer coordinates the closest point of the box is an integer point
+        closest = min((x - circle.x) ** 2 + (y - circle.y) ** 2 for x, y in get_box_points(box))
+        assert circle_box(circle, box) == (closest <= circle.radius ** 2)
+
+
+def test_circle_circle():
+    assert circle_circle(Circle(0, 0, 5), Circle(10, 0, 5))
+    assert not circle_circle(Circle(0, 0, 5), Circle(10.1, 0, 5))
+    assert not circle_circle(Circle(0, 0, 5), Circle(10, 0, 5), 0.9)
+
+
+def test_capsule_circle():
+    capsule = Capsule(0, 0, 100, 0, 5)
+    assert capsule_circle(capsule, Circle(50, 10, 5))
+    assert capsule_circle(capsule, Circle(-7, 0, 2))
+    assert not capsule_circle(capsule, Circle(50, 10.5, 5))
+    assert not capsule_circle(capsule, Circle(-7.5, 0, 2))
+
+
+def test_capsule_box():
+    rng = random.Random(2)
+    for _ in range(300):
+        box = make_box(rng)
+        capsule = Capsule(rng.randint(-20, 80), rng.randint(-20, 80), rng.randint(-20, 80), rng.randint(-20, 80),
+                          rng.randint(1, 10))
+        # distance of the segment (sampled finely) from the box, far from the radius (sampling is not exact)
+        steps = 400
+        distance = min(
+            max(box.left - x, 0, x - box.right) ** 2 + max(box.top - y, 0, y - box.bottom) ** 2
+            for x, y in ((capsule.x1 + (capsule.x2 - capsule.x1) * step / steps,
+                          capsule.y1 + (capsule.y2 - capsule.y1) * step / steps) for step in range(steps + 1))) ** 0.5
+        if abs(distance - capsule.radius) > 0.5:
+            assert capsule_box(capsule, box) == (distance < capsule.radius)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_mask_box(seed):
+    rng = random.Random(seed)
+    mask = pg.Mask((30, 20))
+    for _ in range(40):
+        mask.set_at((rng.randrange(30), rng.randrange(20)))
+    bits = {(x + 5, y + 7) for x in range(30) for y in range(20) if mask.get_at((x, y))}
+    for _ in range(300):
+        box = make_box(rng)
+        expected = any(box.collidepoint(point) for point in bits)
+        assert mask_box(mask, (5, 7), box) == expected
+
+
+def test_mask_bounds():
+    mask = pg.Mask((30, 20))
+    assert get_mask_bounds(mask) == (0, 0, 0, 0)
+    mask.set_at((3, 4))
+    mask.set_at((20, 15))
+    assert get_mask_bounds(mask) == (3, 4, 18, 12)
@@ -0,0 +1,82 @@
+import random
+
+import pygame as pg
+import pytest
+
+from game.collision import SpatialHash, SweepAndPrune, ALL_LAYERS
+
+LAYERS = (1, 2, 4)
+HITS = {1: 2 | 4, 4: 2}  # layer -> layers it hits
+
+
+class Sprite(pg.sprite.Sprite):
+    def __init__(self, rect, layer: int):
+        super().__init__()
+        self.rect = pg.Rect(rect)
+        self.collision_layer = layer
+
+
+def make_sprite(rect, layer: int) -> Sprite:
+    return Sprite(rect, layer)
+
+
+def make_random_rect(rng: random.Random, size: int = 200) -> pg.Rect:
+    return pg.Rect(rng.randint(-300, 1000), rng.randint(-300, 1000), rng.randint(0, size), rng.randint(0, size))
+
+
+@pytest.mark.parametrize('cell_size', (16, 64, 128))
+def test_spatial_hash_matches_brute_force(cell_size):
+    rng = random.Random(cell_size)
+    sprites = [make_sprite(make_random_rect(rng), rng.choice(LAYERS)) for _ in range(300)]
+    grid = SpatialHash(sprites, cell_size)
+    assert len(grid) == len(sprites)
+
+    for _ in range(500):
+        rect = make_random_rect(rng, 400)
+        layers = rng.choice((ALL_LAYERS, 1, 2, 5, 6))
+        expected = [sprite for sprite in sprites if sprite.collision_layer & layers and rect.colliderect(sprite.rect)]
+        assert grid.query(rect, layers) == expected
+
+
+def test_spatial_hash_collide():
+    ground = make_sprite((0, 100, 500, 20), 1)
+    wall = make_sprite((200, 0, 20, 100), 2)
+    grid = SpatialHash([ground, wall], 64)
+    player = make_sprite((190, 60, 30, 50), 4)
+    assert grid.collide(player) == [ground, wall]
+    assert grid.collide(player, 2) == [wall]
+    assert grid.collide(make_sprite((0, 0, 50, 50), 4)) == []
+
+
+def get_pairs(sprites: list) -> set:
+    return {(sprite, other) for sprite in sprites for other in sprites
+            if HITS.get(sprite.collision_layer, 0) & other.collision_layer and sprite.rect.colliderect(other.rect)}
+
+
+def test_sweep_and_prune_matches_brute_force():
+    rng = random.Random(1)
+    sprites = [make_sprite(make_random_rect(rng, 60).inflate(1, 1), rng.choice(LAYERS)) for _ in range(200)]
+    broad_phase = SweepAndPrune(HITS)
+
+    for frame in range(30):
+        # sprites move a bit, some are removed & some are added
+        for sprite in sprites:
+            sprite.rect.move_ip(rng.randint(-8, 8), rng.randint(-8, 8))
+        if frame % 5 == 4:
+            del sprites[:10]
+            sprites += [make_sprite(make_random_rect(rng, 60).inflate(1, 1), rng.choice(LAYERS)) for _ in range(15)]
+
+        broad_phase.update(sprites)
+        assert len(broad_phase) == len(sprites)
+        pairs = broad_phase.get_pairs()
+        assert len(pairs) == len(set(pairs))
+        assert set(pairs) == get_pairs(sprites)
+
+
+def test_sweep_and_prune_uses_mask_bounds():
+    sprite = make_sprite((0, 0, 10, 10), 1)
+    sprite.mask = pg.mask.Mask((40, 10))  # animated sprites can have masks bigger than their rect
+    other = make_sprite((30, 0, 10, 10), 2)
+    broad_phase = SweepAndPrune(HITS)
+    broad_phase.update([sprite, other])
+    assert broad_phase.get_pairs() == [(sprite, other)]
@@ -0,0 +1,81 @@
+import os
+import shutil
+
+import pytest
+
+from game import levelfile
+from game.config import MAP_DIR, SPRITE_SHEET_DIR
+from game.levelfile import load_level, write_level, get_level_file, get_spawn_objects, get_tile_layers
+
+
+@pytest.fixture
+def map_file(tmp_path) -> str:
+    """
+    Copy of a map with its tileset & tileset image (they can be changed).
+    """
+    (tmp_path / 'map').mkdir()
+    (tmp_path / 'spritesheet').mkdir()
+    shutil.copy(os.path.join(MAP_DIR, 'map_1.tmx'), tmp_path / 'map')
+    shutil.copy(os.path.join(MAP_DIR, 'tileset.tsx'), tmp_path / 'map')
+    shutil.copy(os.path.join(SPRITE_SHEET_DIR, 'tileset.png'), tmp_path / 'spritesheet')
+    return str(tmp_path / 'map' / 'map_1.tmx')
+
+
+@pytest.fixture
+def compiled(display, map_file, tmp_path) -> str:
+    """
+    Compile the map.
+    :return: compiled levels directory
+    """
+    from game.meshing import merge_obstacles
+    from game.tilemap import load_tmx, render_map
+
+    directory = str(tmp_path / 'levels')
+    tiled_map = load_tmx(map_file)
+    write_level(map_file, tiled_map, render_map(tiled_map), merge_obstacles(get_spawn_objects(tiled_map)), directory)
+    return directory
+
+
+def change(path: str) -> None:
+    with open(path, 'ab') as f:
+        f.write(b' ')
+
+
+def test_compiled_level_matches_map(map_file, compiled):
+    from game.tilemap import load_tmx
+
+    tiled_map = load_tmx(map_file)
+    level = load_level(map_file, compiled)
+    assert level is not None
+    assert (level.width, level.height) == (tiled_map.width * tiled_map.tilewidth,
+                                           tiled_map.height * tiled_map.tileheight)
+    assert level.objects == get_spawn_objects(tiled_map)
+    for name, visible, gids in get_tile_layers(tiled_map):
+        assert [gid for row in level.layers[name].tolist() for gid in row] == gids.tolist()
+        assert (name in level.visible_layers) == visible
+    assert level.make_image().get_size() == (level.width, level.height)
+
+
+def test_touched_sources_are_hashed(map_file, compiled):
+    for path in (map_file, os.path.join(os.path.dirname(map_file), 'tileset.tsx')):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))  # same content
+    assert load_level(map_file, compiled) is not None
+
+
+@pytest.mark.parametrize('source', ('map/map_1.tmx', 'map/tileset.tsx', 'spritesheet/tileset.png'))
+def test_changed_source_invalidates(map_file, compiled, tmp_path, source):
+    change(str(tmp_path / source))
+    assert load_level(map_file, compiled) is None
+
+
+def test_other_version_invalidates(map_file, compiled, monkeypatch):
+    monkeypatch.setattr(levelfile, 'LEVEL_VERSION', levelfile.LEVEL_VERSION + 1)
+    assert load_level(map_file, compiled) is None
+
+
+def test_broken_level_file(map_file, compiled):
+    assert load_level(map_file, compiled + '-missing') is None
+    with open(get_level_file(map_file, compiled), 'r+b') as f:
+        f.truncate(100)
+    assert load_level(map_file, compiled) is None
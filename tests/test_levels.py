@@ -0,0 +1,62 @@
+import pytest
+
+from game.assets import AssetCache
+from game.levels import LevelManager
+
+
+@pytest.fixture(scope='module')
+def level_size(display) -> int:
+    levels = LevelManager()
+    prepared = levels.prepare(1)
+    return AssetCache.size_of((prepared.image, prepared.solid_map))
+
+
+def test_least_recently_used_level_is_evicted(display):
+    levels = LevelManager(cache_size=2)
+    first = levels.prepare(1)
+    levels.prepare(2)
+    assert levels.prepare(1) is first  # cached, now the most recently used
+    levels.prepare(3)
+    assert levels.get_stats()['levels'] == [1, 3]
+    assert levels.prepare(1) is first
+
+
+def test_snapshots_are_evicted_with_their_level(display):
+    levels = LevelManager(cache_size=2)
+    levels.save_snapshot(1, ['sprite'])  # not prepared, not kept
+    assert levels.get_snapshot(1) is None
+
+    levels.prepare(1)
+    levels.save_snapshot(1, ['sprite'])
+    levels.prepare(2)
+    assert levels.get_snapshot(1) == ['sprite']  # level 1 becomes the most recently used
+    levels.prepare(3)
+    assert levels.get_stats() == {'levels': [1, 3], 'snapshots': {1: 1}, 'bytes': levels.get_memory()}
+
+    levels.prepare(2)
+    assert levels.get_snapshot(1) is None
+
+
+def test_memory_limit(display, level_size):
+    levels = LevelManager(cache_size=3, memory_limit=level_size * 2)
+    for level in (1, 2, 3):
+        levels.prepare(level)
+        assert levels.get_memory() <= level_size * 2
+    assert levels.get_stats()['levels'][-1] == 3
+
+
+def test_level_being_loaded_is_kept(display):
+    levels = LevelManager(memory_limit=0)
+    for level in (1, 2):
+        levels.prepare(level)
+        assert levels.get_stats()['levels'] == [level]
+
+
+def test_preloaded_level(display):
+    levels = LevelManager()
+    levels.preload(2)
+    prepared = levels.prepare(2)
+    assert not levels.is_pending(2)
+    assert prepared.image.get_size() == prepared.solid_map.get_size()
+    levels.clear()
+    assert levels.get_stats() == {'levels': [], 'snapshots': {}, 'bytes': 0}
@@ -0,0 +1,69 @@
+import random
+
+import numpy as np
+import pytest
+
+from game.levelfile import SpawnObject
+from game.meshing import merge_rects, merge_obstacles
+
+
+def paint(rects, size: tuple) -> np.ndarray:
+    pixels = np.zeros(size[::-1], dtype=np.int32)  # times each pixel is covered
+    for x, y, width, height in rects:
+        pixels[max(y, 0):max(y + height, 0), max(x, 0):max(x + width, 0)] += 1
+    return pixels
+
+
+def check_merged(rects: list, merged: list, size: tuple) -> None:
+    assert (paint(merged, size) == (paint(rects, size) > 0)).all()  # same pixels, covered once
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_rects(seed):
+    rng = random.Random(seed)
+    rects = [(rng.randrange(300), rng.randrange(300), rng.randrange(100), rng.randrange(100)) for _ in range(40)]
+    check_merged(rects, merge_rects(rects), (400, 400))
+
+
+@pytest.mark.parametrize('share', (0.3, 0.6, 1))
+def test_tiles(share):
+    rng = random.Random(share)
+    rects = [(column * 16, row * 16, 16, 16) for row in range(20) for column in range(20) if rng.random() < share]
+    merged = merge_rects(rects)
+    check_merged(rects, merged, (320, 320))
+    assert len(merged) <= len(rects)
+    if share == 1:
+        assert merged == [(0, 0, 320, 320)]
+
+
+def test_empty_rects():
+    assert merge_rects([]) == []
+    assert merge_rects([(10, 10, 0, 5), (0, 0, 5, 0)]) == []
+
+
+def test_obstacle_types_are_merged_separately():
+    objects = [SpawnObject('obstacle', 'ground', 0, 0, 32, 32, 0, {}),
+               SpawnObject('obstacle', 'ground', 32, 0, 32, 32, 0, {}),
+               SpawnObject('obstacle', 'wall', 64, 0, 32, 32, 0, {}),
+               SpawnObject('zombie', '', 0, 0, 32, 32, 0, {})]
+    merged = merge_obstacles(objects)
+    assert sorted((obstacle.type, obstacle.x, obstacle.y, obstacle.width, obstacle.height) for obstacle in merged) == \
+        [('ground', 0, 0, 64, 32), ('wall', 64, 0, 32, 32)]
+    assert all(obstacle.name == 'obstacle' for obstacle in merged)
+
+
+@pytest.mark.parametrize('level', (1, 2, 3))
+def test_levels(display, level):
+    from game.config import LEVELS
+    from game.levelfile import get_spawn_objects
+    from game.tilemap import load_tmx
+
+    tiled_map = load_tmx(LEVELS[level - 1]['map'])
+    objects = get_spawn_objects(tiled_map)
+    merged = merge_obstacles(objects)
+    for obstacle_type in {tile_object.type for tile_object in objects if tile_object.name == 'obstacle'}:
+        rects = [(int(tile_object.x), int(tile_object.y), int(tile_object.width), int(tile_object.height))
+                 for tile_object in objects if tile_object.name == 'obstacle' and tile_object.type == obstacle_type]
+        size = (max(rect[0] + rect[2] for rect in rects), max(rect[1] + rect[3] for rect in rects))
+        check_merged(rects, [(int(obstacle.x), int(obstacle.y), int(obstacle.width), int(obstacle.height))
+                             for obstacle in merged if obstacle.type == obstacle_type], size)
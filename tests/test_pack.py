@@ -0,0 +1,56 @@
+import io
+import os
+
+import pytest
+
+from game import pack
+from game.config import ASSETS_DIR, BAKE_DIR, MAP_DIR
+from game.pack import AssetPack, build
+
+
+@pytest.fixture(scope='module')
+def pack_file(tmp_path_factory) -> str:
+    filename = str(tmp_path_factory.mktemp('pack') / 'assets.pack')
+    build(filename)
+    return filename
+
+
+def get_asset_files() -> list:
+    return [os.path.join(directory, name) for directory, _, names in os.walk(ASSETS_DIR)
+            if not os.path.normpath(directory).startswith(os.path.normpath(BAKE_DIR)) for name in names]
+
+
+def test_packed_assets_match_files(pack_file):
+    asset_pack = AssetPack(pack_file)
+    for path in get_asset_files():
+        with open(path, 'rb') as f, asset_pack.open(path) as packed:
+            assert packed.read() == f.read()
+
+
+def test_pack_file_is_seekable(pack_file):
+    path = os.path.join(MAP_DIR, 'tileset.tsx')
+    with open(path, 'rb') as f:
+        data = f.read()
+    packed = AssetPack(pack_file).open(path)
+    assert packed.read(10) == data[:10]
+    assert packed.seek(-5, io.SEEK_END) == len(data) - 5
+    assert packed.read() == data[-5:]
+    assert packed.read() == b''
+    packed.seek(3)
+    assert packed.tell() == 3
+    assert io.BufferedReader(packed).read() == data[3:]
+
+
+def test_files_which_are_not_packed(pack_file, tmp_path):
+    asset_pack = AssetPack(pack_file)
+    assert asset_pack.open(str(tmp_path / 'outside.png')) is None  # not in the assets directory
+    assert asset_pack.open(os.path.join(ASSETS_DIR, 'missing.png')) is None
+
+
+def test_other_version_is_not_used(pack_file, monkeypatch):
+    monkeypatch.setattr(pack, 'PACK_VERSION', pack.PACK_VERSION + 1)
+    assert AssetPack(pack_file).open(os.path.join(MAP_DIR, 'tileset.tsx')) is None
+
+
+def test_missing_pack(tmp_path):
+    assert AssetPack(str(tmp_path / 'assets.pack')).open(os.path.join(MAP_DIR, 'tileset.tsx')) is None
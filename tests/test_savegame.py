@@ -0,0 +1,96 @@
+import struct
+
+import pytest
+
+from game.config import SAVE_VERSION
+from game.savegame import pack_game, unpack_game, read_game, write_game, apply_game, HEADER, SECTION, DROPS_TAG, \
+    SAVED_SPRITES
+
+
+def get_states(sprites: list) -> list:
+    return [(type(sprite).__name__, sprite.alive(),
+             sprite.get_save_state() if hasattr(sprite, 'get_save_state') else None) for sprite in sprites]
+
+
+def test_empty_game_round_trip():
+    save = unpack_game(pack_game(2, 95, [], []))
+    assert save.level == 2
+    assert save.seconds == 95
+    assert set(save.sections) == {tag for tag, _, _ in SAVED_SPRITES} | {DROPS_TAG}
+    assert not any(save.sections.values())
+
+
+def test_level_round_trip(game):
+    from game.sprites import Zombie, Item
+
+    snapshot = game._Game__snapshot
+    sprites = snapshot.get_sprites()
+    for _ in range(60):
+        game._Game__update()
+    next(sprite for sprite in sprites if type(sprite) is Zombie).hurt(1000)
+    next(sprite for sprite in sprites if type(sprite) is Item).kill()
+    game._Game__update()
+    game.game_timer.set_timer(77)
+
+    data = pack_game(game.level, game.game_timer.get_seconds(), sprites, game.items)
+    saved, items = get_states(sprites), len(game.items)
+
+    for _ in range(60):
+        game._Game__update()
+    for _ in game._Game__load_saved_game(unpack_game(data)):
+        pass
+
+    assert get_states(snapshot.get_sprites()) == saved
+    assert len(game.items) == items
+    assert game.game_timer.get_seconds() == 77
+
+
+def test_truncated():
+    data = pack_game(1, 10, [], [])
+    for size in (HEADER.size + SECTION.size - 1, len(data) - 1):
+        with pytest.raises((ValueError, struct.error)):
+            unpack_game(data[:size])
+
+
+def test_truncated_records():
+    data = bytearray(pack_game(1, 10, [], []))
+    SECTION.pack_into(data, len(data) - SECTION.size, DROPS_TAG, 1)  # a dropped item which isn't there
+    with pytest.raises(ValueError, match='truncated'):
+        unpack_game(bytes(data))
+
+
+def test_other_version():
+    magic, _, level, sections, seconds = HEADER.unpack_from(pack_game(1, 10, [], []))
+    data = HEADER.pack(magic, SAVE_VERSION + 1, level, sections, seconds)
+    with pytest.raises(ValueError, match='version'):
+        unpack_game(data)
+
+
+def test_not_a_save_game():
+    with pytest.raises(ValueError, match='not a save game'):
+        unpack_game(bytes(HEADER.size))
+
+
+def test_save_of_other_level(game):
+    from game.sprites import Zombie
+
+    sprites = game._Game__snapshot.get_sprites()
+    zombie = next(sprite for sprite in sprites if type(sprite) is Zombie)
+    save = unpack_game(pack_game(game.level, 10, [sprite for sprite in sprites if sprite is not zombie], []))
+    saved = get_states(sprites)
+    with pytest.raises(ValueError, match='does not match'):
+        apply_game(save, game, sprites)
+    assert get_states(sprites) == saved
+
+
+def test_read_write(tmp_path):
+    filename = str(tmp_path / 'saves' / 'test.sav')
+    assert read_game(filename) is None
+
+    write_game(filename, pack_game(3, 42, [], []))
+    save = read_game(filename)
+    assert (save.level, save.seconds) == (3, 42)
+
+    with open(filename, 'r+b') as file:
+        file.truncate(HEADER.size - 1)
+    assert read_game(filename) is None
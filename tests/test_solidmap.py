@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+import pygame as pg
+import pytest
+
+from game.solidmap import SolidMap
+
+SIZE = (300, 200)
+
+
+def make_rects(seed: int) -> list:
+    rng = random.Random(seed)
+    # some rects stick out of the map, some are empty
+    return [pg.Rect(rng.randint(-40, 290), rng.randint(-40, 190), rng.randint(0, 60), rng.randint(0, 60))
+            for _ in range(25)]
+
+
+def make_queries(seed: int) -> list:
+    rng = random.Random(seed)
+    return [pg.Rect(rng.randint(-50, 320), rng.randint(-50, 220), rng.randint(0, 40), rng.randint(0, 40))
+            for _ in range(1000)]
+
+
+def is_solid(rects: list, x: int, y: int) -> bool:
+    return 0 <= x < SIZE[0] and 0 <= y < SIZE[1] and any(rect.collidepoint(x, y) for rect in rects)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_collide_rect_matches_rects(seed):
+    rects = make_rects(seed)
+    solid_map = SolidMap(rects, SIZE)
+    area = pg.Rect((0, 0), SIZE)
+    queries = make_queries(seed)
+
+    # pixels outside the map aren't solid
+    expected = [query.clip(area).collidelist([rect.clip(area) for rect in rects]) != -1 for query in queries]
+    assert [solid_map.collide_rect(query) for query in queries] == expected
+    assert solid_map.collide_rects(queries).tolist() == expected
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_points_and_count(seed):
+    rects = make_rects(seed)
+    solid_map = SolidMap(rects, SIZE)
+    xs, ys = np.meshgrid(np.arange(-5, SIZE[0] + 5), np.arange(-5, SIZE[1] + 5))
+    expected = np.array([[is_solid(rects, x, y) for x, y in zip(row_xs, row_ys)] for row_xs, row_ys in zip(xs, ys)])
+    assert (solid_map.is_solid(xs, ys) == expected).all()
+    assert solid_map.get_solid_count() == expected.sum()
+
+
+def test_scan_columns():
+    rects = make_rects(0)
+    solid_map = SolidMap(rects, SIZE)
+    rng = random.Random(0)
+    for _ in range(300):
+        x, top = rng.randint(-5, SIZE[0] + 5), rng.randint(-5, SIZE[1] + 5)
+        bottom = top + rng.randint(0, 100)
+        expected = next((y for y in range(top, bottom) if is_solid(rects, x, y)), -1)
+        assert solid_map.scan_columns([x], [top], [bottom]).tolist() == [expected]
+
+
+def test_cast_rays():
+    solid_map = SolidMap([pg.Rect(100, 0, 1, 200)], SIZE)
+    hit, positions = solid_map.cast_rays([(0, 50), (0, 50), (150, 10)], [(299, 50), (99, 50), (150, 190)])
+    assert hit.tolist() == [True, False, False]
+    assert positions.tolist() == [[100, 50], [99, 50], [150, 190]]
+
+
+def test_from_sprites():
+    class Obstacle:
+        def __init__(self, rect, layer):
+            self.rect = pg.Rect(rect)
+            self.collision_layer = layer
+
+    solid_map = SolidMap.from_sprites([Obstacle((0, 0, 10, 10), 1), Obstacle((20, 0, 10, 10), 2)], SIZE, 1)
+    assert solid_map.get_solid_count() == 100
+    assert not solid_map.collide_rect(pg.Rect(20, 0, 10, 10))
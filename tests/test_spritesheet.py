@@ -0,0 +1,60 @@
+import os
+import shutil
+
+import pygame as pg
+import pytest
+
+from game.config import BAKE_FORMAT
+from game.images import EXPLOSION_SPRITE_SHEET, ANIMATION_CLIPS
+from game.spritesheet import SpriteSheet, BakedFrames, get_sprite_sheet_files
+
+
+@pytest.fixture(scope='module')
+def baked(display, tmp_path_factory) -> str:
+    """
+    Bake the frames.
+    :return: bake directory
+    """
+    from game.bake import bake
+
+    directory = str(tmp_path_factory.mktemp('cache'))
+    bake(directory)
+    return directory
+
+
+@pytest.fixture
+def sprite_sheet(tmp_path) -> str:
+    """
+    Copy of the explosion sprite sheet (it can be changed; the copies have a new mtime).
+    """
+    for path in get_sprite_sheet_files(EXPLOSION_SPRITE_SHEET):
+        shutil.copy(path, tmp_path)
+    return str(tmp_path / os.path.basename(EXPLOSION_SPRITE_SHEET))
+
+
+def test_baked_frames_match_sprite_sheet(baked):
+    frames = BakedFrames(baked)
+    for filename, clips in ANIMATION_CLIPS.items():
+        sheet = SpriteSheet(filename, filename != EXPLOSION_SPRITE_SHEET)
+        for name, (count, scale) in clips.items():
+            for baked_images, images in zip(frames.get_frames(filename, name, count, scale),
+                                            sheet.make_frames(name, count, scale)):
+                assert [pg.image.tobytes(image, BAKE_FORMAT) for image in baked_images] == \
+                    [pg.image.tobytes(image.convert_alpha(), BAKE_FORMAT) for image in images]
+
+
+def test_unchanged_copy_is_valid(baked, sprite_sheet):
+    assert BakedFrames(baked).is_baked(sprite_sheet)
+
+
+@pytest.mark.parametrize('extension', ('.png', '.json'))
+def test_changed_sprite_sheet_is_not_used(baked, sprite_sheet, extension):
+    with open(os.path.splitext(sprite_sheet)[0] + extension, 'ab') as f:
+        f.write(b' ')
+    frames = BakedFrames(baked)
+    assert not frames.is_baked(sprite_sheet)
+    assert frames.get_frames(sprite_sheet, 'explosion', *ANIMATION_CLIPS[EXPLOSION_SPRITE_SHEET]['explosion']) is None
+
+
+def test_missing_cache(tmp_path):
+    assert not BakedFrames(str(tmp_path)).is_baked(EXPLOSION_SPRITE_SHEET)